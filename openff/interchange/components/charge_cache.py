@@ -0,0 +1,273 @@
+"""Stores for re-using partial charges computed by the OpenFF Toolkit."""
+import abc
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+
+class ChargeCache(abc.ABC):
+    """
+    Base class for stores of partial charges computed by the OpenFF Toolkit.
+
+    Charges are keyed by the canonical, mapped SMILES of a molecule and the name of the
+    method used to compute them, and are stored as a list of floats in units of the
+    elementary charge, in the atom order implied by the mapped SMILES.
+    """
+
+    @abc.abstractmethod
+    def get(self, smiles: str, method: str) -> Optional[List[float]]:
+        """Return the stored charges of a molecule, or None if they are not stored."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def set(self, smiles: str, method: str, charges: List[float]) -> None:
+        """Store the charges of a molecule."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all stored charges."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+
+class InMemoryChargeCache(ChargeCache):
+    """
+    A charge store that lives only as long as the current process.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of molecules to store. When exceeded, the least recently
+        used entries are evicted. If None, the store is unbounded.
+
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled, i.e. when this object is sent to a worker process
+        state = self.__dict__.copy()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, smiles: str, method: str) -> Optional[List[float]]:
+        """Return the stored charges of a molecule, or None if they are not stored."""
+        with self._lock:
+            try:
+                self._data.move_to_end((smiles, method))
+            except KeyError:
+                return None
+            return self._data[(smiles, method)]
+
+    def set(self, smiles: str, method: str, charges: List[float]) -> None:
+        """Store the charges of a molecule."""
+        with self._lock:
+            self._data[(smiles, method)] = [float(charge) for charge in charges]
+            self._data.move_to_end((smiles, method))
+            if self.max_entries is not None:
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all stored charges."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteChargeCache(ChargeCache):
+    """
+    A charge store backed by an SQLite database on disk.
+
+    The database can be shared between processes and persists between sessions. A new
+    connection is opened for each operation so that instances of this class can safely
+    be sent to worker processes.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path to the database file. It is created if it does not exist.
+    max_entries : int, optional
+        The maximum number of molecules to store. When exceeded, the least recently
+        used entries are evicted. If None, the store is unbounded.
+    timeout : float, default=30.0
+        The number of seconds to wait for a lock held by another process.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: Optional[int] = 100_000,
+        timeout: float = 30.0,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS partial_charges ("
+                    "smiles TEXT NOT NULL, "
+                    "method TEXT NOT NULL, "
+                    "charges TEXT NOT NULL, "
+                    "last_used REAL NOT NULL, "
+                    "PRIMARY KEY (smiles, method))"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS last_used_index "
+                    "ON partial_charges (last_used)"
+                )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        # Write-ahead logging lets readers in other processes proceed during writes
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def get(self, smiles: str, method: str) -> Optional[List[float]]:
+        """Return the stored charges of a molecule, or None if they are not stored."""
+        connection = self._connect()
+        try:
+            with connection:
+                row = connection.execute(
+                    "SELECT charges FROM partial_charges WHERE smiles = ? AND method = ?",
+                    (smiles, method),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE partial_charges SET last_used = ? "
+                    "WHERE smiles = ? AND method = ?",
+                    (time.time(), smiles, method),
+                )
+        finally:
+            connection.close()
+
+        return json.loads(row[0])
+
+    def set(self, smiles: str, method: str, charges: List[float]) -> None:
+        """Store the charges of a molecule."""
+        serialized = json.dumps([float(charge) for charge in charges])
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO partial_charges "
+                    "(smiles, method, charges, last_used) VALUES (?, ?, ?, ?)",
+                    (smiles, method, serialized, time.time()),
+                )
+                if self.max_entries is not None:
+                    connection.execute(
+                        "DELETE FROM partial_charges WHERE rowid IN ("
+                        "SELECT rowid FROM partial_charges "
+                        "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+        finally:
+            connection.close()
+
+    def clear(self) -> None:
+        """Remove all stored charges."""
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM partial_charges")
+        finally:
+            connection.close()
+
+    def __len__(self) -> int:
+        connection = self._connect()
+        try:
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM partial_charges"
+            ).fetchone()
+        finally:
+            connection.close()
+
+        return count
+
+
+class _RecordingChargeCache(ChargeCache):
+    """
+    A charge store which records the charges stored through it in another store.
+
+    Used in worker processes, whose changes to a store are lost unless the store is shared
+    between processes, so that the charges they compute can be copied back.
+    """
+
+    def __init__(self, charge_cache: ChargeCache):
+        self.charge_cache = charge_cache
+        self.new_charges: List[Tuple[str, str, List[float]]] = list()
+
+    def get(self, smiles: str, method: str) -> Optional[List[float]]:
+        """Return the stored charges of a molecule, or None if they are not stored."""
+        return self.charge_cache.get(smiles, method)
+
+    def set(self, smiles: str, method: str, charges: List[float]) -> None:
+        """Store the charges of a molecule."""
+        self.charge_cache.set(smiles, method, charges)
+        self.new_charges.append((smiles, method, [float(charge) for charge in charges]))
+
+    def clear(self) -> None:
+        """Remove all stored charges."""
+        self.charge_cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.charge_cache)
+
+
+_CHARGE_CACHE: ChargeCache = InMemoryChargeCache()
+
+
+def get_charge_cache() -> ChargeCache:
+    """Return the store currently used to re-use partial charges."""
+    return _CHARGE_CACHE
+
+
+def set_charge_cache(charge_cache: ChargeCache) -> None:
+    """
+    Set the store used to re-use partial charges.
+
+    Examples
+    --------
+    Persist AM1-BCC charges between sessions in a local database
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange.components.charge_cache import (
+        ...     SQLiteChargeCache,
+        ...     set_charge_cache,
+        ... )
+        >>> set_charge_cache(SQLiteChargeCache("charges.sqlite"))  # doctest: +SKIP
+
+    """
+    global _CHARGE_CACHE
+
+    if not isinstance(charge_cache, ChargeCache):
+        raise TypeError(
+            f"Expected a ChargeCache, found object of type {type(charge_cache)}."
+        )
+
+    _CHARGE_CACHE = charge_cache
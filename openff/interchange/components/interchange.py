@@ -1,13 +1,16 @@
 """An object for storing, manipulating, and converting molecular mechanics data."""
+import logging
+import time
 import warnings
 from copy import deepcopy
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
 import mdtraj as md
 import numpy as np
 from openff.toolkit.topology.topology import Topology
 from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.toolkit.typing.engines.smirnoff.parameters import ParameterHandler
 from openff.utilities.utilities import has_package, requires_package
 from pydantic import Field, validator
 
@@ -15,8 +18,14 @@ from openff.interchange.components.mdtraj import _OFFBioTop
 from openff.interchange.components.potentials import PotentialHandler
 from openff.interchange.components.smirnoff import (
     SMIRNOFF_POTENTIAL_HANDLERS,
+    SMIRNOFFAngleHandler,
     SMIRNOFFBondHandler,
     SMIRNOFFConstraintHandler,
+    SMIRNOFFElectrostaticsHandler,
+    SMIRNOFFImproperTorsionHandler,
+    SMIRNOFFPotentialHandler,
+    SMIRNOFFProperTorsionHandler,
+    SMIRNOFFvdWHandler,
 )
 from openff.interchange.exceptions import (
     InternalInconsistencyError,
@@ -28,15 +37,19 @@ from openff.interchange.exceptions import (
     UnsupportedCombinationError,
     UnsupportedExportError,
 )
-from openff.interchange.models import DefaultModel
+from openff.interchange.models import DefaultModel, VirtualSiteKey
 from openff.interchange.types import ArrayQuantity
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     if has_package("foyer"):
         from foyer.forcefield import Forcefield as FoyerForcefield
     if has_package("nglview"):
         import nglview
 
+logger = logging.getLogger(__name__)
+
 _SUPPORTED_SMIRNOFF_HANDLERS = {
     "Constraints",
     "Bonds",
@@ -50,6 +63,78 @@ _SUPPORTED_SMIRNOFF_HANDLERS = {
     "VirtualSites",
 }
 
+# Handlers which ``from_smirnoff(..., use_arrays=True)`` stores as ``PotentialArrays``
+_ARRAY_BACKED_HANDLERS = (
+    SMIRNOFFBondHandler,
+    SMIRNOFFAngleHandler,
+    SMIRNOFFProperTorsionHandler,
+    SMIRNOFFImproperTorsionHandler,
+    SMIRNOFFvdWHandler,
+)
+
+
+def _create_smirnoff_handler(
+    potential_handler_type: Type[SMIRNOFFPotentialHandler],
+    parameter_handlers: List[ParameterHandler],
+    topology: _OFFBioTop,
+    charge_executor: Optional["Executor"] = None,
+    bonds: Optional[SMIRNOFFBondHandler] = None,
+) -> Tuple[SMIRNOFFPotentialHandler, float]:
+    """Build one potential handler from toolkit data, returning it and the wall time taken."""
+    start = time.perf_counter()
+
+    if potential_handler_type == SMIRNOFFBondHandler:
+        # TODO: Might be simpler to rework the bond handler to be self-contained and
+        #       move back to the constraint handler dealing with the logic (and
+        #       depending on the bond handler)
+        SMIRNOFFBondHandler.check_supported_parameters(parameter_handlers[0])
+        potential_handler = SMIRNOFFBondHandler._from_toolkit(
+            parameter_handler=parameter_handlers[0],
+            topology=topology,
+        )
+    elif potential_handler_type == SMIRNOFFConstraintHandler:
+        potential_handler = SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=parameter_handlers,
+            topology=topology,
+            bonds=bonds,
+        )
+    elif potential_handler_type == SMIRNOFFElectrostaticsHandler:
+        potential_handler = SMIRNOFFElectrostaticsHandler._from_toolkit(
+            parameter_handler=parameter_handlers,
+            topology=topology,
+            executor=charge_executor,
+        )
+    elif len(potential_handler_type.allowed_parameter_handlers()) > 1:
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers,
+            topology=topology,
+        )
+    else:
+        potential_handler_type.check_supported_parameters(parameter_handlers[0])
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers[0],
+            topology=topology,
+        )
+
+    return potential_handler, time.perf_counter() - start
+
+
+def _to_array_backed(potential_handler: PotentialHandler) -> PotentialHandler:
+    """
+    Return an array-backed copy of a handler, or the handler itself if it cannot be.
+
+    Handlers storing virtual sites cannot be stored as arrays.
+    """
+    if any(isinstance(key, VirtualSiteKey) for key in potential_handler.slot_map):
+        return potential_handler
+
+    fields = {
+        name: getattr(potential_handler, name)
+        for name in potential_handler.__fields__
+        if name not in ("slot_map", "potentials")
+    }
+    return potential_handler.from_arrays(potential_handler.to_arrays(), **fields)
+
 
 class Interchange(DefaultModel):
     """
@@ -143,6 +228,9 @@ class Interchange(DefaultModel):
         force_field: ForceField,
         topology: _OFFBioTop,
         box=None,
+        charge_executor: Optional["Executor"] = None,
+        executor: Optional["Executor"] = None,
+        use_arrays: bool = False,
     ) -> "Interchange":
         """
         Create a new object by parameterizing a topology with a SMIRNOFF force field.
@@ -155,6 +243,22 @@ class Interchange(DefaultModel):
             The topology to parameterize.
         box
             The box vectors associated with the interchange.
+        charge_executor
+            An optional ``concurrent.futures`` executor, i.e. a ``ProcessPoolExecutor``,
+            used to assign partial charges to each unique molecule in parallel.
+        executor
+            An optional ``concurrent.futures`` executor, i.e. a ``ThreadPoolExecutor`` or
+            ``ProcessPoolExecutor``, used to build independent potential handlers
+            concurrently. Bonds are always built first, in the calling thread. The time
+            taken to build each handler is logged at the ``INFO`` level.
+        use_arrays
+            If True, bonds, angles, torsions and vdW interactions are stored as
+            ``PotentialArrays`` once built, and only converted back to ``slot_map`` and
+            ``potentials`` dictionaries if and when those are accessed. This reduces the
+            memory used to hold and export large systems with OpenMM, though the
+            dictionaries are still built while parametrizing.
+            Bond order-interpolated potentials are stored as their interpolated
+            parameters.
 
         Examples
         --------
@@ -212,6 +316,8 @@ class Interchange(DefaultModel):
                 "type are currently supported."
             )
 
+        parameter_handlers_by_potential_handler_type = dict()
+
         for potential_handler_type in SMIRNOFF_POTENTIAL_HANDLERS:
 
             parameter_handlers = [
@@ -223,45 +329,101 @@ class Interchange(DefaultModel):
             if len(parameter_handlers) == 0:
                 continue
 
-            # TODO: Might be simpler to rework the bond handler to be self-contained and
-            #       move back to the constraint handler dealing with the logic (and
-            #       depending on the bond handler)
-            if potential_handler_type == SMIRNOFFBondHandler:
-                SMIRNOFFBondHandler.check_supported_parameters(force_field["Bonds"])
-                potential_handler = SMIRNOFFBondHandler._from_toolkit(
-                    parameter_handler=force_field["Bonds"],
-                    topology=topology,
-                    # constraint_handler=constraint_handler,
+            # Bonds alone do not make a constraint handler
+            if potential_handler_type == SMIRNOFFConstraintHandler:
+                if "Constraints" not in force_field.registered_parameter_handlers:
+                    continue
+
+            parameter_handlers_by_potential_handler_type[
+                potential_handler_type
+            ] = parameter_handlers
+
+        potential_handlers = dict()
+        timings = dict()
+
+        if executor is None:
+            for (
+                potential_handler_type,
+                parameter_handlers,
+            ) in parameter_handlers_by_potential_handler_type.items():
+                (
+                    potential_handlers[potential_handler_type],
+                    timings[potential_handler_type],
+                ) = _create_smirnoff_handler(
+                    potential_handler_type,
+                    parameter_handlers,
+                    topology,
+                    charge_executor=charge_executor,
+                    bonds=potential_handlers.get(SMIRNOFFBondHandler),
                 )
-                sys_out.handlers.update({"Bonds": potential_handler})
-            elif potential_handler_type == SMIRNOFFConstraintHandler:
-                bond_handler = force_field._parameter_handlers.get("Bonds", None)
-                constraint_handler = force_field._parameter_handlers.get(
-                    "Constraints", None
+
+        else:
+            # Bonds are built first since bond order-based interpolation in other
+            # handlers depends on the fractional bond orders assigned while building them,
+            # and constraints re-use the bond lengths
+            if SMIRNOFFBondHandler in parameter_handlers_by_potential_handler_type:
+                (
+                    potential_handlers[SMIRNOFFBondHandler],
+                    timings[SMIRNOFFBondHandler],
+                ) = _create_smirnoff_handler(
+                    SMIRNOFFBondHandler,
+                    parameter_handlers_by_potential_handler_type[SMIRNOFFBondHandler],
+                    topology,
                 )
-                if constraint_handler is None:
-                    continue
-                constraints = SMIRNOFFConstraintHandler._from_toolkit(
-                    parameter_handler=[
-                        val
-                        for val in [bond_handler, constraint_handler]
-                        if val is not None
-                    ],
-                    topology=topology,
+
+            futures = {
+                potential_handler_type: executor.submit(
+                    _create_smirnoff_handler,
+                    potential_handler_type,
+                    parameter_handlers,
+                    topology,
+                    bonds=potential_handlers.get(SMIRNOFFBondHandler),
                 )
-                sys_out.handlers.update({"Constraints": constraints})
-                continue
-            elif len(potential_handler_type.allowed_parameter_handlers()) > 1:
-                potential_handler = potential_handler_type._from_toolkit(  # type: ignore
-                    parameter_handler=parameter_handlers,
-                    topology=topology,
+                for (
+                    potential_handler_type,
+                    parameter_handlers,
+                ) in parameter_handlers_by_potential_handler_type.items()
+                if potential_handler_type not in potential_handlers
+                # An executor cannot be sent to a worker, so electrostatics are built
+                # in this thread while other handlers are built by the executor
+                and not (
+                    potential_handler_type == SMIRNOFFElectrostaticsHandler
+                    and charge_executor is not None
                 )
-            else:
-                potential_handler_type.check_supported_parameters(parameter_handlers[0])
-                potential_handler = potential_handler_type._from_toolkit(  # type: ignore
-                    parameter_handler=parameter_handlers[0],
-                    topology=topology,
+            }
+
+            if (
+                SMIRNOFFElectrostaticsHandler
+                in parameter_handlers_by_potential_handler_type
+                and charge_executor is not None
+            ):
+                (
+                    potential_handlers[SMIRNOFFElectrostaticsHandler],
+                    timings[SMIRNOFFElectrostaticsHandler],
+                ) = _create_smirnoff_handler(
+                    SMIRNOFFElectrostaticsHandler,
+                    parameter_handlers_by_potential_handler_type[
+                        SMIRNOFFElectrostaticsHandler
+                    ],
+                    topology,
+                    charge_executor=charge_executor,
                 )
+
+            for potential_handler_type, future in futures.items():
+                (
+                    potential_handlers[potential_handler_type],
+                    timings[potential_handler_type],
+                ) = future.result()
+
+        # Assemble handlers in the same order regardless of the order they were built in
+        for potential_handler_type in parameter_handlers_by_potential_handler_type:
+            potential_handler = potential_handlers[potential_handler_type]
+            if use_arrays and potential_handler_type in _ARRAY_BACKED_HANDLERS:
+                potential_handler = _to_array_backed(potential_handler)
+            logger.info(
+                f"Built {potential_handler.type} handler in "
+                f"{timings[potential_handler_type]:.3f} s"
+            )
             sys_out.handlers.update({potential_handler.type: potential_handler})
 
         # `box` argument is only overriden if passed `None` and the input topology
@@ -551,14 +713,13 @@ class Interchange(DefaultModel):
         Get parameter values of a specific potential.
 
         Here, parameters are expected to be uniquely dfined by the name of
-        its associated handler and a tuple of atom indices.
+        its associated handler and a tuple of atom indices, in either order.
 
         Note: This method only checks for equality of atom indices and will likely fail on complex cases
         involved layered parameters with multiple topology keys sharing identical atom indices.
         """
-        for handler in self.handlers:
-            if handler == handler_name:
-                return self[handler_name]._get_parameters(atom_indices=atom_indices)
+        if handler_name in self.handlers:
+            return self[handler_name]._get_parameters(atom_indices=atom_indices)
         raise MissingParameterHandlerError(
             f"Could not find parameter handler of name {handler_name}"
         )
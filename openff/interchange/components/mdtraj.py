@@ -1,7 +1,9 @@
 """Temporary utilities to use an MDTraj Trajectory with an OpenFF Trajectory."""
 import copy
+from typing import Tuple
 
 import mdtraj as md
+import numpy as np
 from openff.toolkit.topology import Topology
 
 
@@ -106,6 +108,65 @@ def _iterate_pairs(mdtop):
                         yield (atom_i_partner, atom_j_partner)
 
 
+def _get_bonded_pairs(bonds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the pairs of atoms separated by one, two and three bonds.
+
+    Each pair is listed once, with the lower index first, and is assigned to the shortest path
+    between its atoms, i.e. 1-3 pairs do not include 1-2 pairs.
+    """
+    if len(bonds) == 0:
+        empty = np.empty((0, 2), dtype=np.intp)
+        return empty, empty, empty
+
+    # Walks along bonds in both directions, and the bonded neighbors of each atom
+    walks = np.concatenate([bonds, bonds[:, ::-1]])
+    walks = walks[np.argsort(walks[:, 0], kind="stable")]
+    n_atoms = int(bonds.max()) + 1
+    offsets = np.zeros(n_atoms + 1, dtype=np.intp)
+    np.cumsum(np.bincount(walks[:, 0], minlength=n_atoms), out=offsets[1:])
+    neighbors = walks[:, 1]
+
+    # Each pair of atoms, keyed with the number of bonds along a walk between them
+    keys = list()
+
+    for n_bonds in range(1, 4):
+        if n_bonds > 1:
+            # Extend each walk by one bond, without revisiting any atom
+            ends = walks[:, -1]
+            counts = offsets[ends + 1] - offsets[ends]
+            starts = np.repeat(offsets[ends], counts)
+            steps = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts
+            )
+            next_atoms = neighbors[starts + steps]
+            walks = np.column_stack([np.repeat(walks, counts, axis=0), next_atoms])
+            walks = walks[(walks[:, :-1] != walks[:, -1:]).all(axis=1)]
+
+        # Each walk is also found in reverse, so only keep one direction
+        pairs = walks[walks[:, 0] < walks[:, -1]][:, [0, -1]].astype(np.int64)
+        keys.append((pairs[:, 0] * n_atoms + pairs[:, 1]) * 4 + n_bonds)
+
+    # Sorting keys puts the shortest walk between each pair of atoms first
+    sorted_keys = np.sort(np.concatenate(keys))
+    pair_keys = sorted_keys // 4
+    is_shortest = np.ones(len(sorted_keys), dtype=bool)
+    is_shortest[1:] = pair_keys[1:] != pair_keys[:-1]
+
+    pairs_12, pairs_13, pairs_14 = (
+        np.stack(
+            [
+                pair_keys[is_shortest & (sorted_keys % 4 == n_bonds)] // n_atoms,
+                pair_keys[is_shortest & (sorted_keys % 4 == n_bonds)] % n_atoms,
+            ],
+            axis=1,
+        ).astype(np.intp)
+        for n_bonds in range(1, 4)
+    )
+
+    return pairs_12, pairs_13, pairs_14
+
+
 def _get_num_h_bonds(mdtop):
     """Get the number of (covalent) bonds containing a hydrogen atom."""
     n_bonds_containing_hydrogen = 0
@@ -1,8 +1,13 @@
 """Models for storing applied force field parameters."""
 import ast
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+import threading
+import weakref
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 from openff.toolkit.typing.engines.smirnoff.parameters import ParameterHandler
+from openff.units import unit
 from openff.utilities.utilities import has_package, requires_package
 from pydantic import Field, PrivateAttr, validator
 
@@ -22,15 +27,46 @@ else:
     import numpy  # type: ignore[no-redef]
 
 if TYPE_CHECKING:
+    import scipy.sparse
+
     from openff.interchange.components.mdtraj import _OFFBioTop
 
 
+class _FrozenParameters(dict):
+    """A read-only dictionary storing the parameters of an interned potential."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "The parameters of an interned potential are shared and cannot be modified. "
+            "Store a modified copy instead, i.e. "
+            "`handler.potentials[key] = handler.potentials[key].editable_copy()`."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
 class Potential(DefaultModel):
-    """Base class for storing applied parameters."""
+    """
+    Base class for storing applied parameters.
+
+    Potentials returned by ``intern_potential``, including those created from SMIRNOFF force
+    fields, are shared and cannot be modified. ``editable_copy`` returns a copy that can be.
+    """
+
+    # Allows interned potentials to be tracked by weak reference
+    __slots__ = ("__weakref__",)
 
     parameters: Dict[str, FloatQuantity] = dict()
     map_key: Optional[int] = None
 
+    _interned: bool = PrivateAttr(False)
+    _hash: Optional[int] = PrivateAttr(None)
+    _magnitudes: Optional[Tuple] = PrivateAttr(None)
+
     @validator("parameters")
     def validate_parameters(cls, v):
         for key, val in v.items():
@@ -40,9 +76,105 @@ class Potential(DefaultModel):
                 v[key] = FloatQuantity.validate_type(val)
         return v
 
+    def __setattr__(self, name, value):
+        if self._interned:
+            raise TypeError(
+                "Interned potentials are shared and cannot be modified. "
+                "Store a modified copy instead, i.e. "
+                "`handler.potentials[key] = handler.potentials[key].editable_copy()`."
+            )
+        super().__setattr__(name, value)
+
     def __hash__(self):
+        if self._hash is not None:
+            return self._hash
         return hash(tuple(self.parameters.values()))
 
+    def __deepcopy__(self, memo):
+        # Interned potentials are immutable, so copies can share them
+        if self._interned:
+            return self
+        return self.copy(deep=True)
+
+    def editable_copy(self) -> "Potential":
+        """Return a copy of this potential which is not shared, so can be modified."""
+        return self.__class__(parameters=dict(self.parameters), map_key=self.map_key)
+
+    def _get_magnitudes(self) -> Tuple:
+        """Return the magnitudes of the parameters, in the units they are stored in."""
+        if self._magnitudes is not None:
+            return self._magnitudes
+        return tuple(value.m for value in self.parameters.values())
+
+
+class _PotentialPool:
+    """
+    A pool of interned, immutable potentials.
+
+    Potentials are identified by the names, magnitudes and units of their parameters, so
+    that identical parameters share a single object. Potentials are only held as long as
+    they are used elsewhere.
+    """
+
+    def __init__(self):
+        self._potentials: "weakref.WeakValueDictionary[Tuple, Potential]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_pool_key(potential: Potential) -> Optional[Tuple]:
+        # Order and units are part of the key since flattened representations of
+        # parameters, i.e. ``PotentialHandler.get_force_field_parameters``, depend on them
+        pool_key = [potential.map_key]
+        for name, value in potential.parameters.items():
+            if np.ndim(value.m) != 0:
+                # Array-valued parameters are not interned
+                return None
+            pool_key.append((name, float(value.m), str(value.units)))
+        return tuple(pool_key)
+
+    def intern(self, potential: Potential) -> Potential:
+        if not isinstance(potential, Potential) or potential._interned:
+            return potential
+
+        pool_key = self._get_pool_key(potential)
+        if pool_key is None:
+            return potential
+
+        with self._lock:
+            interned = self._potentials.get(pool_key)
+            if interned is None:
+                interned = potential.copy()
+                parameters = _FrozenParameters(potential.parameters)
+                interned.__dict__["parameters"] = parameters
+                interned._hash = hash(tuple(parameters.values()))
+                interned._magnitudes = tuple(value.m for value in parameters.values())
+                interned._interned = True
+                self._potentials[pool_key] = interned
+
+        return interned
+
+    def __len__(self) -> int:
+        return len(self._potentials)
+
+
+_POTENTIAL_POOL = _PotentialPool()
+
+# Handlers whose terms are unchanged by reversing the order of their atoms; improper
+# torsions, for example, have a central atom and are not
+_REVERSIBLE_HANDLER_TYPES = {"Bonds", "Angles", "ProperTorsions", "RBTorsions"}
+
+
+def intern_potential(potential: Potential) -> Potential:
+    """
+    Return a shared, immutable potential with the same parameters as ``potential``.
+
+    Identical parameters, including those in different handlers or Interchange objects,
+    are stored once. Potentials with array-valued parameters are returned unchanged.
+    """
+    return _POTENTIAL_POOL.intern(potential)
+
 
 class WrappedPotential(DefaultModel):
     """Model storing other Potential model(s) inside inner data."""
@@ -53,8 +185,10 @@ class WrappedPotential(DefaultModel):
         data: Dict[Potential, float]
 
     _inner_data: InnerData = PrivateAttr()
+    _parameters: Optional[Dict[str, unit.Quantity]] = PrivateAttr(None)
 
     def __init__(self, data):
+        self._parameters = None
         if isinstance(data, Potential):
             self._inner_data = self.InnerData(data={data: 1.0})
         elif isinstance(data, dict):
@@ -63,24 +197,340 @@ class WrappedPotential(DefaultModel):
     @property
     def parameters(self):
         """Get the parameters as represented by the stored potentials and coefficients."""
-        keys = {
-            pot for pot in self._inner_data.data.keys() for pot in pot.parameters.keys()
-        }
+        if self._parameters is None:
+            potentials = [*self._inner_data.data]
+            coefficients = np.fromiter(
+                self._inner_data.data.values(), dtype=float, count=len(potentials)
+            )
+            keys = dict.fromkeys(
+                key for potential in potentials for key in potential.parameters
+            )
+
+            parameters = dict()
+            for key in keys:
+                units = potentials[0].parameters[key].units
+                magnitudes = np.array(
+                    [potential.parameters[key].m_as(units) for potential in potentials]
+                )
+                parameters[key] = unit.Quantity(coefficients @ magnitudes, units)
+            self._parameters = parameters
 
-        params = dict()
-        for key in keys:
-            sum_ = 0.0
-            for pot, coeff in self._inner_data.data.items():
-                sum_ += coeff * pot.parameters[key]
-            params.update({key: sum_})
-        return params
+        return dict(self._parameters)
 
     def __repr__(self):
         return str(self._inner_data.data)
 
 
+class PotentialArrays:
+    """
+    Columnar storage of the terms and parameters of a potential handler.
+
+    Parameters
+    ----------
+    atom_indices : numpy.ndarray
+        An ``(n_terms, n_atoms_per_term)`` int32 array of the atoms in each term.
+    potential_indices : numpy.ndarray
+        An ``(n_terms,)`` int32 array of the row in ``parameters`` used by each term.
+    parameters : numpy.ndarray
+        An ``(n_potentials, n_parameters)`` float64 array of parameters, in the units
+        given by ``parameter_units``.
+    parameter_names : sequence of str
+        The name of each column of ``parameters``.
+    parameter_units : sequence of openff.units.Unit
+        The units of each column of ``parameters``.
+    potential_keys : sequence of PotentialKey
+        The key of each row of ``parameters``.
+    mults : numpy.ndarray, optional
+        An ``(n_terms,)`` int32 array of the ``mult`` of each term, -1 meaning None.
+    bond_orders : numpy.ndarray, optional
+        An ``(n_terms,)`` float64 array of the ``bond_order`` of each term, NaN meaning
+        None.
+
+    """
+
+    __slots__ = (
+        "atom_indices",
+        "potential_indices",
+        "parameters",
+        "parameter_names",
+        "parameter_units",
+        "potential_keys",
+        "mults",
+        "bond_orders",
+    )
+
+    def __init__(
+        self,
+        atom_indices: np.ndarray,
+        potential_indices: np.ndarray,
+        parameters: np.ndarray,
+        parameter_names: Sequence[str],
+        parameter_units: Sequence[unit.Unit],
+        potential_keys: Sequence[PotentialKey],
+        mults: Optional[np.ndarray] = None,
+        bond_orders: Optional[np.ndarray] = None,
+    ):
+        self.atom_indices = np.asarray(atom_indices, dtype=np.int32)
+        self.potential_indices = np.asarray(potential_indices, dtype=np.int32)
+        self.parameters = np.asarray(parameters, dtype=np.float64)
+        self.parameter_names = tuple(parameter_names)
+        self.parameter_units = tuple(parameter_units)
+        self.potential_keys = list(potential_keys)
+        self.mults = None if mults is None else np.asarray(mults, dtype=np.int32)
+        self.bond_orders = (
+            None if bond_orders is None else np.asarray(bond_orders, dtype=np.float64)
+        )
+
+        if self.potential_indices.shape != (self.n_terms,):
+            raise ValueError(
+                "Expected one potential index per term, found "
+                f"{self.potential_indices.shape[0]} for {self.n_terms} terms."
+            )
+        if self.parameters.shape != (
+            len(self.potential_keys),
+            len(self.parameter_names),
+        ):
+            raise ValueError(
+                f"Expected a parameter array of shape "
+                f"{(len(self.potential_keys), len(self.parameter_names))}, "
+                f"found {self.parameters.shape}."
+            )
+
+    @property
+    def n_terms(self) -> int:
+        """The number of terms, i.e. the number of entries in the slot map."""
+        return self.atom_indices.shape[0]
+
+    def get_parameter(self, name: str, units: Optional[unit.Unit] = None) -> np.ndarray:
+        """
+        Return the values of one parameter of each potential, optionally converted.
+
+        Index the result with ``potential_indices`` to get the value of each term.
+        """
+        column = self.parameter_names.index(name)
+        values = self.parameters[:, column]
+        if units is None:
+            return values
+        return values * (1.0 * self.parameter_units[column]).m_as(units)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        slot_map: Dict[TopologyKey, PotentialKey],
+        potentials: Dict[PotentialKey, Union[Potential, WrappedPotential]],
+    ) -> "PotentialArrays":
+        """
+        Build arrays from a slot map and potentials.
+
+        The units of each parameter are taken from the first potential. Wrapped
+        potentials are stored as their (interpolated) parameters.
+        """
+        if any(isinstance(key, VirtualSiteKey) for key in slot_map):
+            raise NotImplementedError(
+                "Virtual sites cannot be stored in an array-backed handler."
+            )
+
+        potential_keys = list(potentials)
+        potential_indices = {key: index for index, key in enumerate(potential_keys)}
+
+        parameter_names: Tuple[str, ...] = tuple()
+        parameter_units: Tuple[unit.Unit, ...] = tuple()
+        if potential_keys:
+            first = potentials[potential_keys[0]].parameters
+            parameter_names = tuple(first)
+            parameter_units = tuple(first[name].units for name in parameter_names)
+
+        parameters = np.empty((len(potential_keys), len(parameter_names)))
+        for row, potential_key in enumerate(potential_keys):
+            potential_parameters = potentials[potential_key].parameters
+            if set(potential_parameters) != set(parameter_names):
+                raise ValueError(
+                    f"Potential {potential_key} has parameters "
+                    f"{sorted(potential_parameters)}, expected {sorted(parameter_names)}."
+                )
+            for column, (name, units) in enumerate(
+                zip(parameter_names, parameter_units)
+            ):
+                parameters[row, column] = potential_parameters[name].m_as(units)
+
+        n_atoms = {len(key.atom_indices) for key in slot_map}
+        if len(n_atoms) > 1:
+            raise ValueError(
+                "All terms must involve the same number of atoms, "
+                f"found terms with {sorted(n_atoms)} atoms."
+            )
+
+        atom_indices = np.array(
+            [key.atom_indices for key in slot_map], dtype=np.int32
+        ).reshape(len(slot_map), n_atoms.pop() if n_atoms else 0)
+
+        mults = None
+        if any(key.mult is not None for key in slot_map):
+            mults = np.array(
+                [-1 if key.mult is None else key.mult for key in slot_map],
+                dtype=np.int32,
+            )
+
+        bond_orders = None
+        if any(key.bond_order is not None for key in slot_map):
+            bond_orders = np.array(
+                [
+                    np.nan if key.bond_order is None else key.bond_order
+                    for key in slot_map
+                ]
+            )
+
+        return cls(
+            atom_indices=atom_indices,
+            potential_indices=[potential_indices[key] for key in slot_map.values()],
+            parameters=parameters,
+            parameter_names=parameter_names,
+            parameter_units=parameter_units,
+            potential_keys=potential_keys,
+            mults=mults,
+            bond_orders=bond_orders,
+        )
+
+    def to_dicts(
+        self,
+    ) -> Tuple[Dict[TopologyKey, PotentialKey], Dict[PotentialKey, Potential]]:
+        """Build the slot map and potentials described by these arrays."""
+        mults = [None] * self.n_terms if self.mults is None else self.mults.tolist()
+        bond_orders = (
+            [None] * self.n_terms
+            if self.bond_orders is None
+            else self.bond_orders.tolist()
+        )
+
+        slot_map = {
+            TopologyKey(
+                atom_indices=tuple(atom_indices),
+                mult=None if mult == -1 else mult,
+                bond_order=None if bond_order != bond_order else bond_order,
+            ): self.potential_keys[potential_index]
+            for atom_indices, potential_index, mult, bond_order in zip(
+                self.atom_indices.tolist(),
+                self.potential_indices.tolist(),
+                mults,
+                bond_orders,
+            )
+        }
+
+        potentials = {
+            potential_key: Potential(
+                parameters={
+                    name: value * units
+                    for name, value, units in zip(
+                        self.parameter_names, row, self.parameter_units
+                    )
+                }
+            )
+            for potential_key, row in zip(self.potential_keys, self.parameters.tolist())
+        }
+
+        return slot_map, potentials
+
+
+class _VersionedDict(dict):
+    """
+    A dictionary which counts the modifications made to it.
+
+    ``_version`` is incremented on every modification so that data derived from the
+    dictionary can be cached.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._version = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        if key in self:
+            value = dict.__getitem__(self, key)
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._version += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        dict.clear(self)
+        self._version += 1
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class _SlotMap(_VersionedDict):
+    """A slot map which keeps track of the topology keys each potential key is applied to."""
+
+    def __init__(self, *args, **kwargs):
+        self._topology_keys: Dict[
+            PotentialKey, Dict[Union[TopologyKey, VirtualSiteKey], None]
+        ] = dict()
+        super().__init__(*args, **kwargs)
+
+    def _remove(self, topology_key, potential_key) -> None:
+        topology_keys = self._topology_keys[potential_key]
+        del topology_keys[topology_key]
+        if not topology_keys:
+            del self._topology_keys[potential_key]
+
+    def __setitem__(self, topology_key, potential_key):
+        if topology_key in self:
+            self._remove(topology_key, dict.__getitem__(self, topology_key))
+        super().__setitem__(topology_key, potential_key)
+        # Dictionaries with no values are used as ordered sets
+        self._topology_keys.setdefault(potential_key, dict())[topology_key] = None
+
+    def __delitem__(self, topology_key):
+        potential_key = dict.__getitem__(self, topology_key)
+        super().__delitem__(topology_key)
+        self._remove(topology_key, potential_key)
+
+    def popitem(self):
+        topology_key, potential_key = super().popitem()
+        self._remove(topology_key, potential_key)
+        return topology_key, potential_key
+
+    def clear(self):
+        super().clear()
+        self._topology_keys.clear()
+
+
 class PotentialHandler(DefaultModel):
-    """Base class for storing parametrized force field data."""
+    """
+    Base class for storing parametrized force field data.
+
+    Handlers created with ``from_arrays`` store their terms as ``PotentialArrays`` and
+    only build ``slot_map`` and ``potentials`` if and when they are accessed.
+    """
 
     type: str = Field(..., description="The type of potentials this handler stores.")
     expression: str = Field(
@@ -96,6 +546,62 @@ class PotentialHandler(DefaultModel):
         description="A mapping between PotentialKey objects and Potential objects.",
     )
 
+    _arrays: Optional[PotentialArrays] = PrivateAttr(None)
+    _atom_index_map: Optional[
+        Dict[Tuple[int, ...], Union[TopologyKey, VirtualSiteKey]]
+    ] = PrivateAttr(None)
+    _atom_index_map_source: Optional[Tuple[_SlotMap, int]] = PrivateAttr(None)
+    _potential_indices: Optional[Tuple[_SlotMap, int, np.ndarray]] = PrivateAttr(None)
+    _coefficient_cache: Optional[Tuple] = PrivateAttr(None)
+
+    @validator("slot_map", always=True)
+    def _track_slot_map(cls, v):
+        return _SlotMap(v)
+
+    @validator("potentials", always=True)
+    def _track_potentials(cls, v):
+        return _VersionedDict(v)
+
+    @classmethod
+    def from_arrays(cls, arrays: PotentialArrays, **kwargs) -> "PotentialHandler":
+        """Create an array-backed handler, passing other fields as keyword arguments."""
+        handler = cls(**kwargs)
+        handler._arrays = arrays
+        # Removing these fields defers building them to ``__getattr__``
+        del handler.__dict__["slot_map"]
+        del handler.__dict__["potentials"]
+        return handler
+
+    def to_arrays(self) -> PotentialArrays:
+        """Return the terms and parameters of this handler as arrays."""
+        if self._arrays is not None:
+            return self._arrays
+        return PotentialArrays.from_dicts(self.slot_map, self.potentials)
+
+    def _materialize(self) -> None:
+        """Build ``slot_map`` and ``potentials`` from arrays, if they are not yet built."""
+        if self._arrays is None:
+            return
+
+        slot_map, potentials = self._arrays.to_dicts()
+        self.__dict__.setdefault("slot_map", _SlotMap(slot_map))
+        self.__dict__.setdefault("potentials", _VersionedDict(potentials))
+        # From here on the dicts, which may be modified in place, are the source of truth
+        self._arrays = None
+
+    def __getattr__(self, name):
+        if name in ("slot_map", "potentials"):
+            self._materialize()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def _iter(self, *args, **kwargs):
+        # Serialization, comparison and copying all read fields through this method
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
     @property
     def independent_variables(self) -> Set[str]:
         """
@@ -121,84 +627,239 @@ class PotentialHandler(DefaultModel):
         """Populate self.potentials with key-val pairs of [PotentialKey, Potential]."""
         raise NotImplementedError
 
+    def _get_slot_map(self) -> _SlotMap:
+        """Return the slot map, tracking it if it was set without validation."""
+        slot_map = self.slot_map
+        if not isinstance(slot_map, _SlotMap):
+            slot_map = _SlotMap(slot_map)
+            self.__dict__["slot_map"] = slot_map
+        return slot_map
+
+    def _get_potentials(self) -> _VersionedDict:
+        """Return the potentials, tracking them if they were set without validation."""
+        potentials = self.potentials
+        if not isinstance(potentials, _VersionedDict):
+            potentials = _VersionedDict(potentials)
+            self.__dict__["potentials"] = potentials
+        return potentials
+
+    def get_topology_keys(
+        self, potential_key: PotentialKey
+    ) -> List[Union[TopologyKey, VirtualSiteKey]]:
+        """Return the topology keys the potential with this key is applied to."""
+        return [*self._get_slot_map()._topology_keys.get(potential_key, ())]
+
+    def get_potential_counts(self) -> Dict[PotentialKey, int]:
+        """Return the number of topology keys each potential key is applied to."""
+        return {
+            potential_key: len(topology_keys)
+            for potential_key, topology_keys in self._get_slot_map()._topology_keys.items()
+        }
+
+    def split_potential(
+        self,
+        potential_key: PotentialKey,
+        topology_keys: Sequence[Union[TopologyKey, VirtualSiteKey]],
+        new_potential_key: Optional[PotentialKey] = None,
+    ) -> PotentialKey:
+        """
+        Apply a copy of a potential, stored under a new key, to some of its topology keys.
+
+        The potential can then be modified without affecting the other topology keys it is
+        applied to. If not given, the new key is made unique by adding a suffix to the id.
+        """
+        slot_map = self._get_slot_map()
+        for topology_key in topology_keys:
+            if slot_map.get(topology_key) != potential_key:
+                raise ValueError(
+                    f"Potential {potential_key} is not applied to {topology_key}."
+                )
+
+        if new_potential_key is None:
+            index = 1
+            while True:
+                new_potential_key = PotentialKey(
+                    id=f"{potential_key.id}_{index}",
+                    mult=potential_key.mult,
+                    associated_handler=potential_key.associated_handler,
+                    bond_order=potential_key.bond_order,
+                )
+                if new_potential_key not in self.potentials:
+                    break
+                index += 1
+        elif new_potential_key in self.potentials:
+            raise ValueError(f"Potential key {new_potential_key} is already in use.")
+
+        potential = self.potentials[potential_key]
+        if isinstance(potential, Potential):
+            # Interned potentials are shared and deep copies of them are not, so a
+            # copy which is not interned is stored
+            self.potentials[new_potential_key] = potential.editable_copy()
+        else:
+            self.potentials[new_potential_key] = deepcopy(potential)
+        for topology_key in topology_keys:
+            slot_map[topology_key] = new_potential_key
+
+        return new_potential_key
+
+    def _build_atom_index_map(self) -> None:
+        """
+        Index the keys of the slot map by their atom indices.
+
+        Keys of bonds, angles and proper torsions are also indexed by their atom indices
+        in reverse order.
+        """
+        slot_map = self._get_slot_map()
+        atom_index_map: Dict[
+            Tuple[int, ...], Union[TopologyKey, VirtualSiteKey]
+        ] = dict()
+
+        # Where keys share atom indices, i.e. layered torsions, the first key is used, and
+        # an exact match is always preferred to a reversed one
+        for topology_key in slot_map:
+            atom_index_map.setdefault(topology_key.atom_indices, topology_key)
+        if self.type in _REVERSIBLE_HANDLER_TYPES:
+            for topology_key in slot_map:
+                atom_index_map.setdefault(
+                    topology_key.atom_indices[::-1], topology_key
+                )
+
+        self._atom_index_map = atom_index_map
+        self._atom_index_map_source = (slot_map, slot_map._version)
+
+    def _get_topology_key(
+        self, atom_indices: Tuple[int, ...]
+    ) -> Optional[Union[TopologyKey, VirtualSiteKey]]:
+        """Find the key in the slot map with these atom indices, or their reverse if allowed."""
+        slot_map = self._get_slot_map()
+        source = self._atom_index_map_source
+        if (
+            source is None
+            or source[0] is not slot_map
+            or source[1] != slot_map._version
+        ):
+            self._build_atom_index_map()
+
+        return self._atom_index_map.get(atom_indices)  # type: ignore[union-attr]
+
     def _get_parameters(self, atom_indices: Tuple[int]) -> Dict:
-        for topology_key in self.slot_map:
-            if topology_key.atom_indices == atom_indices:
-                potential_key = self.slot_map[topology_key]
-                potential = self.potentials[potential_key]
-                parameters = potential.parameters
-                return parameters
+        topology_key = self._get_topology_key(tuple(atom_indices))
+        if topology_key is not None:
+            potential_key = self.slot_map[topology_key]
+            potential = self.potentials[potential_key]
+            parameters = potential.parameters
+            return parameters
         raise MissingParametersError(
             f"Could not find parameter in parameter in handler {self.type} "
             f"associated with atoms {atom_indices}"
         )
 
     def get_force_field_parameters(self):
-        """Return a flattened representation of the force field parameters."""
-        # TODO: Handle WrappedPotential
-        if any(
-            isinstance(potential, WrappedPotential)
-            for potential in self.potentials.values()
-        ):
-            raise NotImplementedError
+        """
+        Return a flattened representation of the force field parameters.
 
+        Rows are ordered as in ``get_mapping``, except that a ``WrappedPotential`` is
+        represented by the potentials it wraps.
+        """
         return numpy.array(
-            [[v.m for v in p.parameters.values()] for p in self.potentials.values()]
+            [
+                potential._get_magnitudes()
+                for potential in self._get_coefficient_data()["potentials"]
+            ]
         )
 
     def set_force_field_parameters(self, new_p):
         """Set the force field parameters from a flattened representation."""
-        mapping = self.get_mapping()
-        if new_p.shape[0] != len(mapping):
+        coefficient_data = self._get_coefficient_data()
+        table = coefficient_data["potentials"]
+        if new_p.shape[0] != len(table):
             raise RuntimeError
 
-        for potential_key, potential_index in self.get_mapping().items():
-            potential = self.potentials[potential_key]
+        # Potentials may be shared, so new ones are stored instead of modified
+        new_table: List[Potential] = list()
+        for potential_index, potential in enumerate(table):
             if len(new_p[potential_index, :]) != len(potential.parameters):
                 raise RuntimeError
 
+            parameters = dict(potential.parameters)
             for parameter_index, parameter_key in enumerate(potential.parameters):
                 parameter_units = potential.parameters[parameter_key].units
                 modified_parameter = new_p[potential_index, parameter_index]
 
-                self.potentials[potential_key].parameters[parameter_key] = (
-                    modified_parameter * parameter_units
+                parameters[parameter_key] = modified_parameter * parameter_units
+
+            new_table.append(
+                Potential.construct(parameters=parameters, map_key=potential.map_key)
+            )
+
+        key_offsets = coefficient_data["key_offsets"].tolist()
+        key_columns = coefficient_data["key_columns"].tolist()
+        key_coefficients = coefficient_data["key_coefficients"].tolist()
+
+        for key_index, potential_key in enumerate(self.get_mapping()):
+            start, end = key_offsets[key_index], key_offsets[key_index + 1]
+            if isinstance(self.potentials[potential_key], WrappedPotential):
+                self.potentials[potential_key] = WrappedPotential(
+                    {
+                        new_table[column]: coefficient
+                        for column, coefficient in zip(
+                            key_columns[start:end], key_coefficients[start:end]
+                        )
+                    }
                 )
+            else:
+                self.potentials[potential_key] = new_table[key_columns[start]]
 
     def get_system_parameters(self, p=None):
         """
         Return a flattened representation of system parameters.
 
         These values are effectively force field parameters as applied to a chemical topology.
+        Parameters of a ``WrappedPotential`` are interpolated from the potentials it wraps.
         """
-        # TODO: Handle WrappedPotential
-        if any(
-            isinstance(potential, WrappedPotential)
-            for potential in self.potentials.values()
-        ):
-            raise NotImplementedError
-
         if p is None:
             p = self.get_force_field_parameters()
-        mapping = self.get_mapping()
 
-        q: List = list()
-        for potential_key in self.slot_map.values():
-            index = mapping[potential_key]
-            q.append(p[index])
+        coefficient_data = self._get_coefficient_data()
+        if not coefficient_data["wrapped"]:
+            return p[coefficient_data["columns"]]
+
+        # Each slot is a weighted sum of a fixed number of (possibly padded) rows of p
+        return (
+            p[coefficient_data["padded_columns"]]
+            * coefficient_data["padded_coefficients"][..., None]
+        ).sum(axis=1)
 
-        return numpy.array(q)
+    def _get_potential_indices(self) -> np.ndarray:
+        """Return the index into ``get_mapping`` of the potential applied to each slot."""
+        slot_map = self._get_slot_map()
+        cached = self._potential_indices
+        if (
+            cached is not None
+            and cached[0] is slot_map
+            and cached[1] == slot_map._version
+        ):
+            return cached[2]
+
+        mapping = self.get_mapping()
+        indices = np.fromiter(
+            (mapping[potential_key] for potential_key in slot_map.values()),
+            dtype=np.intp,
+            count=len(slot_map),
+        )
+        self._potential_indices = (slot_map, slot_map._version, indices)
+        return indices
 
     def get_mapping(self) -> Dict:
-        """Get a mapping between potentials and array indices."""
-        mapping: Dict = dict()
-        index = 0
-        for potential_key in self.slot_map.values():
-            if potential_key not in mapping:
-                mapping[potential_key] = index
-                index += 1
+        """
+        Get a mapping between potentials and array indices.
 
-        return mapping
+        Potential keys are ordered by when they were first applied to a topology key.
+        """
+        return {
+            potential_key: index
+            for index, potential_key in enumerate(self._get_slot_map()._topology_keys)
+        }
 
     def parametrize(self, p=None):
         """Return an array of system parameters, given an array of force field parameters."""
@@ -216,20 +877,156 @@ class PotentialHandler(DefaultModel):
             mapping=self.get_mapping(),
         )
 
-    @requires_package("jax")
+    def _get_coefficients(
+        self,
+    ) -> Tuple[List[Potential], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Describe system parameters as linear combinations of force field parameters.
+
+        Returns the potentials storing force field parameters, and the index of the slot,
+        index of the potential and coefficient of each of their contributions to a slot.
+        Potentials are ordered by when they are first used, and each is used with a
+        coefficient of 1 except those wrapped by a ``WrappedPotential``, which are used with
+        their interpolation coefficients. Wrapped potentials of keys differing only in bond
+        order are the same force field parameters.
+        """
+        coefficient_data = self._get_coefficient_data()
+
+        return (
+            coefficient_data["potentials"],
+            coefficient_data["slots"],
+            coefficient_data["columns"],
+            coefficient_data["coefficients"],
+        )
+
+    def _get_coefficient_data(self) -> Dict[str, Any]:
+        """Compute the data returned by ``_get_coefficients``, or return it if cached."""
+        slot_map = self._get_slot_map()
+        potentials = self._get_potentials()
+        versions = (slot_map._version, potentials._version)
+
+        if self._coefficient_cache is not None:
+            (
+                cached_slot_map,
+                cached_potentials,
+                cached_versions,
+                coefficient_data,
+            ) = self._coefficient_cache
+            if (
+                cached_slot_map is slot_map
+                and cached_potentials is potentials
+                and cached_versions == versions
+            ):
+                return coefficient_data
+
+        columns: Dict[Tuple[PotentialKey, Optional[int]], int] = dict()
+        table: List[Potential] = list()
+        offsets: List[int] = [0]
+        key_columns: List[int] = list()
+        key_coefficients: List[float] = list()
+        wrapped = False
+
+        for potential_key in self.get_mapping():
+            potential = potentials[potential_key]
+            if isinstance(potential, WrappedPotential):
+                wrapped = True
+                parameter_key = PotentialKey(
+                    id=potential_key.id,
+                    mult=potential_key.mult,
+                    associated_handler=potential_key.associated_handler,
+                )
+                terms = [
+                    ((parameter_key, inner.map_key), inner, coefficient)
+                    for inner, coefficient in potential._inner_data.data.items()
+                ]
+            else:
+                terms = [((potential_key, None), potential, 1.0)]
+
+            for column_key, column_potential, coefficient in terms:
+                if column_key not in columns:
+                    columns[column_key] = len(table)
+                    table.append(column_potential)
+                key_columns.append(columns[column_key])
+                key_coefficients.append(coefficient)
+            offsets.append(len(key_columns))
+
+        key_offsets = np.asarray(offsets, dtype=np.intp)
+        key_column_array = np.asarray(key_columns, dtype=np.intp)
+        key_coefficient_array = np.asarray(key_coefficients, dtype=float)
+
+        # Expand the contributions of each potential key to every slot it is applied to
+        potential_indices = self._get_potential_indices()
+        n_slots = len(slot_map)
+        counts = np.diff(key_offsets)[potential_indices]
+        slots = np.repeat(np.arange(n_slots, dtype=np.intp), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.arange(len(slots), dtype=np.intp) - starts
+        contributions = np.repeat(key_offsets[potential_indices], counts) + positions
+
+        slot_columns = key_column_array[contributions]
+        slot_coefficients = key_coefficient_array[contributions]
+
+        # The same contributions, padded to an equal number per slot
+        width = int(counts.max()) if n_slots else 1
+        padded_columns = np.zeros((n_slots, width), dtype=np.intp)
+        padded_coefficients = np.zeros((n_slots, width))
+        padded_columns[slots, positions] = slot_columns
+        padded_coefficients[slots, positions] = slot_coefficients
+
+        coefficient_data = {
+            "potentials": table,
+            "wrapped": wrapped,
+            "key_offsets": key_offsets,
+            "key_columns": key_column_array,
+            "key_coefficients": key_coefficient_array,
+            "slots": slots,
+            "columns": slot_columns,
+            "coefficients": slot_coefficients,
+            "padded_columns": padded_columns,
+            "padded_coefficients": padded_coefficients,
+        }
+        for value in coefficient_data.values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+        self._coefficient_cache = (slot_map, potentials, versions, coefficient_data)
+
+        return coefficient_data
+
+    def _get_param_matrix_entries(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]:
+        """Return the rows, columns, values and shape of the nonzero entries of the parameter matrix."""
+        table, slots, columns, coefficients = self._get_coefficients()
+        n_parameters = len(table[0].parameters) if table else 0
+
+        parameter_indices = np.arange(n_parameters, dtype=np.intp)
+        rows = (slots[:, None] * n_parameters + parameter_indices).ravel()
+        columns = (columns[:, None] * n_parameters + parameter_indices).ravel()
+        values = np.repeat(coefficients, n_parameters)
+        shape = (len(self.slot_map) * n_parameters, len(table) * n_parameters)
+
+        return rows, columns, values, shape
+
     def get_param_matrix(self):
-        """Get a matrix representing the mapping between force field and system parameters."""
-        from functools import partial
+        """
+        Get a matrix representing the mapping between force field and system parameters.
 
-        import jax
+        Rows correspond to flattened system parameters and columns to flattened force field
+        parameters. See ``get_sparse_param_matrix`` for a sparse representation.
+        """
+        rows, columns, values, shape = self._get_param_matrix_entries()
 
-        p = self.get_force_field_parameters()
+        param_matrix = np.zeros(shape)
+        np.add.at(param_matrix, (rows, columns), values)
 
-        parametrize_partial = partial(
-            self.parametrize,
-        )
+        return numpy.asarray(param_matrix)
+
+    @requires_package("scipy")
+    def get_sparse_param_matrix(self) -> "scipy.sparse.csr_matrix":
+        """Get the matrix returned by ``get_param_matrix`` as a sparse matrix."""
+        from scipy.sparse import csr_matrix
 
-        jac_parametrize = jax.jacfwd(parametrize_partial)
-        jac_res = jac_parametrize(p)
+        rows, columns, values, shape = self._get_param_matrix_entries()
 
-        return jac_res.reshape(-1, p.flatten().shape[0])
+        return csr_matrix((values, (rows, columns)), shape=shape)
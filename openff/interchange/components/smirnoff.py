@@ -1,19 +1,8 @@
 """Models and utilities for processing SMIRNOFF data."""
 import abc
 import copy
-import functools
 from collections import defaultdict
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    DefaultDict,
-    Dict,
-    List,
-    Tuple,
-    Type,
-    TypeVar,
-    Union,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 import numpy as np
 from openff.toolkit.topology import Molecule
@@ -36,13 +25,19 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
 from openff.units import unit
 from openff.units.openmm import from_openmm
 from openmm import unit as omm_unit
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from typing_extensions import Literal
 
+from openff.interchange.components.charge_cache import (
+    _RecordingChargeCache,
+    get_charge_cache,
+    set_charge_cache,
+)
 from openff.interchange.components.potentials import (
     Potential,
     PotentialHandler,
     WrappedPotential,
+    intern_potential,
 )
 from openff.interchange.exceptions import (
     InvalidParameterHandlerError,
@@ -57,8 +52,12 @@ kcal_mol_angstroms = kcal_mol / omm_unit.angstrom ** 2
 kcal_mol_radians = kcal_mol / omm_unit.radian ** 2
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from openff.toolkit.topology import Topology
+    from openff.toolkit.typing.engines.smirnoff.parameters import ParameterType
 
+    from openff.interchange.components.charge_cache import ChargeCache
     from openff.interchange.components.mdtraj import _OFFBioTop
 
     ElectrostaticsHandlerType = Union[
@@ -104,32 +103,123 @@ class SMIRNOFFPotentialHandler(PotentialHandler, abc.ABC):
                         parameter_attribute,
                     )
 
+    @staticmethod
+    def _get_parameters_by_smirks(
+        parameter_handler: ParameterHandler,
+    ) -> Dict[str, "ParameterType"]:
+        """
+        Index the parameters of a parameter handler by their SMIRKS patterns.
+
+        Where SMIRKS are duplicated, the first parameter is kept, consistent with
+        ``ParameterHandler.get_parameter({"smirks": smirks})[0]``.
+        """
+        parameters_by_smirks: Dict[str, "ParameterType"] = dict()
+        for parameter in parameter_handler.parameters:
+            parameters_by_smirks.setdefault(parameter.smirks, parameter)
+
+        return parameters_by_smirks
+
+    @staticmethod
+    def _get_topology_atom_maps(
+        topology: Union["Topology", "_OFFBioTop"],
+        reference_molecule: Molecule,
+    ) -> List[List[int]]:
+        """
+        Map the atom indices of a reference molecule to each of its copies in a topology.
+
+        Returns one list per topology molecule, in which the i-th element is the topology
+        atom index of the atom with index i in the reference molecule.
+        """
+        atom_maps = list()
+        for topology_molecule in topology._reference_molecule_to_topology_molecules[
+            reference_molecule
+        ]:
+            atom_map = [0] * reference_molecule.n_atoms
+            for topology_atom in topology_molecule.atoms:
+                atom_map[
+                    topology_atom.atom.molecule_atom_index
+                ] = topology_atom.topology_atom_index
+            atom_maps.append(atom_map)
+
+        return atom_maps
+
+    @staticmethod
+    def _canonicalize_atom_indices(atom_indices: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Order atom indices mapped onto a topology as the toolkit orders them in matches.
+
+        Matches are keyed as in a ``ValenceDict``, in which the first index is lower than
+        the last.
+        """
+        if atom_indices[0] > atom_indices[-1]:
+            return atom_indices[::-1]
+        return atom_indices
+
+    def _store_reference_matches(
+        self,
+        reference_slot_map: Dict[TopologyKey, PotentialKey],
+        topology: Union["Topology", "_OFFBioTop"],
+        reference_molecule: Molecule,
+    ) -> None:
+        """
+        Copy matches found on a reference molecule onto each of its copies in a topology.
+
+        The keys of ``reference_slot_map`` store atom indices local to the reference molecule.
+        Mapped atom indices are re-ordered as if the topology had been matched directly.
+        """
+        for atom_map in self._get_topology_atom_maps(topology, reference_molecule):
+            for reference_key, potential_key in reference_slot_map.items():
+                topology_key = TopologyKey(
+                    atom_indices=self._canonicalize_atom_indices(
+                        tuple(atom_map[i] for i in reference_key.atom_indices)
+                    ),
+                    mult=reference_key.mult,
+                    bond_order=reference_key.bond_order,
+                )
+                self.slot_map[topology_key] = potential_key
+
     def store_matches(
         self,
         parameter_handler: ParameterHandler,
         topology: Union["Topology", "_OFFBioTop"],
     ) -> None:
-        """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
+        """
+        Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey].
+
+        SMIRKS matching is done once per reference molecule and the results are mapped onto
+        each copy of that molecule in the topology.
+        """
         parameter_handler_name = getattr(parameter_handler, "_TAGNAME", None)
         if self.slot_map:
             # TODO: Should the slot_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
-        for key, val in matches.items():
-            topology_key = TopologyKey(atom_indices=key)
-            potential_key = PotentialKey(
-                id=val.parameter_type.smirks, associated_handler=parameter_handler_name
-            )
-            self.slot_map[topology_key] = potential_key
+        for reference_molecule in topology.reference_molecules:
+            reference_topology = reference_molecule.to_topology()
+            matches = parameter_handler.find_matches(reference_topology)
+            reference_slot_map = dict()
+            for key, val in matches.items():
+                topology_key = TopologyKey(atom_indices=key)
+                potential_key = PotentialKey(
+                    id=val.parameter_type.smirks,
+                    associated_handler=parameter_handler_name,
+                )
+                reference_slot_map[topology_key] = potential_key
 
-        if self.__class__.__name__ in ["SMIRNOFFBondHandler", "SMIRNOFFAngleHandler"]:
-            valence_terms = self.valence_terms(topology)  # type: ignore[attr-defined]
+            if self.__class__.__name__ in [
+                "SMIRNOFFBondHandler",
+                "SMIRNOFFAngleHandler",
+            ]:
+                valence_terms = self.valence_terms(reference_topology)  # type: ignore[attr-defined]
 
-            parameter_handler._check_all_valence_terms_assigned(
-                assigned_terms=matches,
-                valence_terms=valence_terms,
-                exception_cls=UnassignedValenceParameterException,
+                parameter_handler._check_all_valence_terms_assigned(
+                    assigned_terms=matches,
+                    valence_terms=valence_terms,
+                    exception_cls=UnassignedValenceParameterException,
+                )
+
+            self._store_reference_matches(
+                reference_slot_map, topology, reference_molecule
             )
 
     @classmethod
@@ -196,35 +286,42 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
             # TODO: Should the slot_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
-        for key, val in matches.items():
-            param = val.parameter_type
-            if param.k_bondorder or param.length_bondorder:
-                top_bond = topology.get_bond_between(*key)
-                fractional_bond_order = top_bond.bond.fractional_bond_order
-                if not fractional_bond_order:
-                    raise RuntimeError(
-                        "Bond orders should already be assigned at this point"
-                    )
-            else:
-                fractional_bond_order = None
-            topology_key = TopologyKey(
-                atom_indices=key, bond_order=fractional_bond_order
-            )
-            potential_key = PotentialKey(
-                id=val.parameter_type.smirks,
-                associated_handler=parameter_handler_name,
-                bond_order=fractional_bond_order,
-            )
-            self.slot_map[topology_key] = potential_key
+        for reference_molecule in topology.reference_molecules:
+            reference_topology = reference_molecule.to_topology()
+            matches = parameter_handler.find_matches(reference_topology)
+            reference_slot_map = dict()
+            for key, val in matches.items():
+                param = val.parameter_type
+                if param.k_bondorder or param.length_bondorder:
+                    bond = reference_molecule.get_bond_between(*key)
+                    fractional_bond_order = bond.fractional_bond_order
+                    if not fractional_bond_order:
+                        raise RuntimeError(
+                            "Bond orders should already be assigned at this point"
+                        )
+                else:
+                    fractional_bond_order = None
+                topology_key = TopologyKey(
+                    atom_indices=key, bond_order=fractional_bond_order
+                )
+                potential_key = PotentialKey(
+                    id=val.parameter_type.smirks,
+                    associated_handler=parameter_handler_name,
+                    bond_order=fractional_bond_order,
+                )
+                reference_slot_map[topology_key] = potential_key
 
-        valence_terms = self.valence_terms(topology)
+            valence_terms = self.valence_terms(reference_topology)
 
-        parameter_handler._check_all_valence_terms_assigned(
-            assigned_terms=matches,
-            valence_terms=valence_terms,
-            exception_cls=UnassignedValenceParameterException,
-        )
+            parameter_handler._check_all_valence_terms_assigned(
+                assigned_terms=matches,
+                valence_terms=valence_terms,
+                exception_cls=UnassignedValenceParameterException,
+            )
+
+            self._store_reference_matches(
+                reference_slot_map, topology, reference_molecule
+            )
 
     def store_potentials(self, parameter_handler: "BondHandler") -> None:
         """
@@ -233,11 +330,13 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
         """
         if self.potentials:
             self.potentials = dict()
-        for topology_key, potential_key in self.slot_map.items():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        # Bond orders are part of each PotentialKey, so each unique key is processed once
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
-            if topology_key.bond_order:  # type: ignore[union-attr]
-                bond_order = topology_key.bond_order  # type: ignore[union-attr]
+            parameter = parameters_by_smirks[smirks]
+            if potential_key.bond_order:
+                bond_order = potential_key.bond_order
                 if parameter.k_bondorder:
                     data = parameter.k_bondorder
                 else:
@@ -250,12 +349,14 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
                 map_keys = [*data.keys()]
                 for map_key in map_keys:
                     pots.append(
-                        Potential(
-                            parameters={
-                                "k": parameter.k_bondorder[map_key],
-                                "length": parameter.length_bondorder[map_key],
-                            },
-                            map_key=map_key,
+                        intern_potential(
+                            Potential(
+                                parameters={
+                                    "k": parameter.k_bondorder[map_key],
+                                    "length": parameter.length_bondorder[map_key],
+                                },
+                                map_key=map_key,
+                            )
                         )
                     )
                 potential = WrappedPotential(
@@ -268,7 +369,7 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
                         "length": parameter.length,
                     },
                 )
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
     @classmethod
     def _from_toolkit(
@@ -338,10 +439,14 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         cls: Type[T],
         parameter_handler: List,
         topology: "Topology",
+        bonds: Optional["SMIRNOFFBondHandler"] = None,
     ) -> T:
         """
         Create a SMIRNOFFPotentialHandler from toolkit data.
 
+        If ``bonds`` is passed, constraints without a specified distance re-use its bond
+        lengths instead of matching bond parameters to the topology again.
+
         """
         if isinstance(parameter_handler, list):
             parameter_handlers = parameter_handler
@@ -354,7 +459,7 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
 
         handler = cls()
         handler.store_constraints(  # type: ignore[attr-defined]
-            parameter_handlers=parameter_handlers, topology=topology
+            parameter_handlers=parameter_handlers, topology=topology, bonds=bonds
         )
 
         return handler
@@ -363,6 +468,7 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         self,
         parameter_handlers: Any,
         topology: "_OFFBioTop",
+        bonds: Optional["SMIRNOFFBondHandler"] = None,
     ) -> None:
         """Store constraints."""
         if self.slot_map:
@@ -373,7 +479,9 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         ][0]
         constraint_matches = constraint_handler.find_matches(topology)
 
-        if any([type(p) == BondHandler for p in parameter_handlers]):
+        if bonds is not None:
+            bond_handler = bonds
+        elif any([type(p) == BondHandler for p in parameter_handlers]):
             bond_handler = [p for p in parameter_handlers if type(p) == BondHandler][0]
             bonds = SMIRNOFFBondHandler._from_toolkit(
                 parameter_handler=bond_handler,
@@ -381,7 +489,6 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
             )
         else:
             bond_handler = None
-            bonds = None  # type: ignore[assignment]
 
         for key, match in constraint_matches.items():
             topology_key = TopologyKey(atom_indices=key)
@@ -402,9 +509,11 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
                         "of this constraint is not specified."
                     )
                 # ... so use the same PotentialKey instance as the BondHandler to look up the distance
-                potential_key = bonds.slot_map[topology_key]
+                potential_key = bonds.slot_map[topology_key]  # type: ignore[union-attr]
                 self.slot_map[topology_key] = potential_key
-                distance = bonds.potentials[potential_key].parameters["length"]
+                distance = bonds.potentials[  # type: ignore[union-attr]
+                    potential_key
+                ].parameters["length"]
             potential = Potential(
                 parameters={
                     "distance": distance,
@@ -439,18 +548,17 @@ class SMIRNOFFAngleHandler(SMIRNOFFPotentialHandler):
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for potential_key in self.slot_map.values():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
-            # ParameterHandler.get_parameter returns a list, although this
-            # should only ever be length 1
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameters_by_smirks[smirks]
             potential = Potential(
                 parameters={
                     "k": parameter.k,
                     "angle": parameter.angle,
                 },
             )
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
     @classmethod
     def f_from_toolkit(
@@ -500,51 +608,60 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
         """
         if self.slot_map:
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
-        for key, val in matches.items():
-            param = val.parameter_type
-            n_terms = len(val.parameter_type.phase)
-            for n in range(n_terms):
-                smirks = param.smirks
-                if param.k_bondorder:
-                    # The relevant bond order is that of the _central_ bond in the torsion
-                    top_bond = topology.get_bond_between(key[1], key[2])
-                    fractional_bond_order = top_bond.bond.fractional_bond_order
-                    if not fractional_bond_order:
-                        raise RuntimeError(
-                            "Bond orders should already be assigned at this point"
-                        )
-                else:
-                    fractional_bond_order = None
-                topology_key = TopologyKey(
-                    atom_indices=key, mult=n, bond_order=fractional_bond_order
-                )
-                potential_key = PotentialKey(
-                    id=smirks,
-                    mult=n,
-                    associated_handler="ProperTorsions",
-                    bond_order=fractional_bond_order,
-                )
-                self.slot_map[topology_key] = potential_key
+        for reference_molecule in topology.reference_molecules:
+            reference_topology = reference_molecule.to_topology()
+            matches = parameter_handler.find_matches(reference_topology)
+            reference_slot_map = dict()
+            for key, val in matches.items():
+                param = val.parameter_type
+                n_terms = len(val.parameter_type.phase)
+                for n in range(n_terms):
+                    smirks = param.smirks
+                    if param.k_bondorder:
+                        # The relevant bond order is that of the _central_ bond in the torsion
+                        bond = reference_molecule.get_bond_between(key[1], key[2])
+                        fractional_bond_order = bond.fractional_bond_order
+                        if not fractional_bond_order:
+                            raise RuntimeError(
+                                "Bond orders should already be assigned at this point"
+                            )
+                    else:
+                        fractional_bond_order = None
+                    topology_key = TopologyKey(
+                        atom_indices=key, mult=n, bond_order=fractional_bond_order
+                    )
+                    potential_key = PotentialKey(
+                        id=smirks,
+                        mult=n,
+                        associated_handler="ProperTorsions",
+                        bond_order=fractional_bond_order,
+                    )
+                    reference_slot_map[topology_key] = potential_key
 
-        parameter_handler._check_all_valence_terms_assigned(
-            assigned_terms=matches,
-            valence_terms=list(topology.propers),
-            exception_cls=UnassignedProperTorsionParameterException,
-        )
+            parameter_handler._check_all_valence_terms_assigned(
+                assigned_terms=matches,
+                valence_terms=list(reference_topology.propers),
+                exception_cls=UnassignedProperTorsionParameterException,
+            )
+
+            self._store_reference_matches(
+                reference_slot_map, topology, reference_molecule
+            )
 
     def store_potentials(self, parameter_handler: "ProperTorsionHandler") -> None:
         """
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for topology_key, potential_key in self.slot_map.items():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        # Bond orders are part of each PotentialKey, so each unique key is processed once
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
             n = potential_key.mult
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameters_by_smirks[smirks]
             # n_terms = len(parameter.k)
-            if topology_key.bond_order:  # type: ignore[union-attr]
-                bond_order = topology_key.bond_order  # type: ignore[union-attr]
+            if potential_key.bond_order:
+                bond_order = potential_key.bond_order
                 data = parameter.k_bondorder[n]
                 coeffs = _get_interpolation_coeffs(
                     fractional_bond_order=bond_order,
@@ -560,9 +677,11 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
                         "idivf": parameter.idivf[n] * unit.dimensionless,
                     }
                     pots.append(
-                        Potential(
-                            parameters=parameters,
-                            map_key=map_key,
+                        intern_potential(
+                            Potential(
+                                parameters=parameters,
+                                map_key=map_key,
+                            )
                         )
                     )
                 potential = WrappedPotential(
@@ -576,7 +695,7 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
                     "idivf": parameter.idivf[n] * unit.dimensionless,
                 }
                 potential = Potential(parameters=parameters)  # type: ignore[assignment]
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
 
 class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
@@ -597,6 +716,22 @@ class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
         """Return a list of supported parameter attribute names."""
         return ["smirks", "id", "k", "periodicity", "phase", "idivf"]
 
+    @staticmethod
+    def _canonicalize_atom_indices(atom_indices: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Order atom indices mapped onto a topology as the toolkit orders them in matches.
+
+        The central atom is stored first, followed by a cyclic permutation of the other
+        three atoms in ascending order, as each ``ImproperDict`` match is expanded into
+        three keys. Mapping onto a topology may reverse the cyclic order of the outer atoms,
+        in which case the last two are swapped.
+        """
+        central, first, second, third = atom_indices
+        n_inversions = (first > second) + (first > third) + (second > third)
+        if n_inversions % 2:
+            return central, first, third, second
+        return atom_indices
+
     def store_matches(
         self, parameter_handler: "ImproperTorsionHandler", topology: "_OFFBioTop"
     ) -> None:
@@ -606,48 +741,55 @@ class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
         """
         if self.slot_map:
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
-        for key, val in matches.items():
-            parameter_handler._assert_correct_connectivity(
-                val,
-                [
-                    (0, 1),
-                    (1, 2),
-                    (1, 3),
-                ],
-            )
-            n_terms = len(val.parameter_type.k)
-            for n in range(n_terms):
+        for reference_molecule in topology.reference_molecules:
+            matches = parameter_handler.find_matches(reference_molecule.to_topology())
+            reference_slot_map = dict()
+            for key, val in matches.items():
+                parameter_handler._assert_correct_connectivity(
+                    val,
+                    [
+                        (0, 1),
+                        (1, 2),
+                        (1, 3),
+                    ],
+                )
+                n_terms = len(val.parameter_type.k)
+                for n in range(n_terms):
 
-                smirks = val.parameter_type.smirks
-                non_central_indices = [key[0], key[2], key[3]]
+                    smirks = val.parameter_type.smirks
+                    non_central_indices = [key[0], key[2], key[3]]
 
-                for permuted_key in [
-                    (
-                        non_central_indices[i],
-                        non_central_indices[j],
-                        non_central_indices[k],
-                    )
-                    for (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
-                ]:
+                    for permuted_key in [
+                        (
+                            non_central_indices[i],
+                            non_central_indices[j],
+                            non_central_indices[k],
+                        )
+                        for (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
+                    ]:
 
-                    topology_key = TopologyKey(
-                        atom_indices=(key[1], *permuted_key), mult=n
-                    )
-                    potential_key = PotentialKey(
-                        id=smirks, mult=n, associated_handler="ImproperTorsions"
-                    )
-                    self.slot_map[topology_key] = potential_key
+                        topology_key = TopologyKey(
+                            atom_indices=(key[1], *permuted_key), mult=n
+                        )
+                        potential_key = PotentialKey(
+                            id=smirks, mult=n, associated_handler="ImproperTorsions"
+                        )
+                        reference_slot_map[topology_key] = potential_key
+
+            self._store_reference_matches(
+                reference_slot_map, topology, reference_molecule
+            )
 
     def store_potentials(self, parameter_handler: "ImproperTorsionHandler") -> None:
         """
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for potential_key in self.slot_map.values():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
             n = potential_key.mult
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameters_by_smirks[smirks]
             parameters = {
                 "k": parameter.k[n],
                 "periodicity": parameter.periodicity[n] * unit.dimensionless,
@@ -655,7 +797,7 @@ class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
                 "idivf": 3.0 * unit.dimensionless,
             }
             potential = Potential(parameters=parameters)
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
 
 class _SMIRNOFFNonbondedHandler(SMIRNOFFPotentialHandler, abc.ABC):
@@ -718,9 +860,10 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
         self.method = parameter_handler.method.lower()
         self.cutoff = parameter_handler.cutoff
 
-        for potential_key in self.slot_map.values():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameters_by_smirks[smirks]
             try:
                 potential = Potential(
                     parameters={
@@ -736,7 +879,7 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
                         "epsilon": parameter.epsilon,
                     },
                 )
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
     @classmethod
     def _from_toolkit(
@@ -858,6 +1001,8 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
 
     method: Literal["pme", "cutoff", "reaction-field", "no-cutoff"] = Field("pme")
 
+    _charge_cache: Optional[Tuple] = PrivateAttr(None)
+
     @classmethod
     def allowed_parameter_handlers(cls):
         """Return a list of allowed types of ParameterHandler classes."""
@@ -888,42 +1033,145 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
     def get_charges(
         self, include_virtual_sites=False
     ) -> Dict[Union[VirtualSiteKey, TopologyKey], unit.Quantity]:
-        """Get the total partial charge on each atom or particle."""
-        charges: DefaultDict[
-            Union[TopologyKey, VirtualSiteKey], FloatQuantity
-        ] = defaultdict(lambda: 0.0 * unit.e)
+        """
+        Get the total partial charge on each atom or particle.
 
-        for topology_key, potential_key in self.slot_map.items():
+        Keys are ordered by when charges were first assigned to them. See
+        ``get_charge_array`` for the same data as an array.
+        """
+        charge_data = self._get_charge_data()
+        view = "charges_with_virtual_sites" if include_virtual_sites else "charges"
+
+        if view not in charge_data:
+            atom_charges = charge_data["atoms"]
+            virtual_site_keys = charge_data["virtual_site_keys"]
+            virtual_site_charges = charge_data["virtual_sites"]
+            n_atoms = len(atom_charges)
+
+            charges: Dict[Union[VirtualSiteKey, TopologyKey], unit.Quantity] = dict()
+            for index in charge_data["order"].tolist():
+                if index < n_atoms:
+                    charges[TopologyKey(atom_indices=(index,))] = unit.Quantity(
+                        atom_charges[index], unit.elementary_charge
+                    )
+                elif include_virtual_sites:
+                    charges[virtual_site_keys[index - n_atoms]] = unit.Quantity(
+                        virtual_site_charges[index - n_atoms], unit.elementary_charge
+                    )
+            charge_data[view] = charges
 
-            potential = self.potentials[potential_key]
+        return dict(charge_data[view])
 
-            for parameter_key, parameter_value in potential.parameters.items():
+    def get_charge_array(self, include_virtual_sites=False) -> np.ndarray:
+        """
+        Get the total partial charge on each atom or particle, in units of elementary charge.
 
+        Charges on atoms are ordered by atom index and, if included, followed by charges on
+        virtual sites in the order they are stored in ``slot_map``. The returned array is
+        cached until ``slot_map`` or ``potentials`` is modified, and cannot be modified.
+        """
+        charge_data = self._get_charge_data()
+        if include_virtual_sites:
+            return charge_data["particles"]
+        return charge_data["atoms"]
+
+    def _get_charge_data(self) -> Dict[str, Any]:
+        """Compute charges on atoms and virtual sites, or return them if cached."""
+        slot_map = self._get_slot_map()
+        potentials = self._get_potentials()
+        versions = (slot_map._version, potentials._version)
+
+        if self._charge_cache is not None:
+            (
+                cached_slot_map,
+                cached_potentials,
+                cached_versions,
+                charge_data,
+            ) = self._charge_cache
+            if (
+                cached_slot_map is slot_map
+                and cached_potentials is potentials
+                and cached_versions == versions
+            ):
+                return charge_data
+
+        # Sum the contributions of each unique potential once ...
+        mapping = self.get_mapping()
+        atom_increments = np.zeros(len(mapping))
+        applied_to_atoms = np.zeros(len(mapping), dtype=bool)
+        site_charges = np.zeros(len(mapping))
+        applied_to_sites = np.zeros(len(mapping), dtype=bool)
+
+        for potential_index, potential_key in enumerate(mapping):
+            potential = potentials[potential_key]
+            for parameter_key, parameter_value in potential.parameters.items():
                 if parameter_key == "charge_increments":
-                    if type(topology_key) != VirtualSiteKey:
-                        raise RuntimeError
-                    charge = -1.0 * np.sum(parameter_value)
                     # assumes virtual sites can only have charges determined in one step
-                    # also, topology_key is actually a VirtualSiteKey
-                    charges[topology_key] = charge
+                    site_charges[potential_index] = -1.0 * np.sum(
+                        parameter_value.m_as(unit.elementary_charge)
+                    )
+                    applied_to_sites[potential_index] = True
                 elif parameter_key in ["charge", "charge_increment"]:
-                    charge = parameter_value
-                    charges[topology_key.atom_indices[0]] += charge  # type: ignore
+                    atom_increments[potential_index] += parameter_value.m_as(
+                        unit.elementary_charge
+                    )
+                    applied_to_atoms[potential_index] = True
                 else:
                     raise NotImplementedError()
 
-        returned_charges: Dict[
-            Union[VirtualSiteKey, TopologyKey], unit.Quantity
-        ] = dict()
+        # ... and scatter them to the atoms and virtual sites they are applied to
+        potential_indices = self._get_potential_indices()
+        n_slots = len(slot_map)
+        atom_indices = np.fromiter(
+            (key.atom_indices[0] for key in slot_map), dtype=np.intp, count=n_slots
+        )
+        is_virtual_site = np.fromiter(
+            (type(key) == VirtualSiteKey for key in slot_map), dtype=bool, count=n_slots
+        )
+        virtual_site_keys: List[VirtualSiteKey] = [
+            key for key in slot_map if type(key) == VirtualSiteKey  # type: ignore[misc]
+        ]
+        virtual_site_indices = np.cumsum(is_virtual_site) - 1
 
-        for index, charge in charges.items():
-            if isinstance(index, int):
-                returned_charges[TopologyKey(atom_indices=(index,))] = charge
-            else:
-                if include_virtual_sites:
-                    returned_charges[index] = charge
+        atom_slots = np.flatnonzero(applied_to_atoms[potential_indices])
+        site_slots = np.flatnonzero(applied_to_sites[potential_indices])
+
+        if not is_virtual_site[site_slots].all():
+            raise RuntimeError
+
+        atom_charges = np.bincount(
+            atom_indices[atom_slots],
+            weights=atom_increments[potential_indices[atom_slots]],
+        ).astype(float)
+        virtual_site_charges = np.zeros(len(virtual_site_keys))
+        virtual_site_charges[virtual_site_indices[site_slots]] = site_charges[
+            potential_indices[site_slots]
+        ]
+
+        # Atoms, and virtual sites numbered after them, in the order charges are assigned
+        n_atoms = len(atom_charges)
+        assigned = np.concatenate(
+            [atom_indices[atom_slots], n_atoms + virtual_site_indices[site_slots]]
+        )
+        assigned = assigned[
+            np.argsort(np.concatenate([atom_slots, site_slots]), kind="stable")
+        ]
+        unique, first = np.unique(assigned, return_index=True)
+
+        charge_data = {
+            "atoms": atom_charges,
+            "virtual_sites": virtual_site_charges,
+            "particles": np.concatenate([atom_charges, virtual_site_charges]),
+            "virtual_site_keys": virtual_site_keys,
+            "order": unique[np.argsort(first, kind="stable")],
+        }
+        for value in charge_data.values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
 
-        return returned_charges
+        self._charge_cache = (slot_map, potentials, versions, charge_data)
+
+        return charge_data
 
     @classmethod
     def parameter_handler_precedence(cls) -> List[str]:
@@ -937,10 +1185,14 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         cls: Type[T],
         parameter_handler: Any,
         topology: "Topology",
+        executor: Optional["Executor"] = None,
     ) -> T:
         """
         Create a SMIRNOFFElectrostaticsHandler from toolkit data.
 
+        If an ``executor`` is passed, charges of each reference molecule are assigned in
+        parallel. See ``SMIRNOFFElectrostaticsHandler.store_matches``.
+
         """
         if isinstance(parameter_handler, list):
             parameter_handlers = parameter_handler
@@ -960,7 +1212,9 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             method=toolkit_handler_with_metadata.method.lower(),
         )
 
-        handler.store_matches(parameter_handlers, topology)
+        handler.store_matches(  # type: ignore[call-arg]
+            parameter_handlers, topology, executor=executor
+        )
 
         return handler
 
@@ -1039,13 +1293,34 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         self.potentials.update(potentials)
 
     @classmethod
-    @functools.lru_cache(None)
-    def _compute_partial_charges(cls, molecule: Molecule, method: str) -> unit.Quantity:
-        """Call out to the toolkit's toolkit wrappers to generate partial charges."""
+    def _compute_partial_charges(
+        cls, molecule: Molecule, method: str, mapped_smiles: Optional[str] = None
+    ) -> unit.Quantity:
+        """
+        Call out to the toolkit's toolkit wrappers to generate partial charges.
+
+        Charges are looked up in, and stored to, the store returned by
+        ``openff.interchange.components.charge_cache.get_charge_cache``, keyed by the
+        mapped SMILES of the molecule and the charge method.
+        """
+        if mapped_smiles is None:
+            mapped_smiles = molecule.to_smiles(
+                isomeric=True, explicit_hydrogens=True, mapped=True
+            )
+
+        charge_cache = get_charge_cache()
+        cached_charges = charge_cache.get(mapped_smiles, method)
+
+        if cached_charges is not None:
+            return unit.Quantity(np.asarray(cached_charges), unit.elementary_charge)
+
         molecule = copy.deepcopy(molecule)
         molecule.assign_partial_charges(method)
 
-        return from_openmm(molecule.partial_charges)
+        partial_charges = from_openmm(molecule.partial_charges)
+        charge_cache.set(mapped_smiles, method, partial_charges.m_as(unit.e).tolist())
+
+        return partial_charges
 
     @classmethod
     def _library_charge_to_potentials(
@@ -1156,7 +1431,6 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         reference_molecule: Molecule,
     ) -> Tuple[Dict[TopologyKey, PotentialKey], Dict[PotentialKey, Potential]]:
         """Construct a slot and potential map for a charge model based parameter handler."""
-        reference_molecule = copy.deepcopy(reference_molecule)
         reference_smiles = reference_molecule.to_smiles(
             isomeric=True, explicit_hydrogens=True, mapped=True
         )
@@ -1164,7 +1438,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         method = getattr(parameter_handler, "partial_charge_method", "am1bcc")
 
         partial_charges = cls._compute_partial_charges(
-            reference_molecule, method=method
+            reference_molecule, method=method, mapped_smiles=reference_smiles
         )
 
         matches = {}
@@ -1282,9 +1556,24 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             "ElectrostaticsHandlerType", List["ElectrostaticsHandlerType"]
         ],
         topology: Union["Topology", "_OFFBioTop"],
+        executor: Optional["Executor"] = None,
     ) -> None:
         """
         Populate self.slot_map with key-val pairs of slots and unique potential identifiers.
+
+        Parameters
+        ----------
+        parameter_handler
+            The parameter handler(s) assigning charges.
+        topology
+            The topology to assign charges to.
+        executor : concurrent.futures.Executor, optional
+            If provided, charges of each reference molecule are assigned in parallel
+            by submitting work to this executor, i.e. a ``ProcessPoolExecutor``. Results
+            are merged in the order of ``topology.reference_molecules`` regardless of the
+            order in which they complete. Charges computed by workers are stored in the
+            charge store of this process.
+
         """
         # Reshape the parameter handlers into a dictionary for easier referencing.
         parameter_handlers = {
@@ -1301,18 +1590,48 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
 
         reference_molecules = [*topology.reference_molecules]
 
-        for reference_molecule in reference_molecules:
-
-            matches, potentials = self._find_reference_matches(
-                parameter_handlers, reference_molecule
-            )
+        if executor is None or len(reference_molecules) < 2:
+            reference_matches = [
+                self._find_reference_matches(parameter_handlers, reference_molecule)
+                for reference_molecule in reference_molecules
+            ]
+        else:
+            charge_cache = get_charge_cache()
+            futures = [
+                executor.submit(
+                    _find_reference_matches_with_charge_cache,
+                    self.__class__,
+                    parameter_handlers,
+                    reference_molecule,
+                    charge_cache,
+                )
+                for reference_molecule in reference_molecules
+            ]
+            reference_matches = list()
+            for future in futures:
+                matches, potentials, new_charges = future.result()
+                # Charges stored by worker processes are lost unless the store is shared
+                # between processes, i.e. on disk, so they are copied into this one
+                for mapped_smiles, method, charges in new_charges:
+                    if charge_cache.get(mapped_smiles, method) is None:
+                        charge_cache.set(mapped_smiles, method, charges)
+                reference_matches.append((matches, potentials))
+
+        for reference_molecule, (matches, potentials) in zip(
+            reference_molecules, reference_matches
+        ):
 
             match_mults = defaultdict(set)
 
             for top_key in matches:
                 match_mults[top_key.atom_indices].add(top_key.mult)
 
-            self.potentials.update(potentials)
+            self.potentials.update(
+                {
+                    potential_key: intern_potential(potential)
+                    for potential_key, potential in potentials.items()
+                }
+            )
 
             for top_mol in topology._reference_molecule_to_topology_molecules[
                 reference_molecule
@@ -1408,9 +1727,10 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
         """Store VirtualSite-specific parameter-like data."""
         if self.potentials:
             self.potentials = dict()
-        for potential_key in self.slot_map.values():
+        parameters_by_smirks = self._get_parameters_by_smirks(parameter_handler)
+        for potential_key in dict.fromkeys(self.slot_map.values()):
             smirks = potential_key.id
-            parameter_type = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter_type = parameters_by_smirks[smirks]
             potential = Potential(
                 parameters={
                     "distance": parameter_type.distance,
@@ -1421,7 +1741,7 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
                     potential.parameters.update(
                         {attr: from_openmm(getattr(parameter_type, attr))}
                     )
-            self.potentials[potential_key] = potential
+            self.potentials[potential_key] = intern_potential(potential)
 
     def _get_local_frame_weights(self, virtual_site_key: "VirtualSiteKey"):
         if virtual_site_key.type == "BondCharge":
@@ -1486,6 +1806,40 @@ def library_charge_from_molecule(
     return library_charge_type
 
 
+def _find_reference_matches_with_charge_cache(
+    handler_class: Type[SMIRNOFFElectrostaticsHandler],
+    parameter_handlers: Dict[str, "ElectrostaticsHandlerType"],
+    reference_molecule: Molecule,
+    charge_cache: "ChargeCache",
+) -> Tuple[
+    Dict[TopologyKey, PotentialKey],
+    Dict[PotentialKey, Potential],
+    List[Tuple[str, str, List[float]]],
+]:
+    """
+    Find charges of a reference molecule, i.e. in a worker process, using a given charge store.
+
+    Also returns the charges stored while doing so, which the calling process copies into its
+    own store.
+    """
+    if charge_cache is get_charge_cache():
+        # Called from the process owning the store, i.e. by a thread pool
+        return (
+            *handler_class._find_reference_matches(
+                parameter_handlers, reference_molecule
+            ),
+            list(),
+        )
+
+    recording_charge_cache = _RecordingChargeCache(charge_cache)
+    set_charge_cache(recording_charge_cache)
+
+    return (
+        *handler_class._find_reference_matches(parameter_handlers, reference_molecule),
+        recording_charge_cache.new_charges,
+    )
+
+
 def _get_interpolation_coeffs(fractional_bond_order, data):
     x1, x2 = data.keys()
     coeff1 = (x2 - fractional_bond_order) / (x2 - x1)
@@ -3,6 +3,7 @@ from openff.interchange.drivers.all import get_all_energies
 from openff.interchange.drivers.amber import get_amber_energies
 from openff.interchange.drivers.gromacs import get_gromacs_energies
 from openff.interchange.drivers.lammps import get_lammps_energies
+from openff.interchange.drivers.numpy import get_numpy_energies
 from openff.interchange.drivers.openmm import get_openmm_energies
 
 __all__ = [
@@ -10,5 +11,6 @@ __all__ = [
     "get_gromacs_energies",
     "get_lammps_energies",
     "get_amber_energies",
+    "get_numpy_energies",
     "get_all_energies",
 ]
@@ -1,6 +1,10 @@
 """Functions for running energy evluations with all available engines."""
-from typing import TYPE_CHECKING, Dict
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from distutils.spawn import find_executable
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from openff.units import unit
 from openff.utilities.utilities import requires_package
 
 from openff.interchange.drivers.amber import get_amber_energies
@@ -16,34 +20,131 @@ if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
 
 
-def get_all_energies(interchange: "Interchange") -> Dict[str, EnergyReport]:
+logger = logging.getLogger(__name__)
+
+# The name, executable and driver of each engine run in a subprocess
+_EXTERNAL_ENGINES = [
+    ("Amber", "sander", get_amber_energies),
+    ("GROMACS", "gmx", get_gromacs_energies),
+    ("LAMMPS", "lmp_serial", get_lammps_energies),
+]
+
+
+def get_all_energies(
+    interchange: "Interchange",
+    timeout: Optional[float] = None,
+) -> Dict[str, EnergyReport]:
     """
     Given an Interchange object, return single-point energies as computed by all available engines.
+
+    Engines other than OpenMM are run concurrently, each in its own subprocess and directory.
+    Engines that are not installed are skipped. If an engine fails or times out, its energies
+    are reported as NaN, and energies from other engines are still returned.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute the single-point energy of
+    timeout : float, optional
+        The number of seconds to wait for the commands run by each engine, together, before
+        they are stopped. If None, wait indefinitely.
+
+    Returns
+    -------
+    all_energies : dict of str: EnergyReport
+        An `EnergyReport` object of each engine, keyed by the name of the engine.
+
+    """
+    return get_all_energies_batch([interchange], timeout=timeout)[0]
+
+
+def get_all_energies_batch(
+    interchanges: List["Interchange"],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[Dict[str, EnergyReport]]:
+    """
+    Given many Interchange objects, return single-point energies of each as computed by all
+    available engines.
+
+    Engines other than OpenMM are run concurrently, each in its own subprocess and directory,
+    while OpenMM energies are evaluated in this process. Engines that are not installed are
+    skipped. If an engine fails or times out, its energies are reported as NaN, and energies
+    from other engines are still returned.
+
+    Parameters
+    ----------
+    interchanges : list of openff.interchange.components.interchange.Interchange
+        OpenFF Interchange objects to compute the single-point energies of
+    max_workers : int, optional
+        The maximum number of engines to run at once. If None, as many as there are available
+        engines other than OpenMM, so that each Interchange object is evaluated by all engines
+        at once.
+    timeout : float, optional
+        The number of seconds to wait for the commands run by each engine, together, before
+        they are stopped. If None, wait indefinitely.
+
+    Returns
+    -------
+    all_energies : list of dict of str: EnergyReport
+        An `EnergyReport` object of each engine, keyed by the name of the engine, for each
+        Interchange object in the order given.
+
     """
-    # TODO: Return something nan-like if one driver fails, but still return others that succeed
     # TODO: Have each driver return the version of the engine that was used
+    engines = [
+        engine for engine in _EXTERNAL_ENGINES if find_executable(engine[1]) is not None
+    ]
 
-    all_energies = {
-        "OpenMM": get_openmm_energies(interchange),
-    }
+    all_energies: List[Dict[str, EnergyReport]] = list()
 
-    for engine_name, engine_driver, engine_exception in [
-        ("Amber", get_amber_energies, AmberError),
-        ("GROMACS", get_gromacs_energies, GMXRunError),
-        ("LAMMPS", get_lammps_energies, LAMMPSRunError),
-    ]:
-        try:
-            all_energies[engine_name] = engine_driver(interchange)  # type: ignore[operator]
-        except engine_exception:
-            pass
+    with ThreadPoolExecutor(
+        max_workers=max_workers or max(len(engines), 1)
+    ) as executor:
+        futures: List[Dict[str, Future]] = [
+            {
+                engine_name: executor.submit(
+                    engine_driver, interchange, timeout=timeout  # type: ignore[operator]
+                )
+                for engine_name, _, engine_driver in engines
+            }
+            for interchange in interchanges
+        ]
+
+        for interchange, engine_futures in zip(interchanges, futures):
+            energies = {"OpenMM": get_openmm_energies(interchange)}
+
+            for engine_name, _, _ in engines:
+                try:
+                    energies[engine_name] = engine_futures[engine_name].result()
+                except (Exception, AmberError, GMXRunError, LAMMPSRunError):
+                    # Any error, i.e. a failed run, a timeout or malformed output, only
+                    # affects the energies of this engine. Errors raised by the drivers
+                    # for failed runs do not derive from Exception, so are listed
+                    logger.warning(
+                        f"Failed to evaluate energies with {engine_name}",
+                        exc_info=True,
+                    )
+                    energies[engine_name] = _get_failed_report()
+
+            all_energies.append(energies)
 
     return all_energies
 
 
+def _get_failed_report() -> EnergyReport:
+    """Return a report of NaN energies, standing in for that of an engine that failed."""
+    return EnergyReport(
+        energies={
+            energy_type: float("nan") * unit.kilojoule / unit.mol
+            for energy_type in ["Bond", "Angle", "Torsion", "vdW", "Electrostatics"]
+        }
+    )
+
+
 @requires_package("pandas")
 def get_summary_data(interchange: "Interchange") -> "DataFrame":
     """Return a pandas DataFrame with summaries of energies from all available engines."""
-    from openff.units import unit
     from pandas import DataFrame
 
     kj_mol = unit.kilojoule / unit.mol
@@ -1,16 +1,21 @@
 """Functions for running energy evluations with Amber."""
-import subprocess
 import tempfile
 from distutils.spawn import find_executable
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
+import numpy as np
 from openff.units import unit
-from openff.utilities.utilities import temporary_cd
 from openmm import unit as omm_unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.utils import (
+    _get_deadline,
+    _get_frame_positions,
+    _get_interchange_with_positions,
+    _run_command,
+)
 from openff.interchange.exceptions import (
     AmberError,
     AmberExecutableNotFoundError,
@@ -74,6 +79,7 @@ def get_amber_energies(
     off_sys: Interchange,
     writer: str = "internal",
     electrostatics=True,
+    timeout: Optional[float] = None,
 ) -> EnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by Amber.
@@ -89,6 +95,9 @@ def get_amber_energies(
     electrostatics : bool, default=True
         A boolean indicating whether or not electrostatics should be included in the energy
         calculation.
+    timeout : float, optional
+        The number of seconds to wait for `sander` before it is stopped and
+        `subprocess.TimeoutExpired` is raised. If None, wait indefinitely.
 
     Returns
     -------
@@ -96,38 +105,128 @@ def get_amber_energies(
         An `EnergyReport` object containing the single-point energies.
 
     """
+    # Files are written to, and sander run in, a directory of its own without changing the
+    # working directory of this process, so that drivers can safely run in many threads
     with tempfile.TemporaryDirectory() as tmpdir:
-        with temporary_cd(tmpdir):
-            if writer == "internal":
-                off_sys.to_inpcrd("out.inpcrd")
-                off_sys.to_prmtop("out.prmtop")
-            elif writer == "parmed":
-                struct = off_sys._to_parmed()
-                struct.save("out.inpcrd")
-                struct.save("out.prmtop")
-            else:
-                raise Exception(f"Unsupported `writer` argument {writer}")
+        if writer == "internal":
+            off_sys.to_inpcrd(Path(tmpdir, "out.inpcrd"))
+            off_sys.to_prmtop(Path(tmpdir, "out.prmtop"))
+        elif writer == "parmed":
+            struct = off_sys._to_parmed()
+            struct.save(str(Path(tmpdir, "out.inpcrd")))
+            struct.save(str(Path(tmpdir, "out.prmtop")))
+        else:
+            raise Exception(f"Unsupported `writer` argument {writer}")
 
-            from openff.interchange.drivers.utils import _infer_constraints
+        from openff.interchange.drivers.utils import _infer_constraints
 
-            inferred_constraints = _infer_constraints(off_sys)
-            if inferred_constraints == "none":
-                input_file = get_test_file_path("run.in")
-            elif inferred_constraints == "h-bonds":
-                input_file = get_test_file_path("h-bonds.in")
-            else:
-                raise Exception(
-                    "Amber drive can only support none and h-bond constraints. Inferred a value of "
-                    f"{inferred_constraints}"
-                )
-
-            report = _run_sander(
-                prmtop_file="out.prmtop",
-                inpcrd_file="out.inpcrd",
-                input_file=input_file,
-                electrostatics=electrostatics,
+        inferred_constraints = _infer_constraints(off_sys)
+        if inferred_constraints == "none":
+            input_file = get_test_file_path("run.in")
+        elif inferred_constraints == "h-bonds":
+            input_file = get_test_file_path("h-bonds.in")
+        else:
+            raise Exception(
+                "Amber drive can only support none and h-bond constraints. Inferred a value of "
+                f"{inferred_constraints}"
             )
-            return report
+
+        report = _run_sander(
+            prmtop_file="out.prmtop",
+            inpcrd_file="out.inpcrd",
+            input_file=input_file,
+            electrostatics=electrostatics,
+            working_directory=tmpdir,
+            timeout=timeout,
+        )
+        return report
+
+
+def get_amber_rerun_energies(
+    off_sys: Interchange,
+    positions,
+    timeout: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Given many frames of an OpenFF Interchange object, return the energies of each as computed
+    by Amber.
+
+    The topology is written once, and all frames are written to a single trajectory whose
+    energies are evaluated with one call to `sander` with ``imin=5``. Frames are written to a
+    precision of 0.001 Angstrom. The positions of the Interchange object are neither used nor
+    modified.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute single-point energies of
+    positions : openff.units.Quantity or np.ndarray
+        The positions of the atoms of each frame, of shape ``(n_frames, n_atoms, 3)``. If not
+        a quantity, positions are assumed to be in nanometers.
+    timeout : float, optional
+        The number of seconds to wait for `sander` before it is stopped and
+        `subprocess.TimeoutExpired` is raised. If None, wait indefinitely.
+
+    Returns
+    -------
+    energies : np.ndarray
+        An array of shape ``(n_frames, n_terms)`` of energies in kJ/mol. Columns are ordered as
+        the energies in the `EnergyReport` returned by ``get_amber_energies``.
+
+    """
+    from openff.interchange.drivers.utils import _infer_constraints
+    from openff.interchange.interop.internal.amber import to_mdcrd
+
+    positions = _get_frame_positions(off_sys, positions)
+
+    if len(positions) == 0:
+        return np.array([])
+
+    inferred_constraints = _infer_constraints(off_sys)
+    if inferred_constraints == "none":
+        input_file = get_test_file_path("run.in")
+    elif inferred_constraints == "h-bonds":
+        input_file = get_test_file_path("h-bonds.in")
+    else:
+        raise Exception(
+            "Amber drive can only support none and h-bond constraints. Inferred a value of "
+            f"{inferred_constraints}"
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # sander reads the number of atoms and the box from a single set of coordinates
+        _get_interchange_with_positions(off_sys, positions[0]).to_inpcrd(
+            Path(tmpdir, "out.inpcrd")
+        )
+        off_sys.to_prmtop(Path(tmpdir, "out.prmtop"))
+        to_mdcrd(off_sys, Path(tmpdir, "frames.mdcrd"), positions)
+
+        # Evaluate energies of each frame of a trajectory, with otherwise the same settings
+        with open(input_file) as single_point_input:
+            rerun_input = single_point_input.read().replace("imin=1,", "imin=5,")
+        with open(Path(tmpdir, "rerun.in"), "w") as rerun_input_file:
+            rerun_input_file.write(rerun_input)
+
+        frames = _run_sander(
+            prmtop_file="out.prmtop",
+            inpcrd_file="out.inpcrd",
+            input_file="rerun.in",
+            working_directory=tmpdir,
+            timeout=timeout,
+            trajectory_file="frames.mdcrd",
+        )
+
+    return np.array(
+        [
+            [
+                energy.m_as(unit.kilojoule / unit.mol)
+                for energy in report.energies.values()
+            ]
+            for report in frames
+        ]
+    )
 
 
 def _run_sander(
@@ -135,10 +234,16 @@ def _run_sander(
     prmtop_file: Union[Path, str],
     input_file: Union[Path, str],
     electrostatics=True,
+    working_directory: Optional[Union[Path, str]] = None,
+    timeout: Optional[float] = None,
+    trajectory_file: Optional[Union[Path, str]] = None,
 ):
     """
     Given Amber files, return single-point energies as computed by Amber.
 
+    If a trajectory is given, with an input file using ``imin=5``, energies of each of its
+    frames are evaluated and a list of reports is returned.
+
     Parameters
     ----------
     prmtop_file : str or pathlib.Path
@@ -150,11 +255,20 @@ def _run_sander(
     electrostatics : bool, default=True
         A boolean indicated whether or not electrostatics should be included in the energy
         calculation.
+    working_directory : str or pathlib.Path, optional
+        The directory to run sander in, which relative paths are relative to. If None, the
+        current working directory is used.
+    timeout : float, optional
+        The number of seconds to wait for `sander` before it is stopped and
+        `subprocess.TimeoutExpired` is raised. If None, wait indefinitely.
+    trajectory_file : str or pathlib.Path, optional
+        The path to an Amber trajectory (`.mdcrd`) file.
 
     Returns
     -------
-    report : EnergyReport
-        An `EnergyReport` object containing the single-point energies.
+    report : EnergyReport or list of EnergyReport
+        An `EnergyReport` object containing the single-point energies, or one for each frame of
+        a trajectory.
 
     """
     if not find_executable("sander"):
@@ -163,25 +277,36 @@ def _run_sander(
             "the Amber executables are installed and in your PATH."
         )
 
-    sander_cmd = (
-        f"sander -i {input_file} -c {inpcrd_file} -p {prmtop_file} -o out.mdout -O"
-    )
+    sander_cmd = ["sander", "-i", str(input_file), "-c", str(inpcrd_file)]
+    sander_cmd += ["-p", str(prmtop_file), "-o", "out.mdout", "-O"]
+    if trajectory_file is not None:
+        sander_cmd += ["-y", str(trajectory_file)]
 
-    sander = subprocess.Popen(
+    sander = _run_command(
         sander_cmd,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
+        working_directory=working_directory,
+        deadline=_get_deadline(timeout),
     )
 
-    _, err = sander.communicate()
-
     if sander.returncode:
-        raise SanderError(err)
+        raise SanderError(sander.stderr)
+
+    if trajectory_file is not None:
+        # mdinfo only holds the energies of the last frame
+        return [
+            _get_amber_energy_report(energies)
+            for energies in _group_energy_terms_of_frames(
+                str(Path(working_directory or ".", "out.mdout"))
+            )
+        ]
 
-    energies, _ = _group_energy_terms("mdinfo")
+    energies, _ = _group_energy_terms(str(Path(working_directory or ".", "mdinfo")))
 
+    return _get_amber_energy_report(energies)
+
+
+def _get_amber_energy_report(energies: Dict) -> EnergyReport:
+    """Group energies parsed from Amber output into a report."""
     energy_report = EnergyReport(
         energies={
             "Bond": energies["BOND"],
@@ -221,12 +346,50 @@ def _group_energy_terms(mdinfo: str):
             "output file: {}".format(mdinfo)
         )
 
+    return _parse_energy_terms(all_lines[startline + 1 :]), mdinfo
+
+
+def _group_energy_terms_of_frames(mdout: str) -> List[Dict]:
+    """
+    Parse an AMBER output file written with ``imin=5`` and group the energy terms of each frame
+    in a dict.
+    """
+    with open(mdout) as f:
+        all_lines = f.readlines()
+
+    frame_starts = [
+        i for i, line in enumerate(all_lines) if "minimizing coord set" in line
+    ]
+
+    if not frame_starts:
+        raise AmberError(
+            f"Unable to detect energies of any frames in AMBER output file: {mdout}"
+        )
+
+    frames = list()
+    for start, end in zip(frame_starts, frame_starts[1:] + [len(all_lines)]):
+        # Take the last, i.e. final, energies reported for each frame
+        for i in reversed(range(start, end)):
+            if all_lines[i][0:8] == "   NSTEP":
+                frames.append(_parse_energy_terms(all_lines[i + 3 : end]))
+                break
+        else:
+            raise AmberError(
+                "Unable to detect where energy info starts in AMBER output file "
+                f"{mdout}, after line {start + 1}"
+            )
+
+    return frames
+
+
+def _parse_energy_terms(lines: List[str]) -> Dict:
+    """Parse consecutive lines of energy terms in AMBER output, and their total."""
     # Strange ranges for amber file data.
     ranges = [[1, 24], [26, 49], [51, 77]]
 
     e_out = dict()
     potential = 0 * omm_unit.kilocalories_per_mole
-    for line in all_lines[startline + 1 :]:
+    for line in lines:
         if "=" in line:
             for i in range(3):
                 r = ranges[i]
@@ -241,7 +404,7 @@ def _group_energy_terms(mdinfo: str):
             break
     e_out["ENERGY"] = potential
 
-    return e_out, mdinfo
+    return e_out
 
 
 def _get_amber_energy_vdw(amber_energies: Dict):
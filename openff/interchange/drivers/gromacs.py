@@ -1,14 +1,19 @@
 """Functions for running energy evluations with GROMACS."""
-import subprocess
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
+import numpy as np
 from openff.units import unit
-from openff.utilities.utilities import requires_package, temporary_cd
+from openff.utilities.utilities import requires_package
 
 from openff.interchange.drivers.report import EnergyReport
-from openff.interchange.drivers.utils import _infer_constraints
+from openff.interchange.drivers.utils import (
+    _get_deadline,
+    _get_frame_positions,
+    _infer_constraints,
+    _run_command,
+)
 from openff.interchange.exceptions import (
     GMXGromppError,
     GMXMdrunError,
@@ -43,8 +48,10 @@ constraints              = none
 """
 
 
-def _write_mdp_file(openff_sys: "Interchange"):
-    with open("auto_generated.mdp", "w") as mdp_file:
+def _write_mdp_file(
+    openff_sys: "Interchange", file_path: Union[Path, str] = "auto_generated.mdp"
+):
+    with open(file_path, "w") as mdp_file:
         mdp_file.write(MDP_HEADER)
 
         if openff_sys.box is not None:
@@ -111,6 +118,7 @@ def get_gromacs_energies(
     mdp: str = "auto",
     writer: str = "internal",
     decimal: int = 8,
+    timeout: Optional[float] = None,
 ) -> EnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by GROMACS.
@@ -128,6 +136,10 @@ def get_gromacs_energies(
         default value of `"internal"` results in this package's exporters being used.
     decimal : int, default=8
         A decimal precision for the positions in the `.gro` file.
+    timeout : float, optional
+        The number of seconds to wait for the GROMACS commands, `gmx grompp` and `gmx mdrun`
+        together, before they are stopped and `subprocess.TimeoutExpired` is raised. If
+        None, wait indefinitely.
 
     Returns
     -------
@@ -135,19 +147,103 @@ def get_gromacs_energies(
         An `EnergyReport` object containing the single-point energies.
 
     """
+    # Files are written to, and GROMACS run in, a directory of its own without changing the
+    # working directory of this process, so that drivers can safely run in many threads
     with tempfile.TemporaryDirectory() as tmpdir:
-        with temporary_cd(tmpdir):
-            off_sys.to_gro("out.gro", writer=writer, decimal=decimal)
-            off_sys.to_top("out.top", writer=writer)
-            if mdp == "auto":
-                _write_mdp_file(off_sys)
-            report = _run_gmx_energy(
-                top_file="out.top",
-                gro_file="out.gro",
-                mdp_file=_get_mdp_file(mdp),
-                maxwarn=2,
-            )
-            return report
+        off_sys.to_gro(Path(tmpdir, "out.gro"), writer=writer, decimal=decimal)
+        off_sys.to_top(Path(tmpdir, "out.top"), writer=writer)
+        if mdp == "auto":
+            _write_mdp_file(off_sys, Path(tmpdir, "auto_generated.mdp"))
+        report = _run_gmx_energy(
+            top_file="out.top",
+            gro_file="out.gro",
+            mdp_file=_get_mdp_file(mdp),
+            maxwarn=2,
+            working_directory=tmpdir,
+            timeout=timeout,
+        )
+        return report
+
+
+def get_gromacs_rerun_energies(
+    off_sys: "Interchange",
+    positions,
+    mdp: str = "auto",
+    decimal: int = 8,
+    timeout: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Given many frames of an OpenFF Interchange object, return the energies of each as computed
+    by GROMACS.
+
+    The topology is written and `gmx grompp` run once. All frames are written to a single
+    trajectory, whose energies are evaluated with one call to `gmx mdrun -rerun`. The positions
+    of the Interchange object are neither used nor modified.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute single-point energies of
+    positions : openff.units.Quantity or np.ndarray
+        The positions of the atoms of each frame, of shape ``(n_frames, n_atoms, 3)``. If not
+        a quantity, positions are assumed to be in nanometers.
+    mdp : str, default="auto"
+        A string key identifying the GROMACS `.mdp` file to be used. See `_get_mdp_file`.
+    decimal : int, default=8
+        A decimal precision for the positions in the `.gro` files.
+    timeout : float, optional
+        The number of seconds to wait for the GROMACS commands, `gmx grompp` and `gmx mdrun`
+        together, before they are stopped and `subprocess.TimeoutExpired` is raised. If
+        None, wait indefinitely.
+
+    Returns
+    -------
+    energies : np.ndarray
+        An array of shape ``(n_frames, n_terms)`` of energies in kJ/mol. Columns are ordered as
+        the energies in the `EnergyReport` returned by ``get_gromacs_energies``.
+
+    """
+    from openff.interchange.interop.internal.gromacs import to_gro
+
+    positions = _get_frame_positions(off_sys, positions)
+
+    if len(positions) == 0:
+        return np.array([])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        to_gro(
+            off_sys, Path(tmpdir, "out.gro"), decimal=decimal, positions=positions[:1]
+        )
+        to_gro(
+            off_sys, Path(tmpdir, "frames.gro"), decimal=decimal, positions=positions
+        )
+        off_sys.to_top(Path(tmpdir, "out.top"))
+        if mdp == "auto":
+            _write_mdp_file(off_sys, Path(tmpdir, "auto_generated.mdp"))
+
+        edr_file = _run_gmx(
+            top_file="out.top",
+            gro_file="out.gro",
+            mdp_file=_get_mdp_file(mdp),
+            maxwarn=2,
+            working_directory=tmpdir,
+            timeout=timeout,
+            rerun_file="frames.gro",
+        )
+
+        reports = [
+            _get_gmx_energy_report(energies)
+            for energies in _read_gmx_energies(str(edr_file))
+        ]
+
+    return np.array(
+        [
+            [energy.m_as(kj_mol) for energy in report.energies.values()]
+            for report in reports
+        ]
+    )
 
 
 def _run_gmx_energy(
@@ -155,6 +251,8 @@ def _run_gmx_energy(
     gro_file: Union[Path, str],
     mdp_file: Union[Path, str],
     maxwarn: int = 1,
+    working_directory: Optional[Union[Path, str]] = None,
+    timeout: Optional[float] = None,
 ):
     """
     Given GROMACS files, return single-point energies as computed by GROMACS.
@@ -169,6 +267,13 @@ def _run_gmx_energy(
         The path to a GROMACS molecular dynamics parameters (`.mdp`) file.
     maxwarn : int, default=1
         The number of warnings to allow when `gmx grompp` is called (via the `-maxwarn` flag).
+    working_directory : str or pathlib.Path, optional
+        The directory to run GROMACS in, which relative paths are relative to. If None, the
+        current working directory is used.
+    timeout : float, optional
+        The number of seconds to wait for the GROMACS commands, `gmx grompp` and `gmx mdrun`
+        together, before they are stopped and `subprocess.TimeoutExpired` is raised. If
+        None, wait indefinitely.
 
     Returns
     -------
@@ -176,40 +281,60 @@ def _run_gmx_energy(
         An `EnergyReport` object containing the single-point energies.
 
     """
-    grompp_cmd = f"gmx grompp --maxwarn {maxwarn} -o out.tpr"
-    grompp_cmd += f" -f {mdp_file} -c {gro_file} -p {top_file}"
-
-    grompp = subprocess.Popen(
-        grompp_cmd,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
+    edr_file = _run_gmx(
+        top_file=top_file,
+        gro_file=gro_file,
+        mdp_file=mdp_file,
+        maxwarn=maxwarn,
+        working_directory=working_directory,
+        timeout=timeout,
     )
 
-    _, err = grompp.communicate()
+    report = _parse_gmx_energy(str(edr_file))
 
-    if grompp.returncode:
-        raise GMXGromppError(err)
+    return report
 
-    mdrun_cmd = "gmx mdrun -s out.tpr -e out.edr -ntmpi 1"
 
-    mdrun = subprocess.Popen(
-        mdrun_cmd,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
+def _run_gmx(
+    top_file: Union[Path, str],
+    gro_file: Union[Path, str],
+    mdp_file: Union[Path, str],
+    maxwarn: int = 1,
+    working_directory: Optional[Union[Path, str]] = None,
+    timeout: Optional[float] = None,
+    rerun_file: Optional[Union[Path, str]] = None,
+) -> Path:
+    """
+    Run `gmx grompp` and `gmx mdrun` on GROMACS files, returning the path to the energy file.
+
+    If a trajectory is given as ``rerun_file``, energies of each of its frames are evaluated
+    with `gmx mdrun -rerun`.
+    """
+    # grompp and mdrun share one deadline, so that the timeout applies to both together
+    deadline = _get_deadline(timeout)
+
+    grompp_cmd = ["gmx", "grompp", "--maxwarn", str(maxwarn), "-o", "out.tpr"]
+    grompp_cmd += ["-f", str(mdp_file), "-c", str(gro_file), "-p", str(top_file)]
+
+    grompp = _run_command(
+        grompp_cmd, working_directory=working_directory, deadline=deadline
     )
 
-    _, err = mdrun.communicate()
+    if grompp.returncode:
+        raise GMXGromppError(grompp.stderr)
 
-    if mdrun.returncode:
-        raise GMXMdrunError(err)
+    mdrun_cmd = ["gmx", "mdrun", "-s", "out.tpr", "-e", "out.edr", "-ntmpi", "1"]
+    if rerun_file is not None:
+        mdrun_cmd += ["-rerun", str(rerun_file)]
 
-    report = _parse_gmx_energy("out.edr")
+    mdrun = _run_command(
+        mdrun_cmd, working_directory=working_directory, deadline=deadline
+    )
 
-    return report
+    if mdrun.returncode:
+        raise GMXMdrunError(mdrun.stderr)
+
+    return Path(working_directory or ".", "out.edr")
 
 
 def _get_gmx_energy_vdw(gmx_energies: Dict):
@@ -247,27 +372,21 @@ def _get_gmx_energy_torsion(gmx_energies: Dict):
     return gmx_torsion
 
 
-@requires_package("panedr")
 def _parse_gmx_energy(edr_path: str) -> EnergyReport:
     """Parse an `.edr` file written by `gmx energy`."""
+    return _get_gmx_energy_report(_read_gmx_energies(edr_path)[0])
+
+
+@requires_package("panedr")
+def _read_gmx_energies(edr_path: str) -> List[Dict]:
+    """Read the energies of each frame in an `.edr` file, in order."""
     import panedr
 
     if TYPE_CHECKING:
         from pandas import DataFrame
 
-    df: DataFrame = panedr.edr_to_df("out.edr")
-    energies_dict: Dict = df.to_dict("index")  # type: ignore[assignment]
-    energies = energies_dict[0.0]
-    energies.pop("Time")
-
-    for key in energies:
-        energies[key] *= kj_mol
-
-    # TODO: Better way of filling in missing fields
-    # GROMACS may not populate all keys
-    for required_key in ["Bond", "Angle", "Proper Dih."]:
-        if required_key not in energies:
-            energies[required_key] = 0.0 * kj_mol
+    df: DataFrame = panedr.edr_to_df(edr_path)
+    frames: List[Dict] = df.to_dict("records")  # type: ignore[assignment]
 
     keys_to_drop = [
         "Kinetic En.",
@@ -282,10 +401,28 @@ def _parse_gmx_energy(edr_path: str) -> EnergyReport:
         "Vir-YZ",
         "Vir-XZ",
     ]
-    for key in keys_to_drop:
-        if key in energies.keys():
-            energies.pop(key)
 
+    for energies in frames:
+        energies.pop("Time")
+
+        for key in energies:
+            energies[key] *= kj_mol
+
+        # TODO: Better way of filling in missing fields
+        # GROMACS may not populate all keys
+        for required_key in ["Bond", "Angle", "Proper Dih."]:
+            if required_key not in energies:
+                energies[required_key] = 0.0 * kj_mol
+
+        for key in keys_to_drop:
+            if key in energies.keys():
+                energies.pop(key)
+
+    return frames
+
+
+def _get_gmx_energy_report(energies: Dict) -> EnergyReport:
+    """Group energies of one frame read from an `.edr` file into a report."""
     report = EnergyReport()
 
     report.update_energies(
@@ -1,6 +1,7 @@
 """Functions for running energy evluations with LAMMPS."""
-import subprocess
-from typing import List
+import tempfile
+from pathlib import Path
+from typing import List, Optional
 
 import numpy as np
 from openff.units import unit
@@ -8,6 +9,12 @@ from openmm import unit as omm_unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.utils import (
+    _get_deadline,
+    _get_frame_positions,
+    _get_interchange_with_positions,
+    _run_command,
+)
 from openff.interchange.exceptions import LAMMPSRunError
 
 
@@ -15,6 +22,7 @@ def get_lammps_energies(
     off_sys: Interchange,
     round_positions=None,
     writer: str = "internal",
+    timeout: Optional[float] = None,
 ) -> EnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by LAMMPS.
@@ -33,6 +41,9 @@ def get_lammps_energies(
     writer : str, default="internal"
         A string key identifying the backend to be used to write LAMMPS files. The
         default value of `"internal"` results in this package's exporters being used.
+    timeout : float, optional
+        The number of seconds to wait for LAMMPS before it is stopped and
+        `subprocess.TimeoutExpired` is raised. If None, wait indefinitely.
 
     Returns
     -------
@@ -43,37 +54,120 @@ def get_lammps_energies(
     if round_positions is not None:
         off_sys.positions = np.round(off_sys.positions, round_positions)
 
-    off_sys.to_lammps("out.lmp")
-    _write_lammps_input(
-        off_sys=off_sys,
-        file_name="tmp.in",
-    )
+    # Files are written to, and LAMMPS run in, a directory of its own without changing the
+    # working directory of this process, so that drivers can safely run in many threads
+    with tempfile.TemporaryDirectory() as tmpdir:
+        off_sys.to_lammps(Path(tmpdir, "out.lmp"))
+        _write_lammps_input(
+            off_sys=off_sys,
+            file_name=Path(tmpdir, "tmp.in"),
+        )
+
+        proc = _run_command(
+            ["lmp_serial", "-i", "tmp.in"],
+            working_directory=tmpdir,
+            deadline=_get_deadline(timeout),
+        )
 
-    run_cmd = "lmp_serial -i tmp.in"
+        if proc.returncode:
+            raise LAMMPSRunError(proc.stderr)
 
-    proc = subprocess.Popen(
-        run_cmd,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-    )
+        parsed_energies = _parse_lammps_log(Path(tmpdir, "log.lammps"))
+
+    return _get_lammps_energy_report(parsed_energies)
+
+
+def get_lammps_rerun_energies(
+    off_sys: Interchange,
+    positions,
+    timeout: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Given many frames of an OpenFF Interchange object, return the energies of each as computed
+    by LAMMPS.
+
+    The data file is written once, and all frames are written to a single dump file whose
+    energies are evaluated with one call to LAMMPS using the `rerun` command. The positions of
+    the Interchange object are neither used nor modified.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute single-point energies of
+    positions : openff.units.Quantity or np.ndarray
+        The positions of the atoms of each frame, of shape ``(n_frames, n_atoms, 3)``. If not
+        a quantity, positions are assumed to be in nanometers.
+    timeout : float, optional
+        The number of seconds to wait for LAMMPS before it is stopped and
+        `subprocess.TimeoutExpired` is raised. If None, wait indefinitely.
+
+    Returns
+    -------
+    energies : np.ndarray
+        An array of shape ``(n_frames, n_terms)`` of energies in kJ/mol. Columns are ordered as
+        the energies in the `EnergyReport` returned by ``get_lammps_energies``.
+
+    """
+    from openff.interchange.interop.internal.lammps import to_lammps_dump
+
+    positions = _get_frame_positions(off_sys, positions)
+
+    if len(positions) == 0:
+        return np.array([])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # The data file holds a single set of positions, which are replaced by each frame
+        first_frame = _get_interchange_with_positions(off_sys, positions[0])
+        first_frame.to_lammps(Path(tmpdir, "out.lmp"))
+        to_lammps_dump(off_sys, Path(tmpdir, "frames.dump"), positions)
+        _write_lammps_input(
+            off_sys=first_frame,
+            file_name=Path(tmpdir, "tmp.in"),
+            rerun_file="frames.dump",
+        )
+
+        proc = _run_command(
+            ["lmp_serial", "-i", "tmp.in"],
+            working_directory=tmpdir,
+            deadline=_get_deadline(timeout),
+        )
 
-    _, err = proc.communicate()
+        if proc.returncode:
+            raise LAMMPSRunError(proc.stderr)
 
-    if proc.returncode:
-        raise LAMMPSRunError(err)
+        frames = _parse_lammps_log_frames(Path(tmpdir, "log.lammps"))
 
+    if len(frames) != len(positions):
+        raise LAMMPSRunError(
+            f"Expected energies of {len(positions)} frames in the LAMMPS log, found "
+            f"{len(frames)}."
+        )
+
+    return np.array(
+        [
+            [
+                energy.m_as(unit.kilojoule / unit.mol)
+                for energy in _get_lammps_energy_report(frame).energies.values()
+            ]
+            for frame in frames
+        ]
+    )
+
+
+def _get_lammps_energy_report(parsed_energies: List[float]) -> EnergyReport:
+    """Group energies of one step parsed from a LAMMPS log file into a report."""
     # thermo_style custom ebond eangle edihed eimp epair evdwl ecoul elong etail pe
-    parsed_energies = omm_unit.kilocalorie_per_mole * _parse_lammps_log("log.lammps")
+    energies = omm_unit.kilocalorie_per_mole * parsed_energies
 
     report = EnergyReport(
         energies={
-            "Bond": parsed_energies[0],
-            "Angle": parsed_energies[1],
-            "Torsion": parsed_energies[2] + parsed_energies[3],
-            "vdW": parsed_energies[5] + parsed_energies[8],
-            "Electrostatics": parsed_energies[6] + parsed_energies[7],
+            "Bond": energies[0],
+            "Angle": energies[1],
+            "Torsion": energies[2] + energies[3],
+            "vdW": energies[5] + energies[8],
+            "Electrostatics": energies[6] + energies[7],
         }
     )
 
@@ -94,11 +188,37 @@ def _parse_lammps_log(file_in) -> List[float]:
     return data
 
 
+def _parse_lammps_log_frames(file_in) -> List[List[float]]:
+    """Parse a LAMMPS log file for energy components of each step."""
+    frames: List[List[float]] = list()
+    tag = False
+    with open(file_in) as fi:
+        for line in fi.readlines():
+            if tag:
+                try:
+                    data = [float(val) for val in line.split()]
+                except ValueError:
+                    data = []
+                if data:
+                    frames.append(data)
+                    continue
+                tag = False
+            if line.startswith("E_bond"):
+                tag = True
+
+    return frames
+
+
 def _write_lammps_input(
     off_sys: Interchange,
     file_name="test.in",
+    rerun_file: Optional[str] = None,
 ):
-    """Write a LAMMPS input file for running single-point energies."""
+    """
+    Write a LAMMPS input file for running single-point energies.
+
+    If a dump file is given as ``rerun_file``, energies of each of its frames are evaluated.
+    """
     with open(file_name, "w") as fo:
         fo.write(
             "units real\n" "atom_style full\n" "\n" "dimension 3\nboundary p p p\n\n"
@@ -161,4 +281,8 @@ def _write_lammps_input(
             # only specify kpsace if some charge is non-zero
             fo.write("kspace_style pppm 1e-6\n")
 
-        fo.write("run 0\n")
+        if rerun_file is None:
+            fo.write("run 0\n")
+        else:
+            fo.write("thermo 1\n")
+            fo.write(f"rerun {rerun_file} dump x y z\n")
@@ -0,0 +1,760 @@
+"""Functions for evaluating energies with NumPy, without a molecular simulation engine."""
+import itertools
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+from openff.units import unit
+
+from openff.interchange.components.interchange import Interchange
+from openff.interchange.components.mdtraj import _get_bonded_pairs
+from openff.interchange.components.potentials import PotentialHandler
+from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.exceptions import (
+    MissingPositionsError,
+    UnimplementedCutoffMethodError,
+    UnsupportedCutoffMethodError,
+)
+
+kj_mol = unit.kilojoule / unit.mol
+
+# 1 / (4 pi eps0) in kJ nm / (mol e^2), matching the value used by the OpenMM export
+_COULOMB_CONSTANT = 138.935456
+
+# The units of the parameters of each handler that are used in evaluating energies
+_PARAMETER_UNITS = {
+    "Bonds": {
+        "k": unit.kilojoule / unit.nanometer ** 2 / unit.mol,
+        "length": unit.nanometer,
+    },
+    "Angles": {
+        "k": unit.kilojoule / unit.radian ** 2 / unit.mol,
+        "angle": unit.radian,
+    },
+    "ProperTorsions": {
+        "k": unit.kilojoule / unit.mol,
+        "periodicity": unit.dimensionless,
+        "phase": unit.radian,
+        "idivf": unit.dimensionless,
+    },
+    "vdW": {
+        "sigma": unit.nanometer,
+        "epsilon": unit.kilojoule / unit.mol,
+    },
+    "Buckingham-6": {
+        "A": unit.kilojoule / unit.mol,
+        "B": unit.nanometer ** -1,
+        "C": unit.kilojoule / unit.mol * unit.nanometer ** 6,
+    },
+}
+_PARAMETER_UNITS["ImproperTorsions"] = _PARAMETER_UNITS["ProperTorsions"]
+
+# The number of pairs of particles to evaluate at once when not using a cutoff
+_PAIR_CHUNK_SIZE = 2 ** 22
+
+# The number of particles per cubic cutoff above which to use smaller cells in cell lists
+_DENSE_CELL_OCCUPANCY = 16
+
+# The dielectric constant beyond the cutoff of reaction-field electrostatics, matching the
+# default of OpenMM's NonbondedForce
+_REACTION_FIELD_DIELECTRIC = 78.3
+
+# The number of Gauss-Legendre quadrature points used to integrate long-range corrections
+_N_QUADRATURE_POINTS = 32
+
+PairEnergyFunction = Callable[[np.ndarray, np.ndarray, np.ndarray, bool], np.ndarray]
+
+
+def get_numpy_energies(off_sys: Interchange) -> EnergyReport:
+    """
+    Given an OpenFF Interchange object, return single-point energies as computed with NumPy.
+
+    Energies are evaluated directly from the data stored in each handler, so that no molecular
+    simulation engine is needed. Bonds, angles, periodic proper and improper torsions,
+    Lennard-Jones or Buckingham vdW interactions and electrostatics are supported. 1-2 and 1-3
+    interactions are excluded and 1-4 interactions are scaled by ``scale_14`` of each non-bonded
+    handler. Bonds that are constrained are not included.
+
+    Interactions using a cutoff are evaluated with a cell list, which scales linearly with the
+    number of particles. In periodic systems, including triclinic boxes, distances follow the
+    minimum image convention and a long-range correction is added to truncated Lennard-Jones
+    interactions. Cutoff and reaction-field electrostatics are supported in periodic systems.
+    Electrostatics without a cutoff, or using PME in a non-periodic system, are summed over all
+    pairs of particles, which scales quadratically with the number of particles.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute the single-point energy of
+
+    Returns
+    -------
+    report : EnergyReport
+        An `EnergyReport` object containing the single-point energies.
+
+    """
+    if off_sys.positions is None:
+        raise MissingPositionsError(
+            "Cannot evaluate energies of an Interchange without positions."
+        )
+
+    if "VirtualSites" in off_sys.handlers:
+        if len(off_sys["VirtualSites"].slot_map) > 0:
+            raise NotImplementedError(
+                "Evaluating energies of systems with virtual sites with NumPy is not yet "
+                "supported."
+            )
+
+    positions = np.asarray(off_sys.positions.m_as(unit.nanometer), dtype=float)
+
+    box = None
+    if off_sys.box is not None:
+        box, positions = _get_reduced_box(
+            np.asarray(off_sys.box.m_as(unit.nanometer), dtype=float), positions
+        )
+
+    report = EnergyReport()
+
+    report.update_energies(
+        {
+            "Bond": _get_bond_energy(off_sys, positions) * kj_mol,
+            "Angle": _get_angle_energy(off_sys, positions) * kj_mol,
+            "Torsion": _get_torsion_energy(off_sys, positions) * kj_mol,
+        }
+    )
+
+    report.update_energies(
+        {
+            energy_type: energy * kj_mol
+            for energy_type, energy in _get_nonbonded_energies(
+                off_sys, positions, box
+            ).items()
+        }
+    )
+
+    return report
+
+
+def _get_slot_parameters(
+    handler: PotentialHandler,
+    handler_name: str,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Return the atom indices and parameters of each slot of a handler.
+
+    Parameters are converted to the units in ``_PARAMETER_UNITS`` and interpolated if
+    wrapped. Slots are assumed to not include virtual sites.
+    """
+    parameter_units = _PARAMETER_UNITS[handler_name]
+    table = handler._get_coefficient_data()["potentials"]
+    topology_keys = list(handler.slot_map)
+
+    names = [*table[0].parameters] if table else [*parameter_units]
+    factors = np.array(
+        [
+            [
+                (1.0 * potential.parameters[name].units).m_as(parameter_units[name])
+                if name in parameter_units
+                else 1.0
+                for name in names
+            ]
+            for potential in table
+        ]
+    ).reshape(len(table), len(names))
+
+    p = np.asarray(handler.get_force_field_parameters(), dtype=float).reshape(
+        factors.shape
+    )
+    q = np.asarray(handler.get_system_parameters(p * factors)).reshape(
+        len(topology_keys), len(names)
+    )
+
+    n_atoms_per_slot = len(topology_keys[0].atom_indices) if topology_keys else 0
+    atom_indices = np.fromiter(
+        itertools.chain.from_iterable(key.atom_indices for key in topology_keys),
+        dtype=np.intp,
+        count=len(topology_keys) * n_atoms_per_slot,
+    ).reshape(-1, n_atoms_per_slot)
+
+    return atom_indices, {name: q[:, index] for index, name in enumerate(names)}
+
+
+def _get_bond_energy(off_sys: Interchange, positions: np.ndarray) -> float:
+    if "Bonds" not in off_sys.handlers:
+        return 0.0
+
+    handler = off_sys["Bonds"]
+    atom_indices, parameters = _get_slot_parameters(handler, "Bonds")
+
+    if "Constraints" in off_sys.handlers:
+        constraints = off_sys["Constraints"].slot_map
+        is_flexible = np.array(
+            [top_key not in constraints for top_key in handler.slot_map], dtype=bool
+        )
+        atom_indices = atom_indices[is_flexible]
+        parameters = {name: value[is_flexible] for name, value in parameters.items()}
+
+    r = np.linalg.norm(
+        positions[atom_indices[:, 1]] - positions[atom_indices[:, 0]], axis=-1
+    )
+
+    return float(np.sum(0.5 * parameters["k"] * (r - parameters["length"]) ** 2))
+
+
+def _get_angle_energy(off_sys: Interchange, positions: np.ndarray) -> float:
+    if "Angles" not in off_sys.handlers:
+        return 0.0
+
+    atom_indices, parameters = _get_slot_parameters(off_sys["Angles"], "Angles")
+
+    theta = _get_angles(positions, atom_indices)
+
+    return float(np.sum(0.5 * parameters["k"] * (theta - parameters["angle"]) ** 2))
+
+
+def _get_torsion_energy(off_sys: Interchange, positions: np.ndarray) -> float:
+    energy = 0.0
+
+    for handler_name in ["ProperTorsions", "ImproperTorsions"]:
+        if handler_name not in off_sys.handlers:
+            continue
+
+        atom_indices, parameters = _get_slot_parameters(
+            off_sys[handler_name], handler_name
+        )
+
+        phi = _get_dihedrals(positions, atom_indices)
+        idivf = parameters.get("idivf", 1.0)
+
+        energy += float(
+            np.sum(
+                parameters["k"]
+                / idivf
+                * (1 + np.cos(parameters["periodicity"] * phi - parameters["phase"]))
+            )
+        )
+
+    return energy
+
+
+def _get_angles(positions: np.ndarray, atom_indices: np.ndarray) -> np.ndarray:
+    """Return the angle, in radians, formed by each triplet of atoms."""
+    v1 = positions[atom_indices[:, 0]] - positions[atom_indices[:, 1]]
+    v2 = positions[atom_indices[:, 2]] - positions[atom_indices[:, 1]]
+
+    cos_theta = np.einsum("ij,ij->i", v1, v2) / (
+        np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+    )
+
+    return np.arccos(np.clip(cos_theta, -1.0, 1.0))
+
+
+def _get_dihedrals(positions: np.ndarray, atom_indices: np.ndarray) -> np.ndarray:
+    """Return the signed dihedral angle, in radians, formed by each quadruplet of atoms."""
+    b1 = positions[atom_indices[:, 1]] - positions[atom_indices[:, 0]]
+    b2 = positions[atom_indices[:, 2]] - positions[atom_indices[:, 1]]
+    b3 = positions[atom_indices[:, 3]] - positions[atom_indices[:, 2]]
+
+    n1 = np.cross(b1, b2)
+    n2 = np.cross(b2, b3)
+
+    y = np.linalg.norm(b2, axis=-1) * np.einsum("ij,ij->i", b1, n2)
+    x = np.einsum("ij,ij->i", n1, n2)
+
+    return np.arctan2(y, x)
+
+
+def _get_nonbonded_energies(
+    off_sys: Interchange, positions: np.ndarray, box: Optional[np.ndarray]
+) -> Dict[str, float]:
+    """
+    Return the vdW and electrostatics energies of a system.
+
+    Energies of all pairs of particles (within a cutoff, if used) are summed, then those of
+    excluded pairs are removed and those of 1-4 pairs are added back in with their scaling
+    factors. Like the 1-4 interactions of the OpenMM export, these are not truncated.
+    """
+    handlers: Dict[str, PotentialHandler] = dict()
+    energy_functions: Dict[str, Tuple[PairEnergyFunction, Optional[float]]] = dict()
+    energies = {energy_type: 0.0 for energy_type in ["vdW", "Electrostatics"]}
+
+    for handler_name in ["vdW", "Buckingham-6"]:
+        if handler_name in off_sys.handlers:
+            handlers["vdW"] = off_sys[handler_name]
+            energy_function, cutoff, energies["vdW"] = _get_vdw_function(
+                handlers["vdW"], handler_name, positions, box
+            )
+            energy_functions["vdW"] = (energy_function, cutoff)
+            break
+
+    if "Electrostatics" in off_sys.handlers:
+        handlers["Electrostatics"] = off_sys["Electrostatics"]
+        energy_functions["Electrostatics"] = _get_electrostatics_function(
+            handlers["Electrostatics"], len(positions), box
+        )
+
+    for handler in handlers.values():
+        if handler.scale_15 != 1.0:
+            raise NotImplementedError(
+                f"Scaling 1-5 interactions of the {handler.type} handler is not supported."
+            )
+
+    if not energy_functions:
+        return energies
+
+    cutoffs = [cutoff for _, cutoff in energy_functions.values()]
+    pair_cutoff = None if None in cutoffs else max(cutoffs)  # type: ignore[type-var]
+
+    for i, j, r in _iterate_pairs(positions, pair_cutoff, box):
+        for energy_type, (energy_function, _) in energy_functions.items():
+            energies[energy_type] += float(np.sum(energy_function(i, j, r, True)))
+
+    bonds = np.array(
+        [(bond.atom1.index, bond.atom2.index) for bond in off_sys.topology.mdtop.bonds],
+        dtype=np.intp,
+    ).reshape(-1, 2)
+    pairs_12, pairs_13, pairs_14 = _get_bonded_pairs(bonds)
+
+    for energy_type, (energy_function, _) in energy_functions.items():
+        handler = handlers[energy_type]
+
+        for pairs, scale in [
+            (pairs_12, 0.0),
+            (pairs_13, handler.scale_13),
+            (pairs_14, handler.scale_14),
+        ]:
+            i, j = pairs[:, 0], pairs[:, 1]
+            r = _get_distances(positions, i, j, box)
+
+            energies[energy_type] -= float(np.sum(energy_function(i, j, r, True)))
+            if scale != 0.0:
+                energies[energy_type] += scale * float(
+                    np.sum(energy_function(i, j, r, False))
+                )
+
+    return energies
+
+
+def _get_vdw_function(
+    handler: PotentialHandler,
+    handler_name: str,
+    positions: np.ndarray,
+    box: Optional[np.ndarray],
+) -> Tuple[PairEnergyFunction, Optional[float], float]:
+    """
+    Return a function of the vdW energy of pairs of atoms, the cutoff it uses, if any, and
+    the long-range correction to the energy of truncated Lennard-Jones interactions.
+
+    The function is called with the indices of the atoms in each pair, their distance, and
+    whether or not to apply the cutoff and any switching function.
+    """
+    method = handler.method.lower()
+
+    if method == "pme":
+        if box is None:
+            raise UnsupportedCutoffMethodError(
+                "vdW method pme/ljpme is not valid for non-periodic systems."
+            )
+        raise UnimplementedCutoffMethodError(
+            "vdW method pme/ljpme is not yet implemented in the NumPy driver."
+        )
+
+    if method == "no-cutoff" and box is not None:
+        raise UnsupportedCutoffMethodError(
+            "vdW method no-cutoff is not valid for periodic systems."
+        )
+
+    atom_indices, slot_parameters = _get_slot_parameters(handler, handler_name)
+
+    parameters = dict()
+    for name, values in slot_parameters.items():
+        parameters[name] = np.zeros(len(positions))
+        parameters[name][atom_indices[:, 0]] = values
+
+    cutoff: Optional[float] = None
+    switching_distance: Optional[float] = None
+
+    if method == "cutoff":
+        cutoff = handler.cutoff.m_as(unit.nanometer)
+
+        switch_width = getattr(handler, "switch_width", None)
+        if switch_width is not None and switch_width.m != 0.0:
+            switching_distance = cutoff - switch_width.m_as(unit.nanometer)
+            if switching_distance < 0:
+                raise UnsupportedCutoffMethodError(
+                    "Found a 'switch_width' greater than the cutoff distance. It's not clear "
+                    "what this means and it's probably invalid. Found "
+                    f"switch_width{handler.switch_width} and cutoff {handler.cutoff}"
+                )
+
+    if handler_name == "Buckingham-6":
+
+        def get_pair_energies(i, j, r):
+            a = np.sqrt(parameters["A"][i] * parameters["A"][j])
+            b = 2 / (1 / parameters["B"][i] + 1 / parameters["B"][j])
+            c = np.sqrt(parameters["C"][i] * parameters["C"][j])
+            return a * np.exp(-b * r) - c * r ** -6
+
+    else:
+        mixing_rule = handler.mixing_rule.lower()
+        if mixing_rule not in ["lorentz-berthelot", "geometric"]:
+            raise NotImplementedError(
+                f"Mixing rule `{mixing_rule}` is not supported. Supported values are "
+                "`lorentz-berthelot` and `geometric`."
+            )
+
+        def get_pair_energies(i, j, r):
+            sigma_i, sigma_j = parameters["sigma"][i], parameters["sigma"][j]
+            if mixing_rule == "lorentz-berthelot":
+                sigma = (sigma_i + sigma_j) * 0.5
+            else:
+                sigma = np.sqrt(sigma_i * sigma_j)
+            epsilon = np.sqrt(parameters["epsilon"][i] * parameters["epsilon"][j])
+            sigma_r_6 = (sigma / r) ** 6
+            return 4 * epsilon * (sigma_r_6 ** 2 - sigma_r_6)
+
+    def get_switching_function(r):
+        x = np.clip((r - switching_distance) / (cutoff - switching_distance), 0.0, 1.0)
+        return 1 - x ** 3 * (10 - 15 * x + 6 * x ** 2)
+
+    def energy_function(i, j, r, truncate):
+        energies = get_pair_energies(i, j, r)
+        if truncate and cutoff is not None:
+            energies = np.where(r < cutoff, energies, 0.0)
+            if switching_distance is not None:
+                energies = energies * get_switching_function(r)
+        return energies
+
+    # As in the OpenMM export, only Lennard-Jones interactions are corrected
+    long_range_correction = 0.0
+    if box is not None and cutoff is not None and handler_name == "vdW":
+        long_range_correction = _get_long_range_correction(
+            get_pair_energies,
+            parameters,
+            cutoff,
+            None if switching_distance is None else get_switching_function,
+            switching_distance,
+            abs(np.linalg.det(box)),
+        )
+
+    return energy_function, cutoff, long_range_correction
+
+
+def _get_long_range_correction(
+    get_pair_energies: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+    parameters: Dict[str, np.ndarray],
+    cutoff: float,
+    get_switching_function: Optional[Callable[[np.ndarray], np.ndarray]],
+    switching_distance: Optional[float],
+    volume: float,
+) -> float:
+    """
+    Return the long-range correction to the energy of a truncated pairwise interaction.
+
+    As in OpenMM's ``CustomNonbondedForce``, particles are assumed to be uniformly distributed
+    beyond the cutoff, and the correction is averaged over all pairs of particles, regardless
+    of any exclusions. The energy lost to the switching function, if any, is also included.
+    """
+    # Particles with the same parameters are grouped into classes
+    _, representatives, counts = np.unique(
+        np.stack([parameters[name] for name in sorted(parameters)], axis=1),
+        axis=0,
+        return_index=True,
+        return_counts=True,
+    )
+    first, second = np.triu_indices(len(counts))
+    i = representatives[first][:, None]
+    j = representatives[second][:, None]
+    n_pairs = np.where(
+        first == second,
+        counts[first] * (counts[first] + 1) / 2,
+        counts[first] * counts[second],
+    )
+
+    nodes, weights = np.polynomial.legendre.leggauss(_N_QUADRATURE_POINTS)
+    nodes, weights = (nodes + 1) / 2, weights / 2
+
+    # Substitute u = cutoff / r to integrate energy * r ** 2 from the cutoff to infinity
+    r = cutoff / nodes
+    integrals = cutoff ** 3 * np.sum(
+        weights * get_pair_energies(i, j, r) * nodes ** -4, axis=1
+    )
+
+    if get_switching_function is not None:
+        width = cutoff - switching_distance  # type: ignore[operator]
+        r = switching_distance + width * nodes
+        integrals += width * np.sum(
+            weights
+            * get_pair_energies(i, j, r)
+            * (1 - get_switching_function(r))
+            * r ** 2,
+            axis=1,
+        )
+
+    n_particles = counts.sum()
+    mean_integral = np.sum(n_pairs * integrals) / (n_particles * (n_particles + 1) / 2)
+
+    return float(2 * np.pi * n_particles ** 2 * mean_integral / volume)
+
+
+def _get_electrostatics_function(
+    handler: PotentialHandler, n_atoms: int, box: Optional[np.ndarray]
+) -> Tuple[PairEnergyFunction, Optional[float]]:
+    """
+    Return a function of the electrostatic energy of pairs of atoms, and the cutoff it uses.
+
+    Without a periodic box, PME reduces to the Coulomb interaction of all pairs of atoms.
+    Reaction-field electrostatics follow OpenMM, in which excluded pairs do not interact.
+    """
+    method = handler.method.lower()
+
+    if box is not None:
+        if method == "pme":
+            raise UnimplementedCutoffMethodError(
+                "Electrostatics method pme is not yet implemented in the NumPy driver."
+            )
+        if method == "no-cutoff":
+            raise UnsupportedCutoffMethodError(
+                "Electrostatics method no-cutoff is not valid for periodic systems."
+            )
+
+    try:
+        charges = np.asarray(handler.get_charge_array(), dtype=float)
+    except AttributeError:
+        charges = np.zeros(n_atoms)
+        for top_key, charge in handler.charges.items():
+            charges[top_key.atom_indices[0]] = charge.m_as(unit.elementary_charge)
+
+    cutoff: Optional[float] = None
+    if method in ["cutoff", "reaction-field"]:
+        cutoff = handler.cutoff.m_as(unit.nanometer)
+
+    k_rf = 0.0
+    c_rf = 0.0
+    if method == "reaction-field":
+        k_rf = (_REACTION_FIELD_DIELECTRIC - 1) / (
+            (2 * _REACTION_FIELD_DIELECTRIC + 1) * cutoff ** 3  # type: ignore[operator]
+        )
+        c_rf = 1 / cutoff + k_rf * cutoff ** 2  # type: ignore[operator]
+
+    def energy_function(i, j, r, truncate):
+        if truncate and cutoff is not None:
+            energies = (
+                _COULOMB_CONSTANT
+                * charges[i]
+                * charges[j]
+                * (1 / r + k_rf * r ** 2 - c_rf)
+            )
+            return np.where(r < cutoff, energies, 0.0)
+        return _COULOMB_CONSTANT * charges[i] * charges[j] / r
+
+    return energy_function, cutoff
+
+
+def _get_reduced_box(
+    box: np.ndarray, positions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return box vectors in reduced form, and positions rotated to match if needed.
+
+    In reduced form, as used by OpenMM, the first vector lies along x and the second in the xy
+    plane, and each vector is as short as possible given those before it. The lattice, and so
+    any energy, is unchanged.
+    """
+    box = np.array(box, dtype=float)
+
+    if np.any(np.triu(box, 1) != 0):
+        q, r = np.linalg.qr(box.T)
+        signs = np.where(np.diag(r) < 0, -1.0, 1.0)
+        box = (signs[:, None] * r).T
+        positions = positions @ (q * signs)
+
+    box[2] -= box[1] * np.round(box[2, 1] / box[1, 1])
+    box[2] -= box[0] * np.round(box[2, 0] / box[0, 0])
+    box[1] -= box[0] * np.round(box[1, 0] / box[0, 0])
+
+    return box, positions
+
+
+def _apply_minimum_image(
+    dx: np.ndarray, dy: np.ndarray, dz: np.ndarray, box: np.ndarray
+) -> None:
+    """Shift displacements in a reduced box to their nearest periodic images, in place."""
+    shift = np.round(dz / box[2, 2])
+    dx -= shift * box[2, 0]
+    dy -= shift * box[2, 1]
+    dz -= shift * box[2, 2]
+
+    shift = np.round(dy / box[1, 1])
+    dx -= shift * box[1, 0]
+    dy -= shift * box[1, 1]
+
+    dx -= np.round(dx / box[0, 0]) * box[0, 0]
+
+
+def _get_distances(
+    positions: np.ndarray, i: np.ndarray, j: np.ndarray, box: Optional[np.ndarray]
+) -> np.ndarray:
+    """Return the distance between each pair of particles, following minimum image if periodic."""
+    dx, dy, dz = (positions[j, axis] - positions[i, axis] for axis in range(3))
+
+    if box is not None:
+        _apply_minimum_image(dx, dy, dz, box)
+
+    return np.sqrt(dx ** 2 + dy ** 2 + dz ** 2)
+
+
+def _iterate_pairs(
+    positions: np.ndarray, cutoff: Optional[float], box: Optional[np.ndarray]
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Iterate over chunks of the indices and distance of pairs of particles.
+
+    If a cutoff is given, only pairs closer than it are included, found with a cell list.
+    Otherwise, all pairs are included.
+    """
+    if cutoff is None:
+        yield from _iterate_all_pairs(positions)
+    else:
+        yield from _iterate_neighbor_pairs(positions, cutoff, box)
+
+
+def _iterate_all_pairs(
+    positions: np.ndarray,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    n_particles = len(positions)
+    rows_per_chunk = max(1, _PAIR_CHUNK_SIZE // max(n_particles, 1))
+
+    for start in range(0, n_particles, rows_per_chunk):
+        rows = np.arange(start, min(start + rows_per_chunk, n_particles))
+        counts = n_particles - rows - 1
+        i = np.repeat(rows, counts)
+        j = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts) + i + 1
+        r = np.linalg.norm(positions[j] - positions[i], axis=-1)
+        yield i, j, r
+
+
+def _iterate_neighbor_pairs(
+    positions: np.ndarray, cutoff: float, box: Optional[np.ndarray] = None
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Iterate over pairs of particles closer than a cutoff, using a cell list.
+
+    Particles are binned into cells, and each pair of nearby cells is visited once. Only
+    occupied cells are stored, so that memory scales with the number of particles and not the
+    volume they occupy. In a periodic system, given a box in reduced form, cells tile the box
+    and distances follow the minimum image convention.
+    """
+    n_particles = len(positions)
+
+    if box is None:
+        lower = positions.min(axis=0)
+        extent = np.maximum(positions.max(axis=0) - lower, cutoff)
+        volume = np.prod(extent)
+    else:
+        volume = abs(np.linalg.det(box))
+        # The distance between opposite faces of the box
+        widths = volume / np.linalg.norm(
+            np.cross(box[[1, 2, 0]], box[[2, 0, 1]]), axis=1
+        )
+        if 2 * cutoff > widths.min():
+            raise UnsupportedCutoffMethodError(
+                f"The cutoff {cutoff} nm is greater than half of the smallest width of the "
+                f"box, {widths.min()} nm."
+            )
+
+    # Smaller cells include fewer distant pairs, but are only worth visiting when dense
+    n_per_cutoff_cell = n_particles * cutoff ** 3 / volume
+    n_cells_per_cutoff = 2 if n_per_cutoff_cell > _DENSE_CELL_OCCUPANCY else 1
+
+    if box is None:
+        cell_size = cutoff / n_cells_per_cutoff
+        cells = np.floor((positions - lower) / cell_size).astype(np.int64)
+
+        # Pad the grid so that neighbors of occupied cells never wrap around
+        shape = cells.max(axis=0) + 2 * n_cells_per_cutoff + 1
+        cells += n_cells_per_cutoff
+
+        # Offsets to half of the neighboring cells, so that each pair of cells is visited once
+        span = range(-n_cells_per_cutoff, n_cells_per_cutoff + 1)
+        offsets = [
+            offset
+            for offset in itertools.product(span, span, span)
+            if offset >= (0, 0, 0)
+            and sum(max(abs(d) - 1, 0) ** 2 for d in offset) * cell_size ** 2
+            < cutoff ** 2
+        ]
+    else:
+        shape = np.maximum(np.floor(widths * n_cells_per_cutoff / cutoff), 1).astype(
+            np.int64
+        )
+        fractional = positions @ np.linalg.inv(box)
+        fractional -= np.floor(fractional)
+        cells = np.minimum(np.floor(fractional * shape).astype(np.int64), shape - 1)
+
+        # Particles closer than the cutoff are at most this many cells apart along each axis
+        reach = np.ceil(cutoff * shape / widths).astype(np.int64)
+        wrapped = {
+            tuple(np.mod(offset, shape))
+            for offset in itertools.product(*(range(-n, n + 1) for n in reach))
+        }
+        offsets = [
+            offset
+            for offset in sorted(wrapped)
+            if offset >= tuple(np.mod(np.negative(offset), shape))
+        ]
+
+    cell_ids = np.ravel_multi_index(cells.T, shape)
+
+    # Particles are sorted by cell, so that the particles of each cell are contiguous
+    order = np.argsort(cell_ids, kind="stable")
+    occupied, cell_starts, cell_counts = np.unique(
+        cell_ids[order], return_index=True, return_counts=True
+    )
+    occupied_cells = np.stack(np.unravel_index(occupied, shape), axis=1)
+    cell_of_particle = np.repeat(np.arange(len(occupied)), cell_counts)
+    x, y, z = (np.ascontiguousarray(positions[order, axis]) for axis in range(3))
+
+    for offset in offsets:
+        if not any(offset):
+            # Pair each particle with those after it in its own cell
+            partner_starts = np.arange(1, n_particles + 1)
+            partner_counts = (
+                cell_starts[cell_of_particle]
+                + cell_counts[cell_of_particle]
+                - partner_starts
+            )
+        else:
+            neighbor_ids = np.ravel_multi_index(
+                (occupied_cells + offset).T, shape, mode="wrap"
+            )
+            neighbor_index = np.minimum(
+                np.searchsorted(occupied, neighbor_ids), len(occupied) - 1
+            )
+            has_neighbor = occupied[neighbor_index] == neighbor_ids
+            partner_starts = cell_starts[neighbor_index][cell_of_particle]
+            partner_counts = np.where(has_neighbor, cell_counts[neighbor_index], 0)[
+                cell_of_particle
+            ]
+
+        i = np.repeat(np.arange(n_particles), partner_counts)
+        j = np.arange(len(i)) - np.repeat(
+            np.cumsum(partner_counts) - partner_counts - partner_starts,
+            partner_counts,
+        )
+
+        if any(offset) and box is not None:
+            # A cell half way around the box is visited from both sides
+            if offset == tuple(np.mod(np.negative(offset), shape)):
+                is_unique = i < j
+                i, j = i[is_unique], j[is_unique]
+
+        dx, dy, dz = x[j] - x[i], y[j] - y[i], z[j] - z[i]
+        if box is not None:
+            _apply_minimum_image(dx, dy, dz, box)
+
+        r = dx ** 2 + dy ** 2 + dz ** 2
+        is_close = r < cutoff ** 2
+
+        yield order[i[is_close]], order[j[is_close]], np.sqrt(r[is_close])
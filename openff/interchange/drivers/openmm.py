@@ -1,14 +1,48 @@
 """Functions for running energy evluations with OpenMM."""
-from typing import Dict
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import openmm
+from openff.units import unit as off_unit
 from openmm import unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.utils import _get_frame_positions
 
 kj_mol = unit.kilojoule_per_mole
+off_kj_mol = off_unit.kilojoule / off_unit.mol
+
+# The units of the parameters of each handler used by the OpenMM export
+_SWEEP_PARAMETER_UNITS = {
+    "Bonds": {
+        "k": off_unit.kilojoule / off_unit.nanometer ** 2 / off_unit.mol,
+        "length": off_unit.nanometer,
+    },
+    "Angles": {
+        "k": off_unit.kilojoule / off_unit.radian ** 2 / off_unit.mol,
+        "angle": off_unit.radian,
+    },
+    "ProperTorsions": {
+        "k": off_unit.kilojoule / off_unit.mol,
+        "periodicity": off_unit.dimensionless,
+        "phase": off_unit.radian,
+        "idivf": off_unit.dimensionless,
+    },
+}
+_SWEEP_PARAMETER_UNITS["ImproperTorsions"] = _SWEEP_PARAMETER_UNITS["ProperTorsions"]
+
+# The maximum number of contexts kept alive by `get_openmm_conformer_energies`
+_MAX_POOLED_CONTEXTS = 4
+
+# Contexts, with the systems they were created from, keyed by a hash of the serialized system
+_CONTEXT_POOL: "OrderedDict[str, Tuple[openmm.System, openmm.Context, openmm.Integrator]]" = (
+    OrderedDict()
+)
+_CONTEXT_POOL_LOCK = threading.Lock()
 
 
 def get_openmm_energies(
@@ -50,21 +84,7 @@ def get_openmm_energies(
         An `EnergyReport` object containing the single-point energies.
 
     """
-    positions = off_sys.positions
-
-    if "VirtualSites" in off_sys.handlers:
-        if len(off_sys["VirtualSites"].slot_map) > 0:
-            if not combine_nonbonded_forces:
-                raise NotImplementedError(
-                    "Cannot yet split out NonbondedForce components while virtual sites are present."
-                )
-
-            n_virtual_sites = len(off_sys["VirtualSites"].slot_map)
-
-            # TODO: Actually compute virtual site positions based on initial conformers
-            virtual_site_positions = np.zeros((n_virtual_sites, 3))
-            virtual_site_positions *= off_sys.positions.units
-            positions = np.vstack([positions, virtual_site_positions])
+    positions = _get_positions(off_sys, combine_nonbonded_forces)
 
     omm_sys: openmm.System = off_sys.to_openmm(
         combine_nonbonded_forces=combine_nonbonded_forces
@@ -80,6 +100,318 @@ def get_openmm_energies(
     )
 
 
+def get_openmm_parameter_sweep(
+    off_sys: Interchange,
+    parameters: Dict[str, np.ndarray],
+    round_positions=None,
+    combine_nonbonded_forces: bool = False,
+) -> np.ndarray:
+    """
+    Given many sets of force field parameters, return the energies of each as computed by OpenMM.
+
+    The OpenMM system and context are created once, and each set of parameters is pushed into
+    the context before its energies are evaluated. The Interchange object is not modified.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute single-point energies of
+    parameters : dict of str: np.ndarray
+        Arrays of shape ``(n_samples, n_ff_params)``, keyed by handler name. Each row is a set of
+        force field parameters of that handler, flattened from the array returned by
+        ``PotentialHandler.get_force_field_parameters`` and in the same units. The ``Bonds``,
+        ``Angles``, ``ProperTorsions`` and ``ImproperTorsions`` handlers are supported.
+    round_positions : int, optional
+        The number of decimal places, in nanometers, to round positions.
+    combine_nonbonded_forces : bool, default=False
+        Whether or not to combine all non-bonded interactions (vdW, short- and long-range
+        electrostatics, and 1-4 interactions) into a single openmm.NonbondedForce.
+
+    Returns
+    -------
+    energies : np.ndarray
+        An array of shape ``(n_samples, n_terms)`` of energies in kJ/mol. Columns are ordered as
+        the energies in the `EnergyReport` returned by ``get_openmm_energies``.
+
+    """
+    n_samples = {len(handler_parameters) for handler_parameters in parameters.values()}
+    if len(n_samples) > 1:
+        raise ValueError(
+            "Parameters of each handler must have the same number of samples, "
+            f"found {sorted(n_samples)}."
+        )
+
+    omm_sys: openmm.System = off_sys.to_openmm(
+        combine_nonbonded_forces=combine_nonbonded_forces
+    )
+
+    setters = {
+        handler_name: _get_parameter_setter(off_sys, omm_sys, handler_name)
+        for handler_name in parameters
+    }
+
+    context, integrator = _create_context(
+        omm_sys=omm_sys,
+        box_vectors=off_sys.box,
+        positions=_get_positions(off_sys, combine_nonbonded_forces),
+        round_positions=round_positions,
+    )
+    nonbonded_energy_types = _get_nonbonded_energy_types(omm_sys)
+
+    energies: List[List[float]] = list()
+
+    for sample in range(n_samples.pop() if n_samples else 0):
+        forces = list()
+        for handler_name, (force, set_parameters) in setters.items():
+            set_parameters(parameters[handler_name][sample])
+            if force not in forces:
+                forces.append(force)
+
+        for force in forces:
+            force.updateParametersInContext(context)
+
+        report = _get_report(omm_sys, context, nonbonded_energy_types)
+        energies.append(
+            [energy.m_as(off_kj_mol) for energy in report.energies.values()]
+        )
+
+    del context
+    del integrator
+
+    return np.array(energies)
+
+
+def get_openmm_conformer_energies(
+    off_sys: Interchange,
+    positions,
+    round_positions=None,
+    combine_nonbonded_forces: bool = False,
+    pool_context: bool = False,
+) -> np.ndarray:
+    """
+    Given many conformers of an OpenFF Interchange object, return the energies of each.
+
+    The OpenMM system and context are created once, and the positions of each conformer are set
+    in the context before its energies are evaluated. The positions of the Interchange object
+    are neither used nor modified.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute single-point energies of
+    positions : openff.units.Quantity or np.ndarray
+        The positions of the atoms of each conformer, of shape ``(n_conformers, n_atoms, 3)``.
+        If not a quantity, positions are assumed to be in nanometers.
+    round_positions : int, optional
+        The number of decimal places, in nanometers, to round positions.
+    combine_nonbonded_forces : bool, default=False
+        Whether or not to combine all non-bonded interactions (vdW, short- and long-range
+        electrostatics, and 1-4 interactions) into a single openmm.NonbondedForce.
+    pool_context : bool, default=False
+        Whether or not to keep the context alive after returning, so that later calls with the
+        same Interchange object, or one with the same contents, can re-use it. The few most
+        recently used contexts are kept, and can be released with ``clear_context_pool``.
+
+    Returns
+    -------
+    energies : np.ndarray
+        An array of shape ``(n_conformers, n_terms)`` of energies in kJ/mol. Columns are
+        ordered as the energies in the `EnergyReport` returned by ``get_openmm_energies``.
+
+    """
+    positions = _get_positions(
+        off_sys, combine_nonbonded_forces, _get_frame_positions(off_sys, positions)
+    )
+    positions = positions.m_as(off_unit.nanometer)
+    if round_positions is not None:
+        positions = np.round(positions, round_positions)
+
+    omm_sys: openmm.System = off_sys.to_openmm(
+        combine_nonbonded_forces=combine_nonbonded_forces
+    )
+
+    key = ""
+    pooled = None
+    if pool_context:
+        key = hashlib.sha256(
+            openmm.XmlSerializer.serialize(omm_sys).encode()
+        ).hexdigest()
+        # Checking out the context keeps it from being used by two threads at once
+        with _CONTEXT_POOL_LOCK:
+            pooled = _CONTEXT_POOL.pop(key, None)
+
+    if pooled is None:
+        # Positions of each conformer are set below
+        context, integrator = _create_context(
+            omm_sys=omm_sys,
+            box_vectors=off_sys.box,
+            positions=np.zeros((omm_sys.getNumParticles(), 3)) * off_unit.nanometer,
+        )
+    else:
+        omm_sys, context, integrator = pooled
+        _set_box_vectors(context, off_sys.box)
+
+    nonbonded_energy_types = _get_nonbonded_energy_types(omm_sys)
+
+    energies: List[List[float]] = list()
+
+    for conformer_positions in positions:
+        context.setPositions(conformer_positions)
+
+        report = _get_report(omm_sys, context, nonbonded_energy_types)
+        energies.append(
+            [energy.m_as(off_kj_mol) for energy in report.energies.values()]
+        )
+
+    if pool_context:
+        with _CONTEXT_POOL_LOCK:
+            _CONTEXT_POOL[key] = (omm_sys, context, integrator)
+            _CONTEXT_POOL.move_to_end(key)
+            while len(_CONTEXT_POOL) > _MAX_POOLED_CONTEXTS:
+                _CONTEXT_POOL.popitem(last=False)
+
+    del context
+    del integrator
+
+    return np.array(energies)
+
+
+def clear_context_pool() -> None:
+    """Release the contexts kept alive by ``get_openmm_conformer_energies``."""
+    with _CONTEXT_POOL_LOCK:
+        _CONTEXT_POOL.clear()
+
+
+def _get_parameter_setter(
+    off_sys: Interchange,
+    omm_sys: openmm.System,
+    handler_name: str,
+) -> Tuple[openmm.Force, Callable[[np.ndarray], None]]:
+    """
+    Return the force storing the terms of a handler, and a function setting their parameters.
+
+    The function takes flattened force field parameters of the handler, and sets parameters of the
+    force, in the order that the terms were added by ``Interchange.to_openmm``, without updating
+    any context.
+    """
+    if handler_name not in _SWEEP_PARAMETER_UNITS:
+        raise NotImplementedError(
+            f"Parameter sweeps of the {handler_name} handler are not yet supported."
+        )
+
+    handler = off_sys[handler_name]
+    table = handler._get_coefficient_data()["potentials"]
+    parameter_units = _SWEEP_PARAMETER_UNITS[handler_name]
+    names = [*table[0].parameters] if table else [*parameter_units]
+
+    # Convert each force field parameter to OpenMM units before mapping it to the topology
+    factors = np.array(
+        [
+            [
+                (1.0 * potential.parameters[name].units).m_as(parameter_units[name])
+                for name in names
+            ]
+            for potential in table
+        ]
+    ).reshape(len(table), len(names))
+
+    def get_system_parameters(p: np.ndarray) -> Dict[str, List[float]]:
+        p = np.asarray(p, dtype=float).reshape(factors.shape) * factors
+        q = np.asarray(handler.get_system_parameters(p)).reshape(-1, len(names))
+        return {name: q[:, index].tolist() for index, name in enumerate(names)}
+
+    atom_indices = [top_key.atom_indices for top_key in handler.slot_map]
+
+    if handler_name == "Bonds":
+        force = _get_force(omm_sys, openmm.HarmonicBondForce)
+        constrained = (
+            off_sys["Constraints"].slot_map if "Constraints" in off_sys.handlers else {}
+        )
+        bond_slots = [
+            slot
+            for slot, top_key in enumerate(handler.slot_map)
+            if top_key not in constrained
+        ]
+
+        def set_parameters(p: np.ndarray) -> None:
+            q = get_system_parameters(p)
+            for term, slot in enumerate(bond_slots):
+                force.setBondParameters(
+                    term, *atom_indices[slot], q["length"][slot], q["k"][slot]
+                )
+
+    elif handler_name == "Angles":
+        force = _get_force(omm_sys, openmm.HarmonicAngleForce)
+
+        def set_parameters(p: np.ndarray) -> None:
+            q = get_system_parameters(p)
+            for term, indices in enumerate(atom_indices):
+                force.setAngleParameters(term, *indices, q["angle"][term], q["k"][term])
+
+    else:
+        force = _get_force(omm_sys, openmm.PeriodicTorsionForce)
+        # Impropers are added to the same force, after any propers
+        offset = 0
+        if handler_name == "ImproperTorsions" and "ProperTorsions" in off_sys.handlers:
+            offset = len(off_sys["ProperTorsions"].slot_map)
+
+        def set_parameters(p: np.ndarray) -> None:
+            q = get_system_parameters(p)
+            for slot, indices in enumerate(atom_indices):
+                force.setTorsionParameters(
+                    offset + slot,
+                    *indices,
+                    int(round(q["periodicity"][slot])),
+                    q["phase"][slot],
+                    q["k"][slot] / q["idivf"][slot],
+                )
+
+    return force, set_parameters
+
+
+def _get_force(omm_sys: openmm.System, force_type: type) -> openmm.Force:
+    """Return the first force of a type in a system."""
+    for force in omm_sys.getForces():
+        if type(force) == force_type:
+            return force
+    raise NotImplementedError(f"Did not find a {force_type.__name__} in the system.")
+
+
+def _get_positions(
+    off_sys: Interchange, combine_nonbonded_forces: bool, positions=None
+):
+    """
+    Return the positions of an Interchange, including any virtual sites.
+
+    If given, positions of the atoms of one or more conformers are used instead of those stored
+    in the Interchange.
+    """
+    if positions is None:
+        positions = off_sys.positions
+
+    if "VirtualSites" in off_sys.handlers:
+        if len(off_sys["VirtualSites"].slot_map) > 0:
+            if not combine_nonbonded_forces:
+                raise NotImplementedError(
+                    "Cannot yet split out NonbondedForce components while virtual sites are present."
+                )
+
+            n_virtual_sites = len(off_sys["VirtualSites"].slot_map)
+
+            # TODO: Actually compute virtual site positions based on initial conformers
+            virtual_site_positions = np.zeros(
+                (*positions.shape[:-2], n_virtual_sites, 3)
+            )
+            virtual_site_positions *= positions.units
+            positions = np.concatenate([positions, virtual_site_positions], axis=-2)
+
+    return positions
+
+
 def _get_openmm_energies(
     omm_sys: openmm.System,
     box_vectors,
@@ -98,16 +430,35 @@ def _get_openmm_energies(
         omm_sys = _set_nonbonded_method(omm_sys, "PME")
     """
 
+    context, integrator = _create_context(
+        omm_sys=omm_sys,
+        box_vectors=box_vectors,
+        positions=positions,
+        round_positions=round_positions,
+    )
+
+    report = _get_report(omm_sys, context)
+
+    del context
+    del integrator
+
+    return report
+
+
+def _create_context(
+    omm_sys: openmm.System,
+    box_vectors,
+    positions,
+    round_positions=None,
+) -> Tuple[openmm.Context, openmm.Integrator]:
+    """Create a context, with each force in its own force group, to evaluate energies with."""
     for idx, force in enumerate(omm_sys.getForces()):
         force.setForceGroup(idx)
 
     integrator = openmm.VerletIntegrator(1.0 * unit.femtoseconds)
     context = openmm.Context(omm_sys, integrator)
 
-    if box_vectors is not None:
-        if not isinstance(box_vectors, (unit.Quantity, list)):
-            box_vectors = box_vectors.magnitude * unit.nanometer
-        context.setPeriodicBoxVectors(*box_vectors)
+    _set_box_vectors(context, box_vectors)
 
     if isinstance(positions, unit.Quantity):
         # Convert list of Vec3 into a NumPy array
@@ -121,6 +472,26 @@ def _get_openmm_energies(
     else:
         context.setPositions(positions)
 
+    return context, integrator
+
+
+def _set_box_vectors(context: openmm.Context, box_vectors) -> None:
+    """Set the periodic box vectors of a context, if any."""
+    if box_vectors is not None:
+        if not isinstance(box_vectors, (unit.Quantity, list)):
+            box_vectors = box_vectors.magnitude * unit.nanometer
+        context.setPeriodicBoxVectors(*box_vectors)
+
+
+def _get_report(
+    omm_sys: openmm.System,
+    context: openmm.Context,
+    nonbonded_energy_types: Optional[Dict[int, str]] = None,
+) -> EnergyReport:
+    """Evaluate the energy of each force in a context and collect them into a report."""
+    if nonbonded_energy_types is None:
+        nonbonded_energy_types = _get_nonbonded_energy_types(omm_sys)
+
     raw_energies = dict()
     omm_energies = dict()
 
@@ -143,7 +514,7 @@ def _get_openmm_energies(
             openmm.CustomNonbondedForce,
             openmm.CustomBondForce,
         ]:
-            energy_type = _infer_nonbonded_energy_type(force)
+            energy_type = nonbonded_energy_types[key]
 
             if energy_type == "None":
                 continue
@@ -163,9 +534,6 @@ def _get_openmm_energies(
         if not any(required_key in val for val in omm_energies):
             pass  # omm_energies[required_key] = 0.0 * kj_mol
 
-    del context
-    del integrator
-
     report = EnergyReport()
 
     report.update_energies(
@@ -191,6 +559,16 @@ def _get_openmm_energies(
     return report
 
 
+def _get_nonbonded_energy_types(omm_sys: openmm.System) -> Dict[int, str]:
+    """Infer the type of energy of each non-bonded force in a system, by index."""
+    return {
+        idx: _infer_nonbonded_energy_type(force)
+        for idx, force in enumerate(omm_sys.getForces())
+        if type(force)
+        in [openmm.NonbondedForce, openmm.CustomNonbondedForce, openmm.CustomBondForce]
+    }
+
+
 def _infer_nonbonded_energy_type(force):
     if type(force) == openmm.NonbondedForce:
         has_electrostatics = False
@@ -1,10 +1,106 @@
 """Assorted utilities in pre-processing for energy drivers."""
-from typing import TYPE_CHECKING
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Union
+
+import numpy as np
+from openff.units import unit
 
 if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
 
 
+def _get_deadline(timeout: Optional[float]) -> Optional[float]:
+    """Return the time, as given by ``time.monotonic``, at which a timeout from now expires."""
+    if timeout is None:
+        return None
+    return time.monotonic() + timeout
+
+
+def _run_command(
+    command: List[str],
+    working_directory: Optional[Union[Path, str]] = None,
+    deadline: Optional[float] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a command without a shell, returning its exit code and output.
+
+    If the command is still running at ``deadline``, see ``_get_deadline``, it is stopped
+    along with any processes it started, and ``subprocess.TimeoutExpired`` is raised.
+    Commands run by one engine can share a deadline so that the timeout applies to all of
+    them together.
+    """
+    timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+    # The command is run in a session of its own, i.e. a new process group, so that any
+    # processes it starts are stopped with it
+    with subprocess.Popen(
+        command,
+        cwd=working_directory,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        start_new_session=True,
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except BaseException:
+            # i.e. the deadline passed or this thread was interrupted, either way the
+            # process is then waited for as the context is exited
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            raise
+
+    return subprocess.CompletedProcess(
+        process.args, process.returncode, stdout=stdout, stderr=stderr
+    )
+
+
+def _get_frame_positions(interchange: "Interchange", positions) -> unit.Quantity:
+    """
+    Validate positions of many frames of an Interchange, returning them as a quantity.
+
+    Positions that are not a quantity are assumed to be in nanometers.
+    """
+    if not isinstance(positions, unit.Quantity):
+        positions = np.asarray(positions, dtype=float) * unit.nanometer
+
+    n_atoms = interchange.topology.mdtop.n_atoms
+    if positions.ndim != 3 or positions.shape[1:] != (n_atoms, 3):
+        raise ValueError(
+            f"Expected positions of shape (n_conformers, {n_atoms}, 3), found "
+            f"{positions.shape}."
+        )
+
+    return positions
+
+
+def _get_interchange_with_positions(
+    interchange: "Interchange", positions: unit.Quantity
+) -> "Interchange":
+    """
+    Return an Interchange sharing the handlers, topology and box of another, with other positions.
+
+    The other Interchange is not modified, so that it can safely be used by other threads.
+    """
+    from openff.interchange.components.interchange import Interchange
+
+    out = Interchange()
+    out.topology = interchange.topology
+    out.box = interchange.box
+    out.positions = positions
+
+    for handler_name, handler in interchange.handlers.items():
+        out.add_handler(handler_name, handler)
+
+    return out
+
+
 def _infer_constraints(interchange: "Interchange") -> str:
     if "Constraints" not in interchange.handlers:
         return "none"
@@ -19,6 +19,8 @@ from openff.interchange.drivers.report import EnergyError, EnergyReport
 from openff.interchange.testing.utils import (
     HAS_GROMACS,
     HAS_LAMMPS,
+    _compare_conformer_energies,
+    _get_conformer_positions,
     needs_gmx,
     needs_lmp,
 )
@@ -29,6 +31,7 @@ if HAS_GROMACS:
         _get_mdp_file,
         _run_gmx_energy,
         get_gromacs_energies,
+        get_gromacs_rerun_energies,
     )
 if HAS_LAMMPS:
     from openff.interchange.drivers.lammps import get_lammps_energies
@@ -367,6 +370,26 @@ def test_process_rb_torsions():
     assert oplsaa_energies.energies["Torsion"].m != 0.0
 
 
+@needs_gmx
+def test_gromacs_rerun_energies():
+    mol = Molecule.from_smiles("CCO")
+    mol.name = "MOL"
+    mol.generate_conformers(n_conformers=3, rms_cutoff=0.1 * openmm_unit.angstrom)
+
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    out = Interchange.from_smirnoff(parsley, mol.to_topology())
+    out.box = [4, 4, 4]
+
+    _compare_conformer_energies(
+        out,
+        _get_conformer_positions(mol),
+        get_gromacs_rerun_energies,
+        get_gromacs_energies,
+        atol=1e-3,
+    )
+
+
 @needs_gmx
 def test_gmx_14_energies_exist():
     # TODO: Make sure 1-4 energies are accurate, not just existent
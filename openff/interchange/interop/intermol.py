@@ -196,12 +196,15 @@ def from_intermol_system(intermol_system: System) -> Interchange:
             def ensure_unique_key(
                 handler: Union[BaseProperTorsionHandler, BaseImproperTorsionHandler],
                 key: TopologyKey,
-            ):
-                if key in handler.slot_map:
-                    key.mult += 1  # type: ignore[operator]
-                    ensure_unique_key(handler, key)
+            ) -> TopologyKey:
+                while key in handler.slot_map:
+                    key = TopologyKey(
+                        atom_indices=key.atom_indices,
+                        mult=key.mult + 1,  # type: ignore[operator]
+                    )
+                return key
 
-            ensure_unique_key(handler, topology_key)
+            topology_key = ensure_unique_key(handler, topology_key)
 
             potential_key = PotentialKey(
                 id=(
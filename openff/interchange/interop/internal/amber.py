@@ -661,3 +661,41 @@ def to_inpcrd(interchange: "Interchange", file_path: Union[Path, str]):
             raise NotImplementedError
 
         inpcrd.write("\n")
+
+
+def to_mdcrd(
+    interchange: "Interchange", file_path: Union[Path, str], positions: unit.Quantity
+):
+    """
+    Write positions of many frames to an ASCII trajectory (.mdcrd) file.
+
+    See https://ambermd.org/FileFormats.php#trajectory for details. Positions, of shape
+    ``(n_frames, n_atoms, 3)``, are written to a precision of 0.001 Angstrom.
+
+    """
+    if isinstance(file_path, str):
+        path = Path(file_path)
+    if isinstance(file_path, Path):
+        path = file_path
+
+    coords = positions.m_as(unit.angstrom)
+
+    box = None
+    if interchange.box is not None:
+        box = interchange.box.to(unit.angstrom).magnitude
+        if not (box == np.diag(np.diagonal(box))).all():
+            # TODO: Handle non-rectangular
+            raise NotImplementedError
+
+    with open(path, "w") as mdcrd:
+        mdcrd.write("Generated by OpenFF\n")
+
+        for frame_coords in coords:
+            # Ten fixed-width fields per line, which may not be separated by whitespace
+            blob = "".join([f"{val:8.3f}" for val in frame_coords.flatten()])
+
+            for start in range(0, len(blob), 80):
+                mdcrd.write(blob[start : start + 80] + "\n")
+
+            if box is not None:
+                mdcrd.write("".join(f"{box[i, i]:8.3f}" for i in range(3)) + "\n")
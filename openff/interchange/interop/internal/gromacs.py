@@ -1,7 +1,21 @@
 """Interfaces with GROMACS."""
 import math
+from collections import defaultdict
+from itertools import groupby
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Callable, Dict, Set, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import mdtraj as md
 import numpy as np
@@ -16,22 +30,33 @@ from openff.interchange.components.base import (
     BasevdWHandler,
 )
 from openff.interchange.components.mdtraj import (
+    _get_bonded_pairs,
     _iterate_angles,
     _iterate_impropers,
-    _iterate_pairs,
     _iterate_propers,
     _OFFBioTop,
     _store_bond_partners,
 )
 from openff.interchange.components.potentials import Potential
-from openff.interchange.exceptions import UnsupportedExportError
+from openff.interchange.exceptions import MissingParametersError, UnsupportedExportError
 from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
 
 if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
 
+# The number of lines of a .gro file to format at once
+_GRO_CHUNK_SIZE = 100000
+
+# The directives of a .top file read for each molecule, in the order they are processed
+_MOLECULE_DIRECTIVES = ["atoms", "pairs", "bonds", "angles", "dihedrals"]
 
-def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
+
+def to_gro(
+    openff_sys: "Interchange",
+    file_path: Union[Path, str],
+    decimal=8,
+    positions=None,
+):
     """
     Write a GROMACS coordinate (.gro) file.
 
@@ -41,85 +66,138 @@ def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
     This code is partially copied from InterMol, see
     https://github.com/shirtsgroup/InterMol/tree/v0.1/intermol/gromacs
 
+    If given, ``positions`` of shape ``(n_frames, n_atoms, 3)`` are written instead of the
+    positions of the Interchange, one frame after another, i.e. as a trajectory for
+    ``gmx mdrun -rerun``.
+
     """
     if isinstance(file_path, str):
         path = Path(file_path)
     if isinstance(file_path, Path):
         path = file_path
 
+    if positions is None:
+        positions = openff_sys.positions
+
     # Explicitly round here to avoid ambiguous things in string formatting
-    rounded_positions = np.round(openff_sys.positions, decimal)
+    rounded_positions = np.round(positions, decimal)
     rounded_positions = rounded_positions.to(unit.nanometer).magnitude
 
     n = decimal
 
-    n_particles = openff_sys.positions.shape[0]
+    n_particles = positions.shape[-2]
+    rounded_positions = rounded_positions.reshape((-1, n_particles, 3))
 
-    typemap = _build_typemap(openff_sys)
+    mdtop = openff_sys.topology.mdtop
+    atom_names = [
+        atom_name
+        for atoms in _get_molecule_atoms(openff_sys)
+        for atom_name in _get_atom_names(mdtop, atoms)
+    ]
     virtual_site_map = _build_virtual_site_map(openff_sys)
     n_particles += len(virtual_site_map)
 
+    # Fields other than positions are the same in every frame
+    particle_fields = _get_gro_particle_fields(openff_sys, atom_names, virtual_site_map)
+    virtual_site_positions = np.zeros((len(virtual_site_map), 3))
+
     with open(path, "w") as gro:
-        gro.write("Generated by OpenFF\n")
-        gro.write(f"{n_particles}\n")
-        for atom in openff_sys.topology.mdtop.atoms:
-            res = atom.residue
-            residue_idx = (res.index + 1) % 100000
-            # TODO: After topology refactor, ensure this matches residue names
-            # in the topology file (unsure if this is necessary?)
-            residue_name = res.name[:5]
-            atom_name = typemap[atom.index]
-            atom_index = (atom.index + 1) % 100000
-            # TODO: Make sure these are in nanometers
-            gro.write(
-                f"%5d%-5s%5s%5d%{n+5}.{n}f%{n+5}.{n}f%{n+5}.{n}f\n"
-                % (
-                    residue_idx,
-                    residue_name,
-                    atom_name,
-                    atom_index,
-                    rounded_positions[atom.index, 0],
-                    rounded_positions[atom.index, 1],
-                    rounded_positions[atom.index, 2],
-                )
+        for frame_positions in rounded_positions:
+            _write_gro_frame(
+                gro,
+                openff_sys,
+                particle_fields,
+                np.concatenate([frame_positions, virtual_site_positions]),
+                n,
             )
 
-        for virtual_site_key in virtual_site_map:
-            atom_name = "VS"
-            residue_idx = 1
-            residue_name = ""
-            atom_index = virtual_site_map[virtual_site_key]
-            gro.write(
-                f"%5d%-5s%5s%5d%{n+5}.{n}f%{n+5}.{n}f%{n+5}.{n}f\n"
-                % (
-                    residue_idx,
-                    residue_name,
-                    atom_name,
-                    atom_index,
-                    0.0,
-                    0.0,
-                    0.0,
-                )
-            )
 
-        if openff_sys.box is None:
-            box = 11 * np.eye(3)
-        else:
-            box = openff_sys.box.to(unit.nanometer).magnitude
+def _get_gro_particle_fields(
+    openff_sys: "Interchange",
+    atom_names: List[str],
+    virtual_site_map: Dict[VirtualSiteKey, int],
+) -> List[str]:
+    """
+    Return the residue number, residue name, atom name, and atom number of each particle.
 
-        # Check for rectangular
-        if (box == np.diag(np.diagonal(box))).all():
-            for i in range(3):
-                gro.write(f"{box[i, i]:11.7f}")
-        else:
-            for i in range(3):
-                gro.write(f"{box[i, i]:11.7f}")
-            for i in range(3):
-                for j in range(3):
-                    if i != j:
-                        gro.write(f"{box[i, j]:11.7f}")
+    These are the fields of each line of a .gro file before the position, formatted into one
+    string per particle, with atoms followed by virtual sites.
+    """
+    mdtop = openff_sys.topology.mdtop
+    n_atoms = mdtop.n_atoms
+
+    # TODO: After topology refactor, ensure this matches residue names
+    # in the topology file (unsure if this is necessary?)
+    residue_names = [res.name[:5] for res in mdtop.residues]
+    residue_indices = [atom.residue.index for atom in mdtop.atoms]
+
+    fields: List = [None] * (4 * n_atoms)
+    fields[0::4] = [(residue_index + 1) % 100000 for residue_index in residue_indices]
+    fields[1::4] = [residue_names[residue_index] for residue_index in residue_indices]
+    fields[2::4] = atom_names
+    fields[3::4] = [(atom_index + 1) % 100000 for atom_index in range(n_atoms)]
+
+    particle_fields = list()
+    for start in range(0, 4 * n_atoms, 4 * _GRO_CHUNK_SIZE):
+        chunk = fields[start : start + 4 * _GRO_CHUNK_SIZE]
+        # Names cannot include newlines, so they can be used to split lines
+        particle_fields.extend(
+            (("%5d%-5s%5s%5d\n" * (len(chunk) // 4)) % tuple(chunk)).splitlines()
+        )
+
+    for virtual_site_index in virtual_site_map.values():
+        particle_fields.append("%5d%-5s%5s%5d" % (1, "", "VS", virtual_site_index))
 
-        gro.write("\n")
+    return particle_fields
+
+
+def _write_gro_frame(
+    gro: IO,
+    openff_sys: "Interchange",
+    particle_fields: List[str],
+    rounded_positions: np.ndarray,
+    n: int,
+):
+    """
+    Write one frame of a GROMACS coordinate (.gro) file, given positions in nanometers.
+
+    Lines are formatted and written in chunks, each with the fields of its particle from
+    ``_get_gro_particle_fields`` followed by its position.
+    """
+    n_particles = len(particle_fields)
+
+    gro.write("Generated by OpenFF\n")
+    gro.write(f"{n_particles}\n")
+
+    line_format = f"%s%{n+5}.{n}f%{n+5}.{n}f%{n+5}.{n}f\n"
+    for start in range(0, n_particles, _GRO_CHUNK_SIZE):
+        stop = min(start + _GRO_CHUNK_SIZE, n_particles)
+
+        values: List = [None] * (4 * (stop - start))
+        values[0::4] = particle_fields[start:stop]
+        for axis in range(3):
+            values[axis + 1 :: 4] = rounded_positions[start:stop, axis].tolist()
+
+        gro.write((line_format * (stop - start)) % tuple(values))
+
+    if openff_sys.box is None:
+        box = 11 * np.eye(3)
+    else:
+        box = openff_sys.box.to(unit.nanometer).magnitude
+
+    # Check for rectangular
+    if (box == np.diag(np.diagonal(box))).all():
+        for i in range(3):
+            gro.write(f"{box[i, i]:11.7f}")
+    else:
+        for i in range(3):
+            gro.write(f"{box[i, i]:11.7f}")
+        for i in range(3):
+            for j in range(3):
+                if i != j:
+                    gro.write(f"{box[i, j]:11.7f}")
+
+    gro.write("\n")
 
 
 def _read_coordinates(file_path: Union[Path, str]) -> np.ndarray:
@@ -216,6 +294,10 @@ def to_top(openff_sys: "Interchange", file_path: Union[Path, str]):
     This code is partially copied from InterMol, see
     https://github.com/shirtsgroup/InterMol/tree/v0.1/intermol/gromacs
 
+    Each group of identical molecules is written as one [ moleculetype ], and the [ molecules ]
+    section lists how many of each follow one another in the topology. Data used by every
+    [ moleculetype ], like the parameters of valence terms, is collected once up front.
+
     """
     if isinstance(file_path, str):
         path = Path(file_path)
@@ -225,22 +307,50 @@ def to_top(openff_sys: "Interchange", file_path: Union[Path, str]):
     with open(path, "w") as top_file:
         top_file.write("; Generated by OpenFF Interchange\n")
         _write_top_defaults(openff_sys, top_file)
-        typemap = _build_typemap(openff_sys)
+        first_atoms, molecule_types = _get_molecule_types(openff_sys)
+        typemap = _build_typemap(openff_sys, (first_atoms, molecule_types))
         virtual_site_map = _build_virtual_site_map(openff_sys)
         _write_atomtypes(openff_sys, top_file, typemap, virtual_site_map)
         # TODO: Write [ nonbond_params ] section
 
-        # TODO: De-duplicate based on molecules
+        charges = openff_sys.handlers["Electrostatics"].charges
+        valence_terms = _get_valence_terms(openff_sys)
+
+        mdtop = openff_sys.topology.mdtop
+        _store_bond_partners(mdtop)
+
         # TODO: Handle special case of water
-        _write_moleculetype(top_file)
-        _write_atoms(top_file, openff_sys, typemap, virtual_site_map)
-        _write_valence(top_file, openff_sys)
-        _write_virtual_sites(
+        molecule_names = _get_molecule_names(len(first_atoms))
+        for molecule_name, atoms in zip(molecule_names, first_atoms):
+            if len(atoms) == mdtop.n_atoms:
+                molecule_mdtop = mdtop
+            else:
+                molecule_mdtop = _get_molecule_mdtop(mdtop, atoms)
+
+            _write_moleculetype(top_file, molecule_name)
+            _write_atoms(
+                top_file,
+                openff_sys,
+                molecule_mdtop,
+                atoms.start,
+                typemap,
+                charges,
+                virtual_site_map,
+            )
+            _write_valence(top_file, valence_terms, molecule_mdtop, atoms.start)
+            _write_virtual_sites(
+                top_file,
+                openff_sys,
+                virtual_site_map,
+            )
+
+        _write_system(
             top_file,
-            openff_sys,
-            virtual_site_map,
+            [
+                (molecule_names[molecule_type], len([*molecules]))
+                for molecule_type, molecules in groupby(molecule_types)
+            ],
         )
-        _write_system(top_file, openff_sys)
 
 
 def _write_top_defaults(openff_sys: "Interchange", top_file: IO):
@@ -294,27 +404,242 @@ def _write_top_defaults(openff_sys: "Interchange", top_file: IO):
     )
 
 
-def _build_typemap(openff_sys: "Interchange") -> Dict:
-    typemap = dict()
+def _build_typemap(
+    openff_sys: "Interchange",
+    molecule_types: Optional[Tuple[List[range], List[int]]] = None,
+) -> Dict:
+    """
+    Map the index of each atom to the name of its atom type.
+
+    Atoms of each type of molecule are given their own atom types, which are shared by all
+    molecules of that type. If given, ``molecule_types`` is the output of
+    ``_get_molecule_types``, which is otherwise called here.
+    """
+    if molecule_types is None:
+        molecule_types = _get_molecule_types(openff_sys)
+
+    first_atoms, types_of_molecules = molecule_types
+
+    mdtop = openff_sys.topology.mdtop
+    atom_types_of_molecules: List[List[str]] = list()
     elements: Dict[str, int] = dict()
 
-    for atom in openff_sys.topology.mdtop.atoms:
-        element_symbol = atom.element.symbol
-        # TODO: Use this key to condense, see parmed.openmm._process_nobonded
-        # parameters = _get_lj_parameters([*parameters.values()])
-        # key = tuple([*parameters.values()])
+    for atoms in first_atoms:
+        atom_types = list()
 
-        if element_symbol not in elements.keys():
-            elements[element_symbol] = 1
-        else:
-            elements[element_symbol] += 1
+        for atom_index in atoms:
+            element_symbol = mdtop.atom(atom_index).element.symbol
+            # TODO: Use this key to condense, see parmed.openmm._process_nobonded
+            # parameters = _get_lj_parameters([*parameters.values()])
+            # key = tuple([*parameters.values()])
+
+            if element_symbol not in elements.keys():
+                elements[element_symbol] = 1
+            else:
+                elements[element_symbol] += 1
 
-        atom_type = f"{element_symbol}{elements[element_symbol]}"
-        typemap[atom.index] = atom_type
+            atom_types.append(f"{element_symbol}{elements[element_symbol]}")
+
+        atom_types_of_molecules.append(atom_types)
+
+    typemap = dict()
+    atom_index = 0
+
+    for molecule_type in types_of_molecules:
+        for atom_type in atom_types_of_molecules[molecule_type]:
+            typemap[atom_index] = atom_type
+            atom_index += 1
 
     return typemap
 
 
+def _get_molecule_atoms(openff_sys: "Interchange") -> List[range]:
+    """
+    Return the atom indices of each molecule of an Interchange, in topology order.
+
+    If the topology is not made of molecules whose atoms are contiguous, or includes virtual
+    sites, it is treated as a single molecule.
+    """
+    topology = openff_sys.topology
+    n_atoms = topology.mdtop.n_atoms
+    single_molecule = [range(n_atoms)]
+
+    if "VirtualSites" in openff_sys.handlers:
+        return single_molecule
+
+    topology_molecules = getattr(topology, "topology_molecules", [])
+    n_molecule_atoms = sum(molecule.n_atoms for molecule in topology_molecules)
+    if n_molecule_atoms != n_atoms or not topology_molecules:
+        return single_molecule
+
+    molecule_atoms: List[range] = list()
+    start = 0
+
+    for topology_molecule in topology_molecules:
+        atoms = range(start, start + topology_molecule.n_atoms)
+        start = atoms.stop
+
+        topology_atom_indices = [
+            topology_atom.topology_atom_index
+            for topology_atom in topology_molecule.atoms
+        ]
+        if (
+            min(topology_atom_indices) != atoms.start
+            or max(topology_atom_indices) != atoms[-1]
+        ):
+            return single_molecule
+
+        molecule_atoms.append(atoms)
+
+    return molecule_atoms
+
+
+def _get_molecule_types(openff_sys: "Interchange") -> Tuple[List[range], List[int]]:
+    """
+    Group the molecules of an Interchange into types of identical molecules.
+
+    Returns the atom indices of the first molecule of each type, and the type of each molecule
+    in topology order. Molecules of a type are copies of the same reference molecule, with
+    atoms in the same order, the same charges and the same vdW, valence and constraint
+    parameters. Molecules are found by ``_get_molecule_atoms``.
+    """
+    topology = openff_sys.topology
+    n_atoms = topology.mdtop.n_atoms
+
+    molecule_atoms = _get_molecule_atoms(openff_sys)
+    if len(molecule_atoms) == 1:
+        return molecule_atoms, [0]
+
+    molecule_indices = np.empty(n_atoms, dtype=int)
+    for molecule_index, atoms in enumerate(molecule_atoms):
+        molecule_indices[atoms.start : atoms.stop] = molecule_index
+
+    atom_parameters: List[List] = [list() for _ in range(n_atoms)]
+
+    if "Electrostatics" in openff_sys.handlers:
+        for top_key, charge in openff_sys["Electrostatics"].charges.items():
+            atom_parameters[top_key.atom_indices[0]].append(charge.m)
+
+    for handler_name in ["vdW", "Buckingham-6"]:
+        if handler_name in openff_sys.handlers:
+            for top_key, pot_key in openff_sys[handler_name].slot_map.items():
+                atom_parameters[top_key.atom_indices[0]].append(pot_key)
+
+    # The valence and constraint terms of each molecule, in atom indices local to it
+    molecule_terms: List[List] = [list() for _ in molecule_atoms]
+
+    for handler_name in [
+        "Bonds",
+        "Constraints",
+        "Angles",
+        "ProperTorsions",
+        "ImproperTorsions",
+        "RBTorsions",
+    ]:
+        if handler_name not in openff_sys.handlers:
+            continue
+        for top_key, pot_key in openff_sys[handler_name].slot_map.items():
+            molecule_index = molecule_indices[top_key.atom_indices[0]]
+            offset = molecule_atoms[molecule_index].start
+            molecule_terms[molecule_index].append(
+                (
+                    handler_name,
+                    tuple(index - offset for index in top_key.atom_indices),
+                    top_key.mult,
+                    pot_key,
+                )
+            )
+
+    first_atoms: List[range] = list()
+    molecule_types: List[int] = list()
+    type_indices: Dict[Tuple, int] = dict()
+
+    for topology_molecule, atoms, terms in zip(
+        topology.topology_molecules, molecule_atoms, molecule_terms
+    ):
+        # The index of each atom in the molecule, in the order of the reference molecule
+        atom_map = tuple(
+            topology_atom.topology_atom_index - atoms.start
+            for topology_atom in topology_molecule.atoms
+        )
+        signature = (
+            id(topology_molecule.reference_molecule),
+            atom_map,
+            tuple(tuple(atom_parameters[index]) for index in atoms),
+            frozenset(terms),
+        )
+
+        if signature not in type_indices:
+            type_indices[signature] = len(first_atoms)
+            first_atoms.append(atoms)
+
+        molecule_types.append(type_indices[signature])
+
+    return first_atoms, molecule_types
+
+
+def _get_molecule_names(n_molecule_types: int) -> List[str]:
+    """Return the name of each type of molecule."""
+    if n_molecule_types == 1:
+        return ["MOL"]
+
+    return [f"MOL{index}" for index in range(n_molecule_types)]
+
+
+def _get_atom_names(mdtop: md.Topology, atoms: range) -> List[str]:
+    """Name each atom in a range by its element, numbered from 1 within the range."""
+    counts: DefaultDict[str, int] = defaultdict(int)
+    atom_names = list()
+
+    for atom_index in atoms:
+        element_symbol = mdtop.atom(atom_index).element.symbol
+        counts[element_symbol] += 1
+        atom_names.append(f"{element_symbol}{counts[element_symbol]}")
+
+    return atom_names
+
+
+def _get_molecule_mdtop(mdtop: md.Topology, atoms: range) -> md.Topology:
+    """
+    Return an MDTraj topology of a contiguous range of atoms, with atom indices starting at 0.
+
+    Unlike ``md.Topology.subset``, this only visits the atoms in the range and their bonds,
+    which requires bond partners to have been stored on ``mdtop`` by ``_store_bond_partners``.
+    Bond partners are also stored on the returned topology.
+    """
+    molecule_mdtop = md.Topology()
+    chain = molecule_mdtop.add_chain()
+    residues: Dict[int, md.core.topology.Residue] = dict()
+
+    for atom_index in atoms:
+        atom = mdtop.atom(atom_index)
+
+        if atom.residue.index not in residues:
+            residues[atom.residue.index] = molecule_mdtop.add_residue(
+                name=atom.residue.name,
+                chain=chain,
+                resSeq=atom.residue.resSeq,
+            )
+
+        molecule_mdtop.add_atom(
+            name=atom.name,
+            element=atom.element,
+            residue=residues[atom.residue.index],
+        )
+
+    for atom_index in atoms:
+        for partner in mdtop.atom(atom_index)._bond_partners:
+            if atom_index < partner.index:
+                molecule_mdtop.add_bond(
+                    molecule_mdtop.atom(atom_index - atoms.start),
+                    molecule_mdtop.atom(partner.index - atoms.start),
+                )
+
+    _store_bond_partners(molecule_mdtop)
+
+    return molecule_mdtop
+
+
 def _build_virtual_site_map(interchange: "Interchange") -> Dict[VirtualSiteKey, int]:
     """
     Construct a mapping between the VirtualSiteKey objects found in a SMIRNOFFVirtualSiteHandler and particle indices.
@@ -355,6 +680,16 @@ def _write_atomtypes(
             raise UnsupportedExportError("No vdW interactions found")
 
 
+def _iterate_unique_atom_types(typemap: Dict) -> Iterator[Tuple[int, str]]:
+    """Iterate over the index of the first atom of each atom type, and the atom type."""
+    atom_types: Set[str] = set()
+
+    for atom_idx, atom_type in typemap.items():
+        if atom_type not in atom_types:
+            atom_types.add(atom_type)
+            yield atom_idx, atom_type
+
+
 def _write_atomtypes_lj(
     openff_sys: "Interchange",
     top_file: IO,
@@ -365,7 +700,7 @@ def _write_atomtypes_lj(
     top_file.write("[ atomtypes ]\n")
     top_file.write(";type, bondingtype, mass, charge, ptype, sigma, epsilon\n")
 
-    for atom_idx, atom_type in typemap.items():
+    for atom_idx, atom_type in _iterate_unique_atom_types(typemap):
         atom = openff_sys.topology.mdtop.atom(atom_idx)
         mass = atom.element.mass
         atomic_number = atom.element.atomic_number
@@ -421,7 +756,7 @@ def _write_atomtypes_buck(openff_sys: "Interchange", top_file: IO, typemap: Dict
         ";type, bondingtype, atomic_number, mass, charge, ptype, sigma, epsilon\n"
     )
 
-    for atom_idx, atom_type in typemap.items():
+    for atom_idx, atom_type in _iterate_unique_atom_types(typemap):
         atom = openff_sys.topology.atom(atom_idx)
         parameters = _get_buck_parameters(openff_sys, atom_idx)
         a = parameters["A"].to(unit.Unit("kilojoule / mol")).magnitude
@@ -444,32 +779,40 @@ def _write_atomtypes_buck(openff_sys: "Interchange", top_file: IO, typemap: Dict
         top_file.write("\n")
 
 
-def _write_moleculetype(top_file: IO):
+def _write_moleculetype(top_file: IO, molecule_name: str):
     """Write the [ moleculetype ] section."""
     top_file.write("[ moleculetype ]\n")
     top_file.write("; Name\tnrexcl\n")
-    top_file.write("MOL\t3\n\n")
+    top_file.write(f"{molecule_name}\t3\n\n")
 
 
 def _write_atoms(
     top_file: IO,
     openff_sys: "Interchange",
+    mdtop: md.Topology,
+    offset: int,
     typemap: Dict,
+    charges: Dict,
     virtual_site_map: Dict,
 ):
-    """Write the [ atoms ] and [ pairs ] sections for a molecule."""
+    """
+    Write the [ atoms ] and [ pairs ] sections for a molecule.
+
+    The atoms of ``mdtop`` are those of the Interchange starting from index ``offset``, and
+    ``charges`` are the charges of all atoms of the Interchange.
+    """
     top_file.write("[ atoms ]\n")
     top_file.write(";num, type, resnum, resname, atomname, cgnr, q, m\n")
 
-    charges = openff_sys.handlers["Electrostatics"].charges
+    atom_names = _get_atom_names(mdtop, range(mdtop.n_atoms))
 
-    for atom in openff_sys.topology.mdtop.atoms:
+    for atom in mdtop.atoms:
         atom_idx = atom.index
         mass = atom.element.mass
-        atom_type = typemap[atom.index]
+        atom_type = typemap[atom.index + offset]
         res_idx = atom.residue.index
         res_name = str(atom.residue)
-        top_key = TopologyKey(atom_indices=(atom_idx,))
+        top_key = TopologyKey(atom_indices=(atom_idx + offset,))
         charge = charges[top_key].m_as(unit.e)
         # TODO: Figure out why charge increments were applied as an array
         # to the anchor atom involved in a BondChargeVirtualSite?
@@ -483,23 +826,24 @@ def _write_atoms(
                 atom_type,
                 res_idx + 1,
                 res_name,
-                atom_type,
+                atom_names[atom_idx],
                 atom_idx + 1,
                 charge,
                 mass,
             )
         )
 
+    if virtual_site_map:
+        virtual_site_charges = openff_sys.handlers[
+            "Electrostatics"
+        ].charges_with_virtual_sites
+
     for virtual_site_key, index in virtual_site_map.items():
         atom_idx = index
         atom_type = "VS"
         res_idx = 1
         res_name = "1"
-        charge
-        charge_handler = openff_sys.handlers["Electrostatics"]
-        charge = charge_handler.charges_with_virtual_sites[virtual_site_key].m_as(
-            unit.e
-        )
+        charge = virtual_site_charges[virtual_site_key].m_as(unit.e)
         mass = 0.0
 
         top_file.write(
@@ -519,8 +863,6 @@ def _write_atoms(
     top_file.write("[ pairs ]\n")
     top_file.write("; ai\taj\tfunct\n")
 
-    _store_bond_partners(openff_sys.topology.mdtop)
-
     try:
         mixing_rule = openff_sys["vdW"].mixing_rule.lower()
         scale_lj = openff_sys["vdW"].scale_14
@@ -528,31 +870,41 @@ def _write_atoms(
         mixing_rule = openff_sys["Buckingham-6"].mixing_rule.lower()
         scale_lj = openff_sys["Buckingham-6"].scale_14
 
-    # Use a set to de-duplicate
-    pairs: Set[Tuple] = {*_iterate_pairs(openff_sys.topology.mdtop)}
-    for pair in pairs:
-        indices = [a.index for a in pair]
-        indices = sorted(indices)
-        parameters1 = _get_lj_parameters(openff_sys, indices[0])
-        sigma1 = parameters1["sigma"].to(unit.nanometer).magnitude
-        epsilon1 = parameters1["epsilon"].to(unit.Unit("kilojoule / mole")).magnitude
-        parameters2 = _get_lj_parameters(openff_sys, indices[1])
-        sigma2 = parameters2["sigma"].to(unit.nanometer).magnitude
-        epsilon2 = parameters2["epsilon"].to(unit.Unit("kilojoule / mole")).magnitude
-        epsilon_mix = (epsilon1 * epsilon2) ** 0.5
-        if mixing_rule == "lorentz-berthelot":
-            sigma_mix = (sigma1 + sigma2) * 0.5
-        elif mixing_rule == "geometric":
-            sigma_mix = (sigma1 * sigma2) ** 0.5
-        top_file.write(
+    bonds = np.array(
+        [(bond.atom1.index, bond.atom2.index) for bond in mdtop.bonds],
+        dtype=np.intp,
+    ).reshape(-1, 2)
+    _, _, pairs = _get_bonded_pairs(bonds)
+
+    if len(pairs) == 0:
+        return
+
+    sigma, epsilon = _get_lj_parameter_arrays(
+        openff_sys, range(offset, offset + mdtop.n_atoms)
+    )
+    i, j = pairs[:, 0], pairs[:, 1]
+
+    if mixing_rule == "lorentz-berthelot":
+        sigma_mix = (sigma[i] + sigma[j]) * 0.5
+    elif mixing_rule == "geometric":
+        sigma_mix = np.sqrt(sigma[i] * sigma[j])
+    else:
+        raise UnsupportedExportError(
+            f"Mixing rule `{mixing_rule} not compatible with GROMACS and/or not supported "
+            "by current exporter. Supported values are `lorentz-berthelot` and `geometric`."
+        )
+    epsilon_mix = np.sqrt(epsilon[i] * epsilon[j]) * scale_lj
+
+    top_file.write(
+        "".join(
             "{:7d} {:7d} {:6d} {:16g} {:16g}\n".format(
-                indices[0] + 1,
-                indices[1] + 1,
-                1,
-                sigma_mix,
-                epsilon_mix * scale_lj,
+                index1 + 1, index2 + 1, 1, pair_sigma, pair_epsilon
+            )
+            for index1, index2, pair_sigma, pair_epsilon in zip(
+                i.tolist(), j.tolist(), sigma_mix.tolist(), epsilon_mix.tolist()
             )
         )
+    )
 
 
 def _write_virtual_sites(
@@ -755,49 +1107,155 @@ def _write_virtual_sites(
     top_file.write("\n")
 
 
+def _get_terms_by_atom_indices(
+    handler,
+) -> DefaultDict[Tuple[int, ...], List[PotentialKey]]:
+    """Return the potential keys of the terms of a handler, keyed by the atoms they act on."""
+    terms: DefaultDict[Tuple[int, ...], List[PotentialKey]] = defaultdict(list)
+
+    for top_key, pot_key in handler.slot_map.items():
+        terms[top_key.atom_indices].append(pot_key)
+
+    return terms
+
+
+def _find_terms(
+    terms: Dict[Tuple[int, ...], List[PotentialKey]],
+    indices: Tuple[int, ...],
+) -> List[PotentialKey]:
+    """Return the potential keys of terms acting on some atoms, in either order."""
+    if indices in terms:
+        return terms[indices]
+    return terms.get(indices[::-1], [])
+
+
+def _get_bond_parameters(handler) -> Dict[PotentialKey, Tuple[float, float]]:
+    """Return the length and force constant of each potential of a handler."""
+    return {
+        pot_key: (
+            potential.parameters["length"].m_as(unit.nanometer),
+            potential.parameters["k"].m_as(
+                unit.Unit("kilojoule / mole / nanometer ** 2")
+            ),
+        )
+        for pot_key, potential in handler.potentials.items()
+    }
+
+
+def _get_angle_parameters(handler) -> Dict[PotentialKey, Tuple[float, float]]:
+    """Return the angle and force constant of each potential of a handler."""
+    return {
+        pot_key: (
+            potential.parameters["angle"].m_as(unit.degree),
+            potential.parameters["k"].m_as(unit.Unit("kilojoule / mole / radian ** 2")),
+        )
+        for pot_key, potential in handler.potentials.items()
+    }
+
+
+def _get_periodic_torsion_parameters(
+    handler,
+) -> Dict[PotentialKey, Tuple[float, float, int]]:
+    """Return the phase, force constant, and periodicity of each potential of a handler."""
+    torsion_parameters = dict()
+
+    for pot_key, potential in handler.potentials.items():
+        params = potential.parameters
+        idivf = int(params["idivf"]) if "idivf" in params else 1
+        torsion_parameters[pot_key] = (
+            params["phase"].m_as(unit.degree),
+            params["k"].m_as(unit.Unit("kilojoule / mol")) / idivf,
+            int(params["periodicity"]),
+        )
+
+    return torsion_parameters
+
+
+def _get_rb_torsion_parameters(handler) -> Dict[PotentialKey, Tuple[float, ...]]:
+    """Return the coefficients C0 through C5 of each potential of a handler."""
+    return {
+        pot_key: tuple(
+            potential.parameters[f"C{i}"].m_as(unit.Unit("kilojoule / mol"))
+            for i in range(6)
+        )
+        for pot_key, potential in handler.potentials.items()
+    }
+
+
+# The potential keys of the terms of a handler keyed by the atoms they act on, and the
+# parameters of each potential in the units of a .top file, keyed by handler name
+_ValenceTerms = Dict[
+    str,
+    Tuple[DefaultDict[Tuple[int, ...], List[PotentialKey]], Dict[PotentialKey, Tuple]],
+]
+
+
+def _get_valence_terms(openff_sys: "Interchange") -> _ValenceTerms:
+    """
+    Index the valence terms of an Interchange by the atoms they act on, with their parameters.
+
+    This visits every term and potential once, so is done once per topology rather than once
+    per [ moleculetype ].
+    """
+    valence_terms: _ValenceTerms = dict()
+
+    for handler_name, get_parameters in [
+        ("Bonds", _get_bond_parameters),
+        ("Angles", _get_angle_parameters),
+        ("ProperTorsions", _get_periodic_torsion_parameters),
+        ("RBTorsions", _get_rb_torsion_parameters),
+        ("ImproperTorsions", _get_periodic_torsion_parameters),
+    ]:
+        if handler_name in openff_sys.handlers:
+            handler = openff_sys.handlers[handler_name]
+            valence_terms[handler_name] = (
+                _get_terms_by_atom_indices(handler),
+                get_parameters(handler),
+            )
+
+    return valence_terms
+
+
 def _write_valence(
     top_file: IO,
-    openff_sys: "Interchange",
+    valence_terms: _ValenceTerms,
+    mdtop: md.Topology,
+    offset: int,
 ):
-    """Write the [ bonds ], [ angles ], and [ dihedrals ] sections."""
-    _write_bonds(top_file, openff_sys)
-    _write_angles(top_file, openff_sys)
-    _write_dihedrals(top_file, openff_sys)
+    """
+    Write the [ bonds ], [ angles ], and [ dihedrals ] sections for a molecule.
+
+    The atoms of ``mdtop`` are those of the Interchange starting from index ``offset``, with
+    bond partners stored by ``_store_bond_partners``, and ``valence_terms`` are the terms of
+    the Interchange from ``_get_valence_terms``.
+    """
+    _write_bonds(top_file, valence_terms, mdtop, offset)
+    _write_angles(top_file, valence_terms, mdtop, offset)
+    _write_dihedrals(top_file, valence_terms, mdtop, offset)
 
 
-def _write_bonds(top_file: IO, openff_sys: "Interchange"):
-    if "Bonds" not in openff_sys.handlers.keys():
+def _write_bonds(
+    top_file: IO, valence_terms: _ValenceTerms, mdtop: md.Topology, offset: int
+):
+    if "Bonds" not in valence_terms:
         return
 
     top_file.write("[ bonds ]\n")
     top_file.write("; ai\taj\tfunc\tr\tk\n")
 
-    bond_handler = openff_sys.handlers["Bonds"]
+    bond_terms, bond_parameters = valence_terms["Bonds"]
 
-    for bond in openff_sys.topology.mdtop.bonds:
+    for bond in mdtop.bonds:
 
         indices = tuple(sorted((bond.atom1.index, bond.atom2.index)))
-        found_match = False
-        for top_key in bond_handler.slot_map:
-            if top_key.atom_indices == indices:
-                pot_key = bond_handler.slot_map[top_key]
-                found_match = True
-                break
-            elif top_key.atom_indices == indices[::-1]:
-                pot_key = bond_handler.slot_map[top_key]
-                found_match = True
-                break
-            else:
-                found_match = False
+        pot_keys = _find_terms(bond_terms, tuple(i + offset for i in indices))
 
-        if not found_match:
-            print(f"Failed to find parameters for bond with indices {indices}")
-            continue
-
-        params = bond_handler.potentials[pot_key].parameters
+        if not pot_keys:
+            raise MissingParametersError(
+                f"Failed to find parameters for bond with indices {indices}"
+            )
 
-        k = params["k"].m_as(unit.Unit("kilojoule / mole / nanometer ** 2"))
-        length = params["length"].to(unit.nanometer).magnitude
+        length, k = bond_parameters[pot_keys[0]]
 
         top_file.write(
             "{:7d} {:7d} {:4s} {:.16g} {:.16g}\n".format(
@@ -809,35 +1267,34 @@ def _write_bonds(top_file: IO, openff_sys: "Interchange"):
             )
         )
 
-        del pot_key
-
     top_file.write("\n\n")
 
 
-def _write_angles(top_file: IO, openff_sys: "Interchange"):
-    if "Angles" not in openff_sys.handlers.keys():
+def _write_angles(
+    top_file: IO, valence_terms: _ValenceTerms, mdtop: md.Topology, offset: int
+):
+    if "Angles" not in valence_terms:
         return
 
-    _store_bond_partners(openff_sys.topology.mdtop)
-
     top_file.write("[ angles ]\n")
     top_file.write("; ai\taj\tak\tfunc\tr\tk\n")
 
-    angle_handler = openff_sys.handlers["Angles"]
+    angle_terms, angle_parameters = valence_terms["Angles"]
 
-    for angle in _iterate_angles(openff_sys.topology.mdtop):
+    for angle in _iterate_angles(mdtop):
         indices = (
             angle[0].index,
             angle[1].index,
             angle[2].index,
         )
-        for top_key in angle_handler.slot_map:
-            if top_key.atom_indices == indices:
-                pot_key = angle_handler.slot_map[top_key]
+        pot_keys = _find_terms(angle_terms, tuple(i + offset for i in indices))
 
-        params = angle_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(unit.Unit("kilojoule / mole / radian ** 2"))
-        theta = params["angle"].to(unit.degree).magnitude
+        if not pot_keys:
+            raise MissingParametersError(
+                f"Failed to find parameters for angle with indices {indices}"
+            )
+
+        theta, k = angle_parameters[pot_keys[0]]
 
         top_file.write(
             "{:7d} {:7d} {:7d} {:4s} {:.16g} {:.16g}\n".format(
@@ -853,117 +1310,91 @@ def _write_angles(top_file: IO, openff_sys: "Interchange"):
     top_file.write("\n\n")
 
 
-def _write_dihedrals(top_file: IO, openff_sys: "Interchange"):
-    if "ProperTorsions" not in openff_sys.handlers:
-        if "RBTorsions" not in openff_sys.handlers:
-            if "ImproperTorsions" not in openff_sys.handlers:
+def _write_dihedrals(
+    top_file: IO, valence_terms: _ValenceTerms, mdtop: md.Topology, offset: int
+):
+    if "ProperTorsions" not in valence_terms:
+        if "RBTorsions" not in valence_terms:
+            if "ImproperTorsions" not in valence_terms:
                 return
 
-    _store_bond_partners(openff_sys.topology.mdtop)
-
     top_file.write("[ dihedrals ]\n")
     top_file.write(";    i      j      k      l   func\n")
 
-    rb_torsion_handler = openff_sys.handlers.get("RBTorsions", [])
-    proper_torsion_handler = openff_sys.handlers.get("ProperTorsions", [])
-    improper_torsion_handler = openff_sys.handlers.get("ImproperTorsions", [])
-
     # TODO: Ensure number of torsions written matches what is expected
-    for proper in _iterate_propers(openff_sys.topology.mdtop):
-        if proper_torsion_handler:
-            for top_key in proper_torsion_handler.slot_map:
-                indices = tuple(a.index for a in proper)
-                if top_key.atom_indices == indices:
-                    pot_key = proper_torsion_handler.slot_map[top_key]
-                    params = proper_torsion_handler.potentials[pot_key].parameters
-
-                    k = params["k"].to(unit.Unit("kilojoule / mol")).magnitude
-                    periodicity = int(params["periodicity"])
-                    phase = params["phase"].to(unit.degree).magnitude
-                    idivf = int(params["idivf"]) if "idivf" in params else 1
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} {:16g} {:16g} {:7d}\n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            1,
-                            phase,
-                            k / idivf,
-                            periodicity,
-                        )
+    for proper in _iterate_propers(mdtop):
+        indices = tuple(a.index for a in proper)
+        topology_indices = tuple(i + offset for i in indices)
+
+        if "ProperTorsions" in valence_terms:
+            proper_terms, proper_parameters = valence_terms["ProperTorsions"]
+            for pot_key in _find_terms(proper_terms, topology_indices):
+                phase, k, periodicity = proper_parameters[pot_key]
+                top_file.write(
+                    "{:7d} {:7d} {:7d} {:7d} {:6d} {:16g} {:16g} {:7d}\n".format(
+                        indices[0] + 1,
+                        indices[1] + 1,
+                        indices[2] + 1,
+                        indices[3] + 1,
+                        1,
+                        phase,
+                        k,
+                        periodicity,
                     )
+                )
         # This should be `if` if a single quartet can be subject to both proper and RB torsions
-        if rb_torsion_handler:
-            for top_key in rb_torsion_handler.slot_map:
-                indices = tuple(a.index for a in proper)
-                if top_key.atom_indices == indices:
-                    pot_key = rb_torsion_handler.slot_map[top_key]
-                    params = rb_torsion_handler.potentials[pot_key].parameters
-
-                    c0 = params["C0"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c1 = params["C1"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c2 = params["C2"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c3 = params["C3"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c4 = params["C4"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c5 = params["C5"].to(unit.Unit("kilojoule / mol")).magnitude
-
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} "
-                        "{:16g} {:16g} {:16g} {:16g} {:16g} {:16g} \n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            3,
-                            c0,
-                            c1,
-                            c2,
-                            c3,
-                            c4,
-                            c5,
-                        )
+        if "RBTorsions" in valence_terms:
+            rb_terms, rb_parameters = valence_terms["RBTorsions"]
+            for pot_key in _find_terms(rb_terms, topology_indices):
+                top_file.write(
+                    "{:7d} {:7d} {:7d} {:7d} {:6d} "
+                    "{:16g} {:16g} {:16g} {:16g} {:16g} {:16g} \n".format(
+                        indices[0] + 1,
+                        indices[1] + 1,
+                        indices[2] + 1,
+                        indices[3] + 1,
+                        3,
+                        *rb_parameters[pot_key],
                     )
+                )
+
+    if "ImproperTorsions" not in valence_terms:
+        return
+
+    # Every ordering of the atoms of each improper is visited, so only exact matches count
+    improper_terms, improper_parameters = valence_terms["ImproperTorsions"]
 
     # TODO: Ensure number of torsions written matches what is expected
-    for improper in _iterate_impropers(openff_sys.topology.mdtop):
-        if improper_torsion_handler:
-            for top_key in improper_torsion_handler.slot_map:
-                indices = tuple(a.index for a in improper)
-                if indices == top_key.atom_indices:
-                    key = improper_torsion_handler.slot_map[top_key]
-                    params = improper_torsion_handler.potentials[key].parameters
-
-                    k = params["k"].to(unit.Unit("kilojoule / mol")).magnitude
-                    periodicity = int(params["periodicity"])
-                    phase = params["phase"].to(unit.degree).magnitude
-                    idivf = int(params["idivf"])
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} {:.16g} {:.16g} {:.16g}\n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            4,
-                            phase,
-                            k / idivf,
-                            periodicity,
-                        )
-                    )
+    for improper in _iterate_impropers(mdtop):
+        indices = tuple(a.index for a in improper)
+        topology_indices = tuple(i + offset for i in indices)
 
+        for pot_key in improper_terms.get(topology_indices, []):
+            phase, k, periodicity = improper_parameters[pot_key]
+            top_file.write(
+                "{:7d} {:7d} {:7d} {:7d} {:6d} {:.16g} {:.16g} {:.16g}\n".format(
+                    indices[0] + 1,
+                    indices[1] + 1,
+                    indices[2] + 1,
+                    indices[3] + 1,
+                    4,
+                    phase,
+                    k,
+                    periodicity,
+                )
+            )
 
-def _write_system(top_file: IO, openff_sys: "Interchange"):
-    """Write the [ system ] section."""
+
+def _write_system(top_file: IO, molecules: List[Tuple[str, int]]):
+    """Write the [ system ] and [ molecules ] sections."""
     top_file.write("[ system ]\n")
     top_file.write("; name \n")
     top_file.write("System name\n\n")
 
     top_file.write("[ molecules ]\n")
     top_file.write("; Compound\tnmols\n")
-    # TODO: Write molecules separately
-    top_file.write("MOL\t1")
-
-    top_file.write("\n")
+    for molecule_name, n_molecules in molecules:
+        top_file.write(f"{molecule_name}\t{n_molecules}\n")
 
 
 def _get_lj_parameters(openff_sys: "Interchange", atom_idx: int) -> Dict:
@@ -976,6 +1407,35 @@ def _get_lj_parameters(openff_sys: "Interchange", atom_idx: int) -> Dict:
     return parameters
 
 
+def _get_lj_parameter_arrays(
+    openff_sys: "Interchange", atom_indices: range
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the sigma (nm) and epsilon (kJ/mol) of each atom in a range.
+
+    Units are converted once per unique potential, rather than once per atom.
+    """
+    vdw_handler = openff_sys.handlers["vdW"]
+    parameters: Dict[PotentialKey, Tuple[float, float]] = dict()
+
+    sigma = np.empty(len(atom_indices))
+    epsilon = np.empty(len(atom_indices))
+
+    for index, atom_idx in enumerate(atom_indices):
+        pot_key = vdw_handler.slot_map[TopologyKey(atom_indices=(atom_idx,))]
+
+        if pot_key not in parameters:
+            potential_parameters = vdw_handler.potentials[pot_key].parameters
+            parameters[pot_key] = (
+                potential_parameters["sigma"].m_as(unit.nanometer),
+                potential_parameters["epsilon"].m_as(unit.Unit("kilojoule / mole")),
+            )
+
+        sigma[index], epsilon[index] = parameters[pot_key]
+
+    return sigma, epsilon
+
+
 def _get_buck_parameters(openff_sys: "Interchange", atom_idx: int) -> Dict:
     buck_hander = openff_sys.handlers["Buckingham-6"]
     atom_key = TopologyKey(atom_indices=(atom_idx,))
@@ -987,11 +1447,22 @@ def _get_buck_parameters(openff_sys: "Interchange", atom_idx: int) -> Dict:
 
 
 def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
-    """Read the contents of a GROMACS Topology (.top) file."""
+    """
+    Read the contents of a GROMACS Topology (.top) file.
+
+    The sections of each [ moleculetype ] are stored as they are read, and processed once for
+    each copy of the molecule listed in the [ molecules ] section, with atom indices offset
+    by the number of atoms before it.
+    """
     from openff.interchange.components.interchange import Interchange
 
     interchange = Interchange()
     current_directive = None
+    # The lines of each section of each [ moleculetype ], keyed by molecule name
+    molecule_types: Dict[str, DefaultDict[str, List[str]]] = dict()
+    current_molecule_type = None
+    # The number of atoms before the molecule currently being processed
+    offset = 0
 
     def process_defaults(interchange: Interchange, line: str):
         fields = line.split()
@@ -1047,6 +1518,8 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
     def process_moleculetype(interchange: Interchange, line: str):
         from openff.toolkit.topology.molecule import Molecule
 
+        nonlocal current_molecule_type
+
         fields = line.split()
         if len(fields) != 2:
             raise Exception
@@ -1056,11 +1529,19 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
         if nrexcl != "3":
             raise Exception()
 
-        molecule = Molecule()
-        molecule.name = molecule_name
+        if molecule_name in molecule_types:
+            raise RuntimeError(
+                f"Found more than one moleculetype named {molecule_name}"
+            )
+
+        molecule_types[molecule_name] = defaultdict(list)
+        current_molecule_type = molecule_name
 
         if interchange.topology is not None:
-            raise Exception
+            return
+
+        molecule = Molecule()
+        molecule.name = molecule_name
 
         mdtop = md.Topology.from_openmm(molecule.to_topology().to_openmm())
         default_chain = mdtop.add_chain()
@@ -1093,7 +1574,7 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
             residue=interchange.topology.mdtop.residue(0),
         )
 
-        topology_key = TopologyKey(atom_indices=(int(atom_number) - 1,))
+        topology_key = TopologyKey(atom_indices=(int(atom_number) - 1 + offset,))
         potential_key = PotentialKey(id=atom_type)
 
         if potential_key not in interchange["vdW"].potentials:
@@ -1126,12 +1607,14 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
 
         atom1, atom2, func, length, k = fields
 
-        interchange.topology.mdtop.add_bond(
-            atom1=interchange.topology.mdtop.atom(int(atom1) - 1),
-            atom2=interchange.topology.mdtop.atom(int(atom2) - 1),
+        topology_key = TopologyKey(
+            atom_indices=(int(i) - 1 + offset for i in [atom1, atom2])
         )
 
-        topology_key = TopologyKey(atom_indices=(int(atom1) - 1, int(atom2) - 1))
+        interchange.topology.mdtop.add_bond(
+            atom1=interchange.topology.mdtop.atom(topology_key.atom_indices[0]),
+            atom2=interchange.topology.mdtop.atom(topology_key.atom_indices[1]),
+        )
         potential_key = PotentialKey(
             id="-".join(str(i) for i in topology_key.atom_indices)
         )
@@ -1159,7 +1642,7 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
         atom1, atom2, atom3, func, theta, k = fields
 
         topology_key = TopologyKey(
-            atom_indices=(int(i) - 1 for i in [atom1, atom2, atom3])
+            atom_indices=(int(i) - 1 + offset for i in [atom1, atom2, atom3])
         )
         potential_key = PotentialKey(
             id="-".join(str(i) for i in topology_key.atom_indices)
@@ -1192,25 +1675,29 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
         atom1, atom2, atom3, atom4, func, phase, k, periodicity = fields
 
         topology_key = TopologyKey(
-            atom_indices=(int(i) - 1 for i in [atom1, atom2, atom3, atom4]),
+            atom_indices=(int(i) - 1 + offset for i in [atom1, atom2, atom3, atom4]),
             mult=0,
         )
 
         def ensure_unique_key(
             handler: Union[BaseProperTorsionHandler, BaseImproperTorsionHandler],
             key: TopologyKey,
-        ):
-            if key in handler.slot_map:
-                key.mult += 1  # type: ignore[operator]
-                ensure_unique_key(handler, key)
-
-        potential_key = PotentialKey(
-            id="-".join(str(i) for i in topology_key.atom_indices),
-        )
+        ) -> TopologyKey:
+            while key in handler.slot_map:
+                key = TopologyKey(
+                    atom_indices=key.atom_indices,
+                    mult=key.mult + 1,  # type: ignore[operator]
+                )
+            return key
 
         if func == "1":
-            ensure_unique_key(interchange["ProperTorsions"], topology_key)
-            potential_key.mult = topology_key.mult
+            topology_key = ensure_unique_key(
+                interchange["ProperTorsions"], topology_key
+            )
+            potential_key = PotentialKey(
+                id="-".join(str(i) for i in topology_key.atom_indices),
+                mult=topology_key.mult,
+            )
 
             potential = Potential(
                 parameters={
@@ -1225,8 +1712,13 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
             interchange["ProperTorsions"].potentials.update({potential_key: potential})
 
         elif func == "4":
-            ensure_unique_key(interchange["ImproperTorsions"], topology_key)
-            potential_key.mult = topology_key.mult
+            topology_key = ensure_unique_key(
+                interchange["ImproperTorsions"], topology_key
+            )
+            potential_key = PotentialKey(
+                id="-".join(str(i) for i in topology_key.atom_indices),
+                mult=topology_key.mult,
+            )
 
             potential = Potential(
                 parameters={
@@ -1245,17 +1737,27 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
             )
 
     def process_molecule(interchange: Interchange, line: str):
+        nonlocal offset
+
         fields = line.split()
         if len(fields) != 2:
             raise Exception
 
         molecule_name, n_molecules = fields
 
-        if n_molecules != "1":
-            raise NotImplementedError(
-                "Only single-molecule topologies are currently supported"
+        if molecule_name not in molecule_types:
+            raise RuntimeError(
+                f"Found molecule {molecule_name} in a molecules directive but did not "
+                "find a moleculetype of the same name."
             )
 
+        for _ in range(int(n_molecules)):
+            offset = interchange.topology.mdtop.n_atoms
+
+            for directive in _MOLECULE_DIRECTIVES:
+                for molecule_line in molecule_types[molecule_name][directive]:
+                    supported_directives[directive](interchange, molecule_line)
+
     def process_system(interchange: Interchange, line: str):
         interchange.name = line
 
@@ -1292,7 +1794,14 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
                 current_directive = line[1:-1].strip()
                 continue
 
-            if current_directive in supported_directives:
+            if current_directive in _MOLECULE_DIRECTIVES:
+                if current_molecule_type is None:
+                    raise RuntimeError(
+                        f"Found a {current_directive} directive outside of a moleculetype"
+                    )
+                molecule_types[current_molecule_type][current_directive].append(line)
+
+            elif current_directive in supported_directives:
                 supported_directives[current_directive](interchange, line)
 
             else:
@@ -429,3 +429,41 @@ def _write_impropers(lmp_file: IO, openff_sys: Interchange):
                         indices[3] + 1,
                     )
                 )
+
+
+def to_lammps_dump(
+    openff_sys: Interchange, file_path: Union[Path, str], positions: unit.Quantity
+):
+    """
+    Write positions of many frames to a LAMMPS dump file, i.e. for use with `rerun`.
+
+    Positions are of shape ``(n_frames, n_atoms, 3)``, and the box of each frame is placed as in
+    the data file written by ``to_lammps``.
+    """
+    if isinstance(file_path, str):
+        path = Path(file_path)
+    if isinstance(file_path, Path):
+        path = file_path
+
+    coords = positions.m_as(unit.angstrom)
+    n_atoms = coords.shape[1]
+
+    if openff_sys.box is None:
+        lengths = np.array([100, 100, 100])
+    else:
+        lengths = np.diag(openff_sys.box.to(unit.angstrom).magnitude)
+
+    with open(path, "w") as dump_file:
+        for step, frame_coords in enumerate(coords):
+            dump_file.write(f"ITEM: TIMESTEP\n{step:d}\n")
+            dump_file.write(f"ITEM: NUMBER OF ATOMS\n{n_atoms:d}\n")
+            dump_file.write("ITEM: BOX BOUNDS pp pp pp\n")
+            for lo, length in zip(frame_coords.min(axis=0), lengths):
+                dump_file.write(f"{lo:.10g} {lo + length:.10g}\n")
+            dump_file.write("ITEM: ATOMS id x y z\n")
+            for atom_index, pos in enumerate(frame_coords):
+                dump_file.write(
+                    "{:d}\t{:.8g}\t{:.8g}\t{:.8g}\n".format(
+                        atom_index + 1, pos[0], pos[1], pos[2]
+                    )
+                )
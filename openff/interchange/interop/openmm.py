@@ -112,6 +112,18 @@ def _process_bond_forces(openff_sys, openmm_sys):
     except KeyError:
         has_constraint_handler = False
 
+    if bond_handler._arrays is not None:
+        # Read arrays directly so that array-backed handlers are not converted to dicts
+        constrained = set()
+        if has_constraint_handler:
+            constrained = {
+                top_key.atom_indices for top_key in constraint_handler.slot_map
+            }
+        _add_bonds_from_arrays(
+            harmonic_bond_force, bond_handler.to_arrays(), constrained
+        )
+        return
+
     for top_key, pot_key in bond_handler.slot_map.items():
         if has_constraint_handler:
             # If this bond show up in the constraints ...
@@ -133,6 +145,33 @@ def _process_bond_forces(openff_sys, openmm_sys):
         )
 
 
+def _add_bonds_from_arrays(harmonic_bond_force, arrays, constrained):
+    """
+    Add bonds stored as ``PotentialArrays`` to a ``HarmonicBondForce``.
+
+    Bonds whose atom indices are in ``constrained`` are skipped.
+    """
+    if arrays.n_terms == 0:
+        return
+
+    k = arrays.get_parameter(
+        "k", off_unit.kilojoule / off_unit.nanometer ** 2 / off_unit.mol
+    ).tolist()
+    length = arrays.get_parameter("length", off_unit.nanometer).tolist()
+
+    for indices, potential_index in zip(
+        arrays.atom_indices.tolist(), arrays.potential_indices.tolist()
+    ):
+        if tuple(indices) in constrained:
+            continue
+        harmonic_bond_force.addBond(
+            particle1=indices[0],
+            particle2=indices[1],
+            length=length[potential_index],
+            k=k[potential_index],
+        )
+
+
 def _process_angle_forces(openff_sys, openmm_sys):
     """
     Process the Angles section of an Interchange object.
@@ -145,6 +184,11 @@ def _process_angle_forces(openff_sys, openmm_sys):
     except KeyError:
         return
 
+    if angle_handler._arrays is not None:
+        # Read arrays directly so that array-backed handlers are not converted to dicts
+        _add_angles_from_arrays(harmonic_angle_force, angle_handler.to_arrays())
+        return
+
     for top_key, pot_key in angle_handler.slot_map.items():
         indices = top_key.atom_indices
         params = angle_handler.potentials[pot_key].parameters
@@ -160,6 +204,30 @@ def _process_angle_forces(openff_sys, openmm_sys):
         )
 
 
+def _add_angles_from_arrays(harmonic_angle_force, arrays):
+    """
+    Add angles stored as ``PotentialArrays`` to a ``HarmonicAngleForce``.
+    """
+    if arrays.n_terms == 0:
+        return
+
+    k = arrays.get_parameter(
+        "k", off_unit.kilojoule / off_unit.rad / off_unit.mol
+    ).tolist()
+    angle = arrays.get_parameter("angle", off_unit.radian).tolist()
+
+    for indices, potential_index in zip(
+        arrays.atom_indices.tolist(), arrays.potential_indices.tolist()
+    ):
+        harmonic_angle_force.addAngle(
+            particle1=indices[0],
+            particle2=indices[1],
+            particle3=indices[2],
+            angle=angle[potential_index],
+            k=k[potential_index],
+        )
+
+
 def _process_torsion_forces(openff_sys, openmm_sys):
     if "ProperTorsions" in openff_sys.handlers:
         _process_proper_torsion_forces(openff_sys, openmm_sys)
@@ -176,6 +244,11 @@ def _process_proper_torsion_forces(openff_sys, openmm_sys):
 
     proper_torsion_handler = openff_sys.handlers["ProperTorsions"]
 
+    if proper_torsion_handler._arrays is not None:
+        # Read arrays directly so that array-backed handlers are not converted to dicts
+        _add_torsions_from_arrays(torsion_force, proper_torsion_handler.to_arrays())
+        return
+
     for top_key, pot_key in proper_torsion_handler.slot_map.items():
         indices = top_key.atom_indices
         params = proper_torsion_handler.potentials[pot_key].parameters
@@ -212,6 +285,40 @@ def _process_proper_torsion_forces(openff_sys, openmm_sys):
         )
 
 
+def _add_torsions_from_arrays(torsion_force, arrays):
+    """
+    Add proper or improper torsions stored as ``PotentialArrays`` to a ``PeriodicTorsionForce``.
+    """
+    if arrays.n_terms == 0:
+        return
+
+    k = arrays.get_parameter("k", off_unit.kilojoule / off_unit.mol)
+    idivf = arrays.get_parameter("idivf", off_unit.dimensionless)
+    if (idivf == 0).any():
+        raise RuntimeError("Found an idivf of 0.")
+    k_over_idivf = (k / idivf).tolist()
+    # Periodicities are stored as floats, so are rounded rather than truncated
+    periodicity = (
+        np.round(arrays.get_parameter("periodicity", off_unit.dimensionless))
+        .astype(int)
+        .tolist()
+    )
+    phase = arrays.get_parameter("phase", off_unit.radian).tolist()
+
+    for indices, potential_index in zip(
+        arrays.atom_indices.tolist(), arrays.potential_indices.tolist()
+    ):
+        torsion_force.addTorsion(
+            indices[0],
+            indices[1],
+            indices[2],
+            indices[3],
+            periodicity[potential_index],
+            phase[potential_index],
+            k_over_idivf[potential_index],
+        )
+
+
 def _process_rb_torsion_forces(openff_sys, openmm_sys):
     """
     Process Ryckaert-Bellemans torsions.
@@ -262,6 +369,11 @@ def _process_improper_torsion_forces(openff_sys, openmm_sys):
 
     improper_torsion_handler = openff_sys.handlers["ImproperTorsions"]
 
+    if improper_torsion_handler._arrays is not None:
+        # Read arrays directly so that array-backed handlers are not converted to dicts
+        _add_torsions_from_arrays(torsion_force, improper_torsion_handler.to_arrays())
+        return
+
     for top_key, pot_key in improper_torsion_handler.slot_map.items():
         indices = top_key.atom_indices
         params = improper_torsion_handler.potentials[pot_key].parameters
@@ -440,19 +552,11 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
         except AttributeError:
             partial_charges = electrostatics_handler.charges
 
-        for top_key, pot_key in vdw_handler.slot_map.items():
-            # TODO: Actually process virtual site vdW parameters here
-            if type(top_key) != TopologyKey:
-                continue
+        for top_key, sigma, epsilon in _get_lj_parameters_by_atom(vdw_handler):
             atom_idx = top_key.atom_indices[0]
 
             partial_charge = partial_charges[top_key]
             # partial_charge = partial_charge.m_as(off_unit.elementary_charge)
-            vdw_potential = vdw_handler.potentials[pot_key]
-            # these are floats, implicitly angstrom and kcal/mol
-            sigma, epsilon = _lj_params_from_potential(vdw_potential)
-            sigma = sigma.m_as(off_unit.nanometer)
-            epsilon = epsilon.m_as(off_unit.kilojoule / off_unit.mol)
 
             if combine_nonbonded_forces:
                 non_bonded_force.setParticleParameters(
@@ -560,6 +664,43 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
             # vdw_force.setExceptionParameters(i, p1, p2, 0.0, 0.0, 0.0)
 
 
+def _get_lj_parameters_by_atom(vdw_handler):
+    """
+    Yield the topology key, sigma (nm) and epsilon (kJ/mol) of each atom in a vdW handler.
+    """
+    if vdw_handler._arrays is not None:
+        # Read arrays directly so that array-backed handlers are not converted to dicts
+        arrays = vdw_handler.to_arrays()
+        if arrays.n_terms == 0:
+            return
+        sigma = arrays.get_parameter("sigma", off_unit.nanometer).tolist()
+        epsilon = arrays.get_parameter(
+            "epsilon", off_unit.kilojoule / off_unit.mol
+        ).tolist()
+        for atom_indices, potential_index in zip(
+            arrays.atom_indices.tolist(), arrays.potential_indices.tolist()
+        ):
+            yield (
+                TopologyKey(atom_indices=tuple(atom_indices)),
+                sigma[potential_index],
+                epsilon[potential_index],
+            )
+        return
+
+    for top_key, pot_key in vdw_handler.slot_map.items():
+        # TODO: Actually process virtual site vdW parameters here
+        if type(top_key) != TopologyKey:
+            continue
+
+        vdw_potential = vdw_handler.potentials[pot_key]
+        sigma, epsilon = _lj_params_from_potential(vdw_potential)
+        yield (
+            top_key,
+            sigma.m_as(off_unit.nanometer),
+            epsilon.m_as(off_unit.kilojoule / off_unit.mol),
+        )
+
+
 def _process_virtual_sites(openff_sys, openmm_sys):
     try:
         virtual_site_handler = openff_sys.handlers["VirtualSites"]
@@ -574,6 +715,8 @@ def _process_virtual_sites(openff_sys, openmm_sys):
         f for f in openmm_sys.getForces() if type(f) == openmm.NonbondedForce
     ][0]
 
+    charges = coul_handler.charges_with_virtual_sites
+
     for virtual_site_key in virtual_site_handler.slot_map:
         vdw_key = vdw_handler.slot_map.get(virtual_site_key)
         coul_key = coul_handler.slot_map.get(virtual_site_key)
@@ -586,9 +729,7 @@ def _process_virtual_sites(openff_sys, openmm_sys):
         if coul_key is None:
             charge = 0.0
         else:
-            charge = coul_handler.charges_with_virtual_sites[virtual_site_key].m_as(
-                off_unit.elementary_charge,
-            )
+            charge = charges[virtual_site_key].m_as(off_unit.elementary_charge)
         if vdw_key is None:
             sigma = 1.0
             epsilon = 0.0
@@ -817,7 +958,10 @@ def _convert_periodic_torsion_force(force):
         # TODO: Process layered torsions
         top_key = TopologyKey(atom_indices=(atom1, atom2, atom3, atom4), mult=0)
         while top_key in proper_torsion_handler.slot_map:
-            top_key.mult += 1
+            top_key = TopologyKey(
+                atom_indices=top_key.atom_indices,
+                mult=top_key.mult + 1,  # type: ignore[operator]
+            )
 
         pot_key = PotentialKey(id=f"{atom1}-{atom2}-{atom3}-{atom4}", mult=top_key.mult)
         pot = Potential(
@@ -454,8 +454,14 @@ def _process_single_dihedral(
         pot = Potential(parameters={"k": k, "periodicity": periodicity, "phase": phase})
 
         while pot_key in handler.potentials:
-            pot_key.mult += 1  # type: ignore[operator]
-            top_key.mult += 1  # type: ignore[operator]
+            pot_key = PotentialKey(
+                id=pot_key.id,
+                mult=pot_key.mult + 1,  # type: ignore[operator]
+            )
+            top_key = TopologyKey(
+                atom_indices=top_key.atom_indices,
+                mult=top_key.mult + 1,  # type: ignore[operator]
+            )
 
         handler.slot_map.update({top_key: pot_key})
         handler.potentials.update({pot_key: pot})
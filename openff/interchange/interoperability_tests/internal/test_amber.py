@@ -5,10 +5,16 @@ import pytest
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
 from openff.units import unit
+from openmm import unit as openmm_unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.drivers import get_amber_energies, get_openmm_energies
+from openff.interchange.drivers.amber import get_amber_rerun_energies
 from openff.interchange.testing import _BaseTest
+from openff.interchange.testing.utils import (
+    _compare_conformer_energies,
+    _get_conformer_positions,
+)
 
 kj_mol = unit.kilojoule / unit.mol
 
@@ -79,3 +85,21 @@ class TestAmber(_BaseTest):
                 "Electrostatics": (0.5 if constrained else 0.05) * kj_mol,
             },
         )
+
+    def test_amber_rerun_energies(self):
+        mol = Molecule.from_smiles("CCOC")
+        mol.generate_conformers(n_conformers=3, rms_cutoff=0.1 * openmm_unit.angstrom)
+
+        sage = ForceField("openff_unconstrained-2.0.0.offxml")
+
+        off_sys = Interchange.from_smirnoff(sage, mol.to_topology())
+        off_sys.box = [4, 4, 4]
+
+        # Trajectories store positions to 0.001 Angstrom, unlike .inpcrd files
+        _compare_conformer_energies(
+            off_sys,
+            _get_conformer_positions(mol),
+            get_amber_rerun_energies,
+            get_amber_energies,
+            atol=0.1,
+        )
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from math import exp
 
 import mdtraj as md
@@ -17,8 +18,12 @@ from openff.interchange.components.nonbonded import BuckinghamvdWHandler
 from openff.interchange.components.potentials import Potential
 from openff.interchange.components.smirnoff import SMIRNOFFVirtualSiteHandler
 from openff.interchange.drivers import get_gromacs_energies, get_openmm_energies
-from openff.interchange.exceptions import GMXMdrunError, UnsupportedExportError
-from openff.interchange.interop.internal.gromacs import from_gro
+from openff.interchange.exceptions import (
+    GMXMdrunError,
+    MissingParametersError,
+    UnsupportedExportError,
+)
+from openff.interchange.interop.internal.gromacs import from_gro, from_top
 from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing import _BaseTest
 from openff.interchange.testing.utils import needs_gmx
@@ -120,6 +125,40 @@ class TestGROMACS(_BaseTest):
             },
         )
 
+    @skip_if_missing("intermol")
+    def test_multi_term_torsion_intermol(self):
+        """Test that layered torsion terms are read by InterMol as keys with increasing `mult`"""
+        parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+        molecule = Molecule.from_smiles("OC=O")
+        molecule.generate_conformers(n_conformers=1)
+
+        out = Interchange.from_smirnoff(
+            force_field=parsley, topology=molecule.to_topology()
+        )
+        out.box = [4, 4, 4]
+        out.positions = molecule.conformers[0]
+
+        out.to_top("out.top")
+        out.to_gro("out.gro")
+
+        converted = Interchange.from_gromacs("out.top", "out.gro", reader="intermol")
+
+        def get_mults(handler):
+            mults = defaultdict(list)
+            for key in handler.slot_map:
+                mults[key.atom_indices].append(key.mult)
+            return mults
+
+        original_mults = get_mults(out["ProperTorsions"])
+        converted_mults = get_mults(converted["ProperTorsions"])
+
+        assert max(len(mults) for mults in converted_mults.values()) > 1
+        assert converted_mults.keys() == original_mults.keys()
+
+        for indices, mults in converted_mults.items():
+            assert sorted(mults) == list(range(len(original_mults[indices])))
+
     @skip_if_missing("intermol")
     def test_set_mixing_rule(self, ethanol_top, parsley):
         from intermol.gromacs.gromacs_parser import GromacsParser
@@ -140,6 +179,171 @@ class TestGROMACS(_BaseTest):
         geometric = GromacsParser("geometric.top", "tmp.gro").read()
         assert geometric.combination_rule == "Multiply-Sigeps"
 
+    def test_reversed_valence_keys(self, ethanol_top, parsley):
+        openff_sys = Interchange.from_smirnoff(
+            force_field=parsley, topology=ethanol_top
+        )
+        openff_sys.to_top("forward.top")
+
+        for handler_name in ["Bonds", "Angles", "ProperTorsions"]:
+            handler = openff_sys[handler_name]
+            handler.slot_map = {
+                TopologyKey(
+                    atom_indices=top_key.atom_indices[::-1], mult=top_key.mult
+                ): pot_key
+                for top_key, pot_key in handler.slot_map.items()
+            }
+
+        openff_sys.to_top("reversed.top")
+
+        with open("forward.top") as forward, open("reversed.top") as reverse:
+            assert forward.read() == reverse.read()
+
+    def test_deduplicated_molecule_types(self, parsley):
+        water = Molecule.from_smiles("O")
+        ethanol = Molecule.from_smiles("CCO")
+
+        top = _OFFBioTop.from_molecules([water, water, ethanol, water, ethanol])
+        top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+        openff_sys = Interchange.from_smirnoff(parsley, top)
+        openff_sys.to_top("out.top")
+
+        with open("out.top") as top_file:
+            contents = top_file.read()
+
+        assert contents.count("[ moleculetype ]") == 2
+        assert contents.split("[ molecules ]")[1].split("\n")[2:6] == [
+            "MOL0\t2",
+            "MOL1\t1",
+            "MOL0\t1",
+            "MOL1\t1",
+        ]
+
+    def test_valence_terms_indexed_once(self, parsley, monkeypatch):
+        from openff.interchange.interop.internal import gromacs
+
+        water = Molecule.from_smiles("O")
+        ethanol = Molecule.from_smiles("CCO")
+
+        top = _OFFBioTop.from_molecules([water, water, ethanol, water, ethanol])
+        top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+        openff_sys = Interchange.from_smirnoff(parsley, top)
+
+        indexed = list()
+        get_terms_by_atom_indices = gromacs._get_terms_by_atom_indices
+
+        def counting_get_terms_by_atom_indices(handler):
+            indexed.append(handler.type)
+            return get_terms_by_atom_indices(handler)
+
+        monkeypatch.setattr(
+            gromacs, "_get_terms_by_atom_indices", counting_get_terms_by_atom_indices
+        )
+        openff_sys.to_top("out.top")
+
+        # Once per handler, not once per molecule type
+        assert sorted(indexed) == sorted(
+            {"Bonds", "Angles", "ProperTorsions", "ImproperTorsions"}
+            & set(openff_sys.handlers)
+        )
+
+    def test_deduplicated_molecule_types_energies(self, parsley_unconstrained):
+        water = Molecule.from_smiles("O")
+        ethanol = Molecule.from_smiles("CCO")
+        molecules = [water, water, ethanol, water, ethanol]
+
+        for molecule in [water, ethanol]:
+            molecule.generate_conformers(n_conformers=1)
+
+        top = _OFFBioTop.from_molecules(molecules)
+        top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+        openff_sys = Interchange.from_smirnoff(parsley_unconstrained, top)
+        openff_sys.box = [4, 4, 4]
+        # Space out the molecules along a diagonal of the box
+        openff_sys.positions = np.concatenate(
+            [
+                molecule.conformers[0].value_in_unit(openmm_unit.nanometer)
+                + 0.6 * index
+                for index, molecule in enumerate(molecules)
+            ]
+        )
+
+        get_gromacs_energies(openff_sys).compare(
+            get_openmm_energies(openff_sys),
+            custom_tolerances={
+                "vdW": 2 * unit.kilojoule / unit.mol,
+                "Electrostatics": 2 * unit.kilojoule / unit.mol,
+            },
+        )
+
+    def test_missing_bond_parameters(self, ethanol_top, parsley):
+        openff_sys = Interchange.from_smirnoff(
+            force_field=parsley, topology=ethanol_top
+        )
+        bonds = openff_sys["Bonds"]
+        bonds.slot_map.pop(next(iter(bonds.slot_map)))
+
+        with pytest.raises(MissingParametersError, match="bond with indices"):
+            openff_sys.to_top("out.top")
+
+    def test_missing_angle_parameters(self, ethanol_top, parsley):
+        openff_sys = Interchange.from_smirnoff(
+            force_field=parsley, topology=ethanol_top
+        )
+        angles = openff_sys["Angles"]
+        angles.slot_map.pop(next(iter(angles.slot_map)))
+
+        with pytest.raises(MissingParametersError, match="angle with indices"):
+            openff_sys.to_top("out.top")
+
+    def test_split_potential_molecule_types(self, parsley_unconstrained):
+        """Test that a molecule with modified valence parameters gets its own molecule type"""
+        water = Molecule.from_smiles("O")
+        water.generate_conformers(n_conformers=1)
+
+        top = _OFFBioTop.from_molecules(3 * [water])
+        top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+        openff_sys = Interchange.from_smirnoff(parsley_unconstrained, top)
+        openff_sys.box = [4, 4, 4]
+        openff_sys.positions = np.concatenate(
+            [
+                water.conformers[0].value_in_unit(openmm_unit.nanometer) + 0.6 * index
+                for index in range(3)
+            ]
+        )
+
+        bonds = openff_sys["Bonds"]
+        top_key = TopologyKey(atom_indices=(3, 4))
+        new_pot_key = bonds.split_potential(bonds.slot_map[top_key], [top_key])
+        parameters = bonds.potentials[new_pot_key].parameters
+        bonds.potentials[new_pot_key] = Potential(
+            parameters={"k": parameters["k"], "length": 1.1 * parameters["length"]}
+        )
+
+        openff_sys.to_top("out.top")
+
+        with open("out.top") as top_file:
+            contents = top_file.read()
+
+        assert contents.count("[ moleculetype ]") == 2
+        assert contents.split("[ molecules ]")[1].split("\n")[2:5] == [
+            "MOL0\t1",
+            "MOL1\t1",
+            "MOL0\t1",
+        ]
+
+        get_gromacs_energies(openff_sys).compare(
+            get_openmm_energies(openff_sys),
+            custom_tolerances={
+                "vdW": 2 * unit.kilojoule / unit.mol,
+                "Electrostatics": 2 * unit.kilojoule / unit.mol,
+            },
+        )
+
     @pytest.mark.xfail(
         reason="cannot test unsupported mixing rules in GROMACS with current SMIRNOFFvdWHandler model"
     )
@@ -153,6 +357,27 @@ class TestGROMACS(_BaseTest):
         with pytest.raises(UnsupportedExportError, match="rule `geometric` not compat"):
             openff_sys.to_top("out.top")
 
+    def test_gro_file_chunks(self, ethanol_top, parsley, monkeypatch):
+        from openff.interchange.interop.internal import gromacs
+
+        openff_sys = Interchange.from_smirnoff(
+            force_field=parsley, topology=ethanol_top
+        )
+        openff_sys.box = [4, 4, 4]
+        openff_sys.positions = np.random.default_rng(0).uniform(
+            0, 4, (ethanol_top.n_topology_atoms, 3)
+        )
+        openff_sys.to_gro("one_chunk.gro")
+
+        # Split the lines of atoms into chunks, the last of which is not full
+        monkeypatch.setattr(gromacs, "_GRO_CHUNK_SIZE", 5)
+        openff_sys.to_gro("many_chunks.gro")
+
+        with open("one_chunk.gro") as one_chunk, open("many_chunks.gro") as many:
+            assert one_chunk.read() == many.read()
+
+        assert np.allclose(from_gro("many_chunks.gro").positions, openff_sys.positions)
+
     @pytest.mark.slow()
     def test_residue_names_in_gro_file(self):
         """Test that residue names > 5 characters don't break .gro file output"""
@@ -226,6 +451,46 @@ class TestGROMACS(_BaseTest):
             get_gromacs_energies(out, mdp="cutoff_buck")
 
 
+class TestGROMACSFromTop(_BaseTest):
+    def test_multiple_molecule_types_roundtrip(self, parsley):
+        water = Molecule.from_smiles("O")
+        ethanol = Molecule.from_smiles("CCO")
+
+        top = _OFFBioTop.from_molecules([water, water, ethanol, water, ethanol])
+        top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+        openff_sys = Interchange.from_smirnoff(parsley, top)
+        openff_sys.to_top("out.top")
+
+        converted = from_top("out.top", "out.gro")
+
+        n_atoms = top.mdtop.n_atoms
+        assert converted.topology.mdtop.n_atoms == n_atoms
+        assert converted.topology.mdtop.n_bonds == top.mdtop.n_bonds
+
+        def get_atom_indices(handler):
+            return sorted(
+                min(key.atom_indices, key.atom_indices[::-1])
+                for key in handler.slot_map
+            )
+
+        for handler_name in ["Bonds", "Angles", "ProperTorsions"]:
+            assert get_atom_indices(converted[handler_name]) == get_atom_indices(
+                openff_sys[handler_name]
+            )
+
+        np.testing.assert_allclose(
+            [
+                converted["Electrostatics"].charges[TopologyKey(atom_indices=(i,))].m
+                for i in range(n_atoms)
+            ],
+            [
+                openff_sys["Electrostatics"].charges[TopologyKey(atom_indices=(i,))].m
+                for i in range(n_atoms)
+            ],
+        )
+
+
 @needs_gmx
 class TestGROMACSVirtualSites(_BaseTest):
     @pytest.fixture()
@@ -8,8 +8,15 @@ from openmm import unit as omm_unit
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop
 from openff.interchange.drivers import get_lammps_energies, get_openmm_energies
-from openff.interchange.drivers.lammps import _write_lammps_input
-from openff.interchange.testing.utils import needs_lmp
+from openff.interchange.drivers.lammps import (
+    _write_lammps_input,
+    get_lammps_rerun_energies,
+)
+from openff.interchange.testing.utils import (
+    _compare_conformer_energies,
+    _get_conformer_positions,
+    needs_lmp,
+)
 
 
 @needs_lmp
@@ -80,3 +87,24 @@ def test_to_lammps_single_mols(mol, n_mols):
             "Torsion": 3e-5 * omm_unit.kilojoule_per_mole,
         },
     )
+
+
+@needs_lmp
+def test_lammps_rerun_energies():
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    mol = Molecule.from_smiles("CCOC")
+    mol.generate_conformers(n_conformers=3, rms_cutoff=0.1 * omm_unit.angstrom)
+    top = _OFFBioTop.from_molecules([mol])
+    top.mdtop = md.Topology.from_openmm(top.to_openmm())
+
+    openff_sys = Interchange.from_smirnoff(parsley, top)
+    openff_sys.box = [10, 10, 10]
+
+    _compare_conformer_energies(
+        openff_sys,
+        _get_conformer_positions(mol),
+        get_lammps_rerun_energies,
+        get_lammps_energies,
+        atol=1e-3,
+    )
@@ -11,14 +11,21 @@ from openmm import unit as openmm_unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop
-from openff.interchange.components.smirnoff import SMIRNOFFVirtualSiteHandler
+from openff.interchange.components.potentials import PotentialArrays
+from openff.interchange.components.smirnoff import (
+    SMIRNOFFAngleHandler,
+    SMIRNOFFVirtualSiteHandler,
+)
 from openff.interchange.drivers.openmm import _get_openmm_energies, get_openmm_energies
 from openff.interchange.exceptions import (
     MissingPositionsError,
     UnsupportedCutoffMethodError,
     UnsupportedExportError,
 )
-from openff.interchange.interop.openmm import from_openmm
+from openff.interchange.interop.openmm import (
+    _convert_periodic_torsion_force,
+    from_openmm,
+)
 from openff.interchange.testing import _BaseTest
 from openff.interchange.utils import get_test_file_path
 
@@ -219,6 +226,77 @@ def test_openmm_roundtrip(mol_smi):
     )
 
 
+def test_angle_arrays_export(monkeypatch):
+    """Test that only array-backed angle handlers are exported through arrays"""
+    parsley = ForceField("openff-1.0.0.offxml")
+    out = Interchange.from_smirnoff(parsley, Molecule.from_smiles("CCO").to_topology())
+
+    def get_angles(system):
+        for force in system.getForces():
+            if isinstance(force, openmm.HarmonicAngleForce):
+                return [
+                    force.getAngleParameters(i) for i in range(force.getNumAngles())
+                ]
+
+    def _from_dicts(*args, **kwargs):
+        raise AssertionError("Dict-backed handlers should not be converted to arrays")
+
+    with monkeypatch.context() as m:
+        m.setattr(PotentialArrays, "from_dicts", _from_dicts)
+        expected = get_angles(out.to_openmm())
+
+    lazy = SMIRNOFFAngleHandler.from_arrays(out["Angles"].to_arrays())
+    out.handlers["Angles"] = lazy
+
+    assert get_angles(out.to_openmm()) == expected
+    assert "slot_map" not in lazy.__dict__
+
+
+def test_from_smirnoff_use_arrays(monkeypatch):
+    """Test that handlers stored as arrays by from_smirnoff are exported without dicts"""
+    parsley = ForceField("openff-1.0.0.offxml")
+    mol = Molecule.from_smiles("CC(=O)N")
+    mol.generate_conformers(n_conformers=1)
+
+    expected = Interchange.from_smirnoff(parsley, mol.to_topology())
+    out = Interchange.from_smirnoff(parsley, mol.to_topology(), use_arrays=True)
+
+    for handler_name in ["Bonds", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"]:
+        assert out[handler_name]._arrays is not None
+
+    def _to_dicts(*args, **kwargs):
+        raise AssertionError("Array-backed handlers should not be converted to dicts")
+
+    with monkeypatch.context() as m:
+        m.setattr(PotentialArrays, "to_dicts", _to_dicts)
+        system = out.to_openmm()
+
+    _get_openmm_energies(
+        omm_sys=system, box_vectors=None, positions=mol.conformers[0]
+    ).compare(
+        _get_openmm_energies(
+            omm_sys=expected.to_openmm(), box_vectors=None, positions=mol.conformers[0]
+        )
+    )
+
+
+def test_from_openmm_multi_term_torsion():
+    """Test that layered torsion terms are imported as keys with increasing `mult`"""
+    force = openmm.PeriodicTorsionForce()
+    for periodicity in range(1, 4):
+        force.addTorsion(0, 1, 2, 3, periodicity, 0.0, float(periodicity))
+
+    handler = _convert_periodic_torsion_force(force)
+
+    assert [key.mult for key in handler.slot_map] == [0, 1, 2]
+    assert {key.atom_indices for key in handler.slot_map} == {(0, 1, 2, 3)}
+
+    for top_key, pot_key in handler.slot_map.items():
+        assert pot_key.mult == top_key.mult
+        parameters = handler.potentials[pot_key].parameters
+        assert parameters["periodicity"].m == top_key.mult + 1
+
+
 @pytest.mark.xfail(reason="Broken because of splitting non-bonded forces")
 @pytest.mark.slow()
 def test_combine_nonbonded_forces():
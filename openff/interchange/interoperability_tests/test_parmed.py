@@ -0,0 +1,34 @@
+import parmed as pmd
+
+from openff.interchange.components.smirnoff import SMIRNOFFProperTorsionHandler
+from openff.interchange.interop.parmed import _process_single_dihedral
+from openff.interchange.testing import _BaseTest
+
+
+class TestFromParmEd(_BaseTest):
+    def test_multi_term_torsion(self):
+        """Test that layered torsion terms are imported as keys with increasing `mult`"""
+        structure = pmd.Structure()
+        for name in ["C1", "C2", "C3", "C4"]:
+            structure.add_atom(pmd.Atom(name=name), "MOL", 1)
+
+        for periodicity in range(1, 4):
+            structure.dihedrals.append(
+                pmd.Dihedral(
+                    *structure.atoms,
+                    type=pmd.DihedralType(float(periodicity), periodicity, 0.0),
+                )
+            )
+
+        handler = SMIRNOFFProperTorsionHandler()
+
+        for dihedral in structure.dihedrals:
+            _process_single_dihedral(dihedral, dihedral.type, handler, 0)
+
+        assert [key.mult for key in handler.slot_map] == [1, 2, 3]
+        assert {key.atom_indices for key in handler.slot_map} == {(0, 1, 2, 3)}
+
+        for top_key, pot_key in handler.slot_map.items():
+            assert pot_key.mult == top_key.mult
+            parameters = handler.potentials[pot_key].parameters
+            assert parameters["periodicity"].m == top_key.mult
@@ -1,5 +1,6 @@
 """Custom Pydantic models."""
-from typing import Optional, Tuple
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar
 
 from openff.units import unit
 from pydantic import BaseModel, Field
@@ -7,6 +8,8 @@ from typing_extensions import Literal
 
 from openff.interchange.types import custom_quantity_encoder, json_loader
 
+K = TypeVar("K", bound="_ImmutableKey")
+
 
 class DefaultModel(BaseModel):
     """A custom Pydantic model used by other components."""
@@ -22,7 +25,112 @@ class DefaultModel(BaseModel):
         arbitrary_types_allowed = True
 
 
-class TopologyKey(DefaultModel):
+class _ImmutableKey:
+    """
+    Base class for lightweight, immutable and hashable keys.
+
+    Keys are created many times while matching and exporting parameters, so they are not
+    validated when created. A Pydantic model (``_model``) describing the same fields is
+    instead used to validate data when keys are (de)serialized.
+    """
+
+    __slots__ = ("_hash",)
+
+    _fields: Tuple[str, ...] = tuple()
+    _model: Type[DefaultModel]
+
+    def _set_values(self, *values) -> None:
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, "_hash", hash(values))
+
+    def _values(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def __setattr__(self, name, value):
+        raise TypeError(
+            f'"{self.__class__.__name__}" is immutable and does not support item assignment'
+        )
+
+    def __delattr__(self, name):
+        raise TypeError(f'"{self.__class__.__name__}" is immutable')
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._hash == other._hash and self._values() == other._values()
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{self.__class__.__name__}({fields})"
+
+    def __reduce__(self):
+        return self.__class__, self._values()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def dict(self) -> Dict[str, Any]:
+        """Return the fields of this key as a dictionary."""
+        return {field: getattr(self, field) for field in self._fields}
+
+    def json(self, **kwargs) -> str:
+        """Serialize this key to JSON, validating its fields."""
+        return self._model(**self.dict()).json(**kwargs)
+
+    @classmethod
+    def parse_obj(cls: Type[K], obj: Any) -> K:
+        """Create a key from a dictionary, validating its fields."""
+        return cls(**cls._model.parse_obj(obj).dict())
+
+    @classmethod
+    def parse_raw(cls: Type[K], data: str) -> K:
+        """Create a key from JSON, validating its fields."""
+        return cls(**cls._model.parse_raw(data).dict())
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls: Type[K], value: Any) -> K:
+        """Validate a key, or data describing one, when used as a field of a model."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, _ImmutableKey):
+            raise TypeError(
+                f"Expected a {cls.__name__}, found {value.__class__.__name__}."
+            )
+        return cls.parse_obj(value)
+
+    @classmethod
+    def __modify_schema__(cls, field_schema):
+        field_schema.update(cls._model.schema())
+
+
+class _TopologyKeyModel(DefaultModel):
+    atom_indices: Tuple[int, ...] = Field(
+        tuple(), description="The indices of the atoms occupied by this interaction"
+    )
+    mult: Optional[int] = Field(
+        None, description="The index of this duplicate interaction"
+    )
+    bond_order: Optional[float] = Field(
+        None,
+        description="If this key represents as topology component subject to interpolation "
+        "between multiple parameters(s), the bond order determining the coefficients of the wrapped potentials.",
+    )
+
+
+class TopologyKey(_ImmutableKey):
     """
     A unique identifier of a segment of a chemical topology.
 
@@ -62,25 +170,29 @@ class TopologyKey(DefaultModel):
 
     """
 
-    atom_indices: Tuple[int, ...] = Field(
-        tuple(), description="The indices of the atoms occupied by this interaction"
-    )
-    mult: Optional[int] = Field(
-        None, description="The index of this duplicate interaction"
-    )
-    bond_order: Optional[float] = Field(
-        None,
-        description="If this key represents as topology component subject to interpolation "
-        "between multiple parameters(s), the bond order determining the coefficients of the wrapped potentials.",
-    )
+    __slots__ = ("atom_indices", "mult", "bond_order")
 
-    def __hash__(self):
-        return hash((self.atom_indices, self.mult, self.bond_order))
+    _fields = ("atom_indices", "mult", "bond_order")
+    _model = _TopologyKeyModel
 
+    atom_indices: Tuple[int, ...]
+    mult: Optional[int]
+    bond_order: Optional[float]
 
-class VirtualSiteKey(DefaultModel):
-    """A unique identifier of a virtual site in the scope of a chemical topology."""
+    def __init__(
+        self,
+        atom_indices: Iterable[int] = tuple(),
+        mult: Optional[int] = None,
+        bond_order: Optional[float] = None,
+    ):
+        self._set_values(
+            tuple(map(int, atom_indices)),
+            None if mult is None else int(mult),
+            None if bond_order is None else float(bond_order),
+        )
 
+
+class _VirtualSiteKeyModel(DefaultModel):
     atom_indices: Tuple[int, ...] = Field(
         tuple(), description="The indices of the atoms that anchor this virtual site"
     )
@@ -89,11 +201,57 @@ class VirtualSiteKey(DefaultModel):
         description="The `match` attribute of the associated virtual site type"
     )
 
-    def __hash__(self):
-        return hash((self.atom_indices, self.type, self.match))
 
+class VirtualSiteKey(_ImmutableKey):
+    """A unique identifier of a virtual site in the scope of a chemical topology."""
+
+    __slots__ = ("atom_indices", "type", "match")
+
+    _fields = ("atom_indices", "type", "match")
+    _model = _VirtualSiteKeyModel
 
-class PotentialKey(DefaultModel):
+    atom_indices: Tuple[int, ...]
+    type: str
+    match: Literal["once", "all_permutations"]
+
+    def __init__(
+        self,
+        atom_indices: Iterable[int] = tuple(),
+        *,
+        type: str,
+        match: Literal["once", "all_permutations"],
+    ):
+        self._set_values(tuple(map(int, atom_indices)), type, match)
+
+    def __reduce__(self):
+        # `type` and `match` are keyword-only, so cannot be passed positionally
+        return (
+            partial(self.__class__, type=self.type, match=self.match),
+            (self.atom_indices,),
+        )
+
+
+class _PotentialKeyModel(DefaultModel):
+    id: str = Field(
+        ...,
+        description="A unique identifier of this potential, i.e. a SMARTS pattern or an atom type",
+    )
+    mult: Optional[int] = Field(
+        None, description="The index of this duplicate interaction"
+    )
+    associated_handler: Optional[str] = Field(
+        None,
+        description="The type of handler this potential key is associated with, "
+        "i.e. 'Bonds', 'vdW', or 'LibraryCharges",
+    )
+    bond_order: Optional[float] = Field(
+        None,
+        description="If this is a key to a WrappedPotential interpolating multiple parameter(s), "
+        "the bond order determining the coefficients of the wrapped potentials.",
+    )
+
+
+class PotentialKey(_ImmutableKey):
     """
     A unique identifier of an instance of physical parameters as applied to a segment of a chemical topology.
 
@@ -128,23 +286,26 @@ class PotentialKey(DefaultModel):
 
     """
 
-    id: str = Field(
-        ...,
-        description="A unique identifier of this potential, i.e. a SMARTS pattern or an atom type",
-    )
-    mult: Optional[int] = Field(
-        None, description="The index of this duplicate interaction"
-    )
-    associated_handler: Optional[str] = Field(
-        None,
-        description="The type of handler this potential key is associated with, "
-        "i.e. 'Bonds', 'vdW', or 'LibraryCharges",
-    )
-    bond_order: Optional[float] = Field(
-        None,
-        description="If this is a key to a WrappedPotential interpolating multiple parameter(s), "
-        "the bond order determining the coefficients of the wrapped potentials.",
-    )
-
-    def __hash__(self):
-        return hash((self.id, self.mult, self.associated_handler, self.bond_order))
+    __slots__ = ("id", "mult", "associated_handler", "bond_order")
+
+    _fields = ("id", "mult", "associated_handler", "bond_order")
+    _model = _PotentialKeyModel
+
+    id: str
+    mult: Optional[int]
+    associated_handler: Optional[str]
+    bond_order: Optional[float]
+
+    def __init__(
+        self,
+        id: str,
+        mult: Optional[int] = None,
+        associated_handler: Optional[str] = None,
+        bond_order: Optional[float] = None,
+    ):
+        self._set_values(
+            id,
+            None if mult is None else int(mult),
+            associated_handler,
+            None if bond_order is None else float(bond_order),
+        )
@@ -1,12 +1,13 @@
 """Assorted utilities used in testing."""
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Tuple
+from typing import Callable, DefaultDict, Dict, List, Tuple
 
 import mdtraj as md
 import numpy as np
 import openmm
 import pytest
 from openff.toolkit.topology import Molecule
+from openff.units import unit
 from openff.utilities.utilities import has_executable
 from openmm import unit as openmm_unit
 
@@ -54,6 +55,46 @@ def _top_from_smiles(
     return top
 
 
+def _get_conformer_positions(molecule: Molecule) -> np.ndarray:
+    """Stack the conformers of a molecule into an array of shape (n_conformers, n_atoms, 3) in nm."""
+    return np.stack(
+        [
+            conformer.value_in_unit(openmm_unit.nanometer)
+            for conformer in molecule.conformers
+        ]
+    )
+
+
+def _compare_conformer_energies(
+    interchange: Interchange,
+    positions: np.ndarray,
+    get_conformer_energies: Callable,
+    get_energies: Callable,
+    **tolerances,
+):
+    """
+    Compare energies of many conformers evaluated in one call to those evaluated one at a time.
+
+    ``get_conformer_energies`` is a driver like ``get_openmm_conformer_energies``, returning
+    an array of shape (n_conformers, 5) in kJ/mol, and ``get_energies`` is the matching
+    single-point driver, like ``get_openmm_energies``. Extra keyword arguments are passed
+    to ``np.testing.assert_allclose``.
+    """
+    energies = get_conformer_energies(interchange, positions)
+
+    assert energies.shape == (len(positions), 5)
+
+    for conformer_positions, conformer_energies in zip(positions, energies):
+        interchange.positions = conformer_positions
+        reference = get_energies(interchange).energies
+
+        np.testing.assert_allclose(
+            conformer_energies,
+            [energy.m_as(unit.kilojoule / unit.mol) for energy in reference.values()],
+            **tolerances,
+        )
+
+
 def _get_charges_from_openmm_system(omm_sys: openmm.System):
     for force in omm_sys.getForces():
         if type(force) == openmm.NonbondedForce:
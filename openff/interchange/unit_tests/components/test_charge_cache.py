@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from openff.toolkit.topology import Molecule
+from openff.units import unit
+
+from openff.interchange.components.charge_cache import (
+    InMemoryChargeCache,
+    SQLiteChargeCache,
+    get_charge_cache,
+    set_charge_cache,
+)
+from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.components.smirnoff import SMIRNOFFElectrostaticsHandler
+from openff.interchange.testing import _BaseTest
+
+
+class TestChargeCache(_BaseTest):
+    @pytest.fixture(params=["memory", "sqlite"])
+    def charge_cache(self, request):
+        if request.param == "memory":
+            return InMemoryChargeCache(max_entries=2)
+        else:
+            return SQLiteChargeCache("charges.sqlite", max_entries=2)
+
+    def test_get_set(self, charge_cache):
+        assert charge_cache.get("[H:1][H:2]", "am1bcc") is None
+
+        charge_cache.set("[H:1][H:2]", "am1bcc", [0.1, -0.1])
+
+        assert charge_cache.get("[H:1][H:2]", "am1bcc") == [0.1, -0.1]
+        assert charge_cache.get("[H:1][H:2]", "am1-mulliken") is None
+
+    def test_eviction(self, charge_cache):
+        charge_cache.set("a", "am1bcc", [0.0])
+        charge_cache.set("b", "am1bcc", [0.0])
+
+        # Touch "a" so that "b" is the least recently used entry
+        charge_cache.get("a", "am1bcc")
+        charge_cache.set("c", "am1bcc", [0.0])
+
+        assert len(charge_cache) == 2
+        assert charge_cache.get("b", "am1bcc") is None
+        assert charge_cache.get("a", "am1bcc") is not None
+
+    def test_sqlite_persistence(self):
+        SQLiteChargeCache("charges.sqlite").set("[H:1][H:2]", "am1bcc", [0.1, -0.1])
+
+        assert SQLiteChargeCache("charges.sqlite").get("[H:1][H:2]", "am1bcc") == [
+            0.1,
+            -0.1,
+        ]
+
+    def test_set_invalid_charge_cache(self):
+        with pytest.raises(TypeError):
+            set_charge_cache(dict())
+
+    def test_compute_partial_charges_uses_cache(self):
+        molecule = Molecule.from_mapped_smiles("[H:2][O:1][H:3]")
+        mapped_smiles = molecule.to_smiles(
+            isomeric=True, explicit_hydrogens=True, mapped=True
+        )
+
+        original_cache = get_charge_cache()
+        set_charge_cache(SQLiteChargeCache("charges.sqlite"))
+
+        try:
+            # Store fake charges that would not be produced by the toolkit
+            get_charge_cache().set(mapped_smiles, "am1bcc", [-0.5, 0.25, 0.25])
+
+            charges = SMIRNOFFElectrostaticsHandler._compute_partial_charges(
+                molecule, method="am1bcc"
+            )
+        finally:
+            set_charge_cache(original_cache)
+
+        np.testing.assert_allclose(charges.m_as(unit.e), [-0.5, 0.25, 0.25])
+
+    def test_process_pool_fills_cache(self, parsley, monkeypatch):
+        """Test that charges computed in worker processes are stored in this process."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        top = _OFFBioTop.from_molecules(
+            [Molecule.from_smiles("CCO"), Molecule.from_smiles("CC")]
+        )
+        parameter_handlers = [parsley["Electrostatics"], parsley["ToolkitAM1BCC"]]
+
+        original_cache = get_charge_cache()
+        set_charge_cache(InMemoryChargeCache())
+
+        try:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                parallel = SMIRNOFFElectrostaticsHandler._from_toolkit(
+                    parameter_handlers, top, executor=executor
+                )
+
+            assert len(get_charge_cache()) == 2
+
+            def _assign_partial_charges(*args, **kwargs):
+                raise AssertionError("Charges should be read from the cache")
+
+            monkeypatch.setattr(
+                Molecule, "assign_partial_charges", _assign_partial_charges
+            )
+
+            cached = SMIRNOFFElectrostaticsHandler._from_toolkit(
+                parameter_handlers, top
+            )
+        finally:
+            set_charge_cache(original_cache)
+
+        np.testing.assert_allclose(
+            [charge.m_as(unit.e) for charge in parallel.charges.values()],
+            [charge.m_as(unit.e) for charge in cached.charges.values()],
+        )
@@ -19,6 +19,7 @@ from openff.interchange.exceptions import (
     MissingPositionsError,
     SMIRNOFFHandlersNotImplementedError,
 )
+from openff.interchange.models import TopologyKey
 from openff.interchange.testing import _BaseTest
 from openff.interchange.testing.utils import needs_gmx, needs_lmp
 from openff.interchange.utils import get_test_file_path
@@ -64,6 +65,61 @@ def test_get_parameters():
         out._get_parameters("Bonds", (0, 100))
 
 
+def test_get_parameters_index():
+    mol = Molecule.from_smiles("CCO")
+    parsley = ForceField("openff-1.0.0.offxml")
+    out = Interchange.from_smirnoff(force_field=parsley, topology=mol.to_topology())
+
+    bonds = out["Bonds"]
+
+    assert bonds._get_parameters((4, 0)) == bonds._get_parameters((0, 4))
+
+    # Modifying the slot map in place is reflected in later lookups
+    topology_key = TopologyKey(atom_indices=(0, 4))
+    potential_key = bonds.slot_map.pop(topology_key)
+    bonds.slot_map[TopologyKey(atom_indices=(0, 100))] = potential_key
+
+    assert bonds._get_parameters((100, 0)) == bonds.potentials[potential_key].parameters
+
+    with pytest.raises(MissingParametersError):
+        bonds._get_parameters((0, 4))
+
+
+def test_get_parameters_index_impropers():
+    mol = Molecule.from_smiles("CC(=O)N")
+    parsley = ForceField("openff-1.0.0.offxml")
+    out = Interchange.from_smirnoff(force_field=parsley, topology=mol.to_topology())
+
+    impropers = out["ImproperTorsions"]
+    atom_indices = next(iter(impropers.slot_map)).atom_indices
+
+    assert impropers._get_parameters(atom_indices)
+
+    # Reversing the atoms of an improper torsion does not describe the same term
+    with pytest.raises(MissingParametersError):
+        impropers._get_parameters(atom_indices[::-1])
+
+
+def test_get_parameters_index_not_rebuilt(monkeypatch):
+    mol = Molecule.from_smiles("CCO")
+    parsley = ForceField("openff-1.0.0.offxml")
+    out = Interchange.from_smirnoff(force_field=parsley, topology=mol.to_topology())
+
+    bonds = out["Bonds"]
+    bonds._get_parameters((0, 4))
+
+    def _raise(*args, **kwargs):
+        raise AssertionError("The index should not be rebuilt")
+
+    monkeypatch.setattr(type(bonds), "_build_atom_index_map", _raise)
+
+    # Neither hits nor misses rebuild the index of an unmodified slot map
+    for _ in range(3):
+        bonds._get_parameters((4, 0))
+        with pytest.raises(MissingParametersError):
+            bonds._get_parameters((0, 100))
+
+
 def test_box_setter():
     tmp = Interchange()
 
@@ -205,6 +261,24 @@ class TestInterchange(_BaseTest):
         assert type(out.topology) != Topology
         assert isinstance(out.topology, Topology)
 
+    def test_from_parsley_executor(self, parsley):
+        from concurrent.futures import ThreadPoolExecutor
+
+        top = _OFFBioTop.from_molecules(
+            [Molecule.from_smiles("CCO"), Molecule.from_smiles("CC")]
+        )
+
+        serial = Interchange.from_smirnoff(parsley, top)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            concurrent = Interchange.from_smirnoff(parsley, top, executor=executor)
+
+        assert [*serial.handlers] == [*concurrent.handlers]
+
+        for name, handler in serial.handlers.items():
+            assert handler.slot_map == concurrent[name].slot_map
+            assert handler.potentials == concurrent[name].potentials
+
     @needs_gmx
     @needs_lmp
     @pytest.mark.slow()
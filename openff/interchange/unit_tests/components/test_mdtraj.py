@@ -1,4 +1,5 @@
 import mdtraj as md
+import numpy as np
 import pytest
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
@@ -7,6 +8,7 @@ from openmm import app
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import (
     _combine_topologies,
+    _get_bonded_pairs,
     _get_num_h_bonds,
     _iterate_pairs,
     _iterate_propers,
@@ -71,6 +73,32 @@ def test_iterate_pairs_benzene():
     assert len({*_iterate_pairs(mdtop)}) == 21
 
 
+def test_bonded_pairs():
+    # A four-membered ring with a substituent, so that some atoms are joined by paths of
+    # different lengths
+    bonds = np.array([(0, 1), (1, 2), (2, 3), (3, 0), (3, 4)])
+
+    pairs_12, pairs_13, pairs_14 = _get_bonded_pairs(bonds)
+
+    assert pairs_12.tolist() == [[0, 1], [0, 3], [1, 2], [2, 3], [3, 4]]
+    assert pairs_13.tolist() == [[0, 2], [0, 4], [1, 3], [2, 4]]
+    assert pairs_14.tolist() == [[1, 4]]
+
+
+@pytest.mark.parametrize("smiles", ["C1#CC#CC#C1", "c1ccccc1", "C1CC1CCO"])
+def test_bonded_pairs_match_iterate_pairs(smiles):
+    mdtop = md.Topology.from_openmm(
+        Molecule.from_smiles(smiles).to_topology().to_openmm()
+    )
+    bonds = np.array([(bond.atom1.index, bond.atom2.index) for bond in mdtop.bonds])
+
+    _store_bond_partners(mdtop)
+
+    assert _get_bonded_pairs(bonds)[2].tolist() == sorted(
+        [atom1.index, atom2.index] for atom1, atom2 in {*_iterate_pairs(mdtop)}
+    )
+
+
 def test_get_num_h_bonds():
     mol = Molecule.from_smiles("CCO")
     top = mol.to_topology()
@@ -1,11 +1,26 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff.parameters import BondHandler
 from openff.units import unit
+from openff.utilities.testing import skip_if_missing
 
+from openff.interchange.components.mdtraj import _OFFBioTop
 from openff.interchange.components.potentials import (
     Potential,
+    PotentialArrays,
     PotentialHandler,
     WrappedPotential,
+    intern_potential,
+)
+from openff.interchange.components.smirnoff import (
+    SMIRNOFFAngleHandler,
+    SMIRNOFFProperTorsionHandler,
+    SMIRNOFFvdWHandler,
 )
+from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing import _BaseTest
 
 
@@ -48,3 +63,257 @@ class TestPotentialHandlerSubclassing(_BaseTest):
         )
         assert handler.type == "foo"
         assert handler.expression == "m*x+b"
+
+
+class TestPotentialArrays(_BaseTest):
+    def test_round_trip(self, parsley):
+        top = _OFFBioTop.from_molecules([Molecule.from_smiles("CCO")] * 2)
+
+        torsions = SMIRNOFFProperTorsionHandler._from_toolkit(
+            parsley["ProperTorsions"], top
+        )
+
+        arrays = torsions.to_arrays()
+
+        assert arrays.atom_indices.shape == (len(torsions.slot_map), 4)
+        assert arrays.atom_indices.dtype == np.int32
+        assert arrays.parameters.shape == (
+            len(torsions.potentials),
+            len(arrays.parameter_names),
+        )
+
+        slot_map, potentials = arrays.to_dicts()
+
+        assert slot_map == torsions.slot_map
+        assert potentials == torsions.potentials
+
+    def test_get_parameter(self):
+        arrays = PotentialArrays(
+            atom_indices=[[0, 1, 2]],
+            potential_indices=[0],
+            parameters=[[180.0]],
+            parameter_names=["angle"],
+            parameter_units=[unit.degree],
+            potential_keys=[PotentialKey(id="foo")],
+        )
+
+        np.testing.assert_allclose(arrays.get_parameter("angle"), [180.0])
+        np.testing.assert_allclose(arrays.get_parameter("angle", unit.radian), [np.pi])
+
+    def test_lazy_handler(self, parsley):
+        top = _OFFBioTop.from_molecules([Molecule.from_smiles("CCO")])
+
+        angles = SMIRNOFFAngleHandler._from_toolkit(parsley["Angles"], top)
+
+        arrays = angles.to_arrays()
+        lazy = SMIRNOFFAngleHandler.from_arrays(arrays)
+
+        assert "slot_map" not in lazy.__dict__
+        assert lazy.to_arrays() is arrays
+
+        assert lazy.slot_map == angles.slot_map
+        assert lazy.potentials == angles.potentials
+        assert lazy == angles
+
+
+class TestPotentialInterning(_BaseTest):
+    def test_identical_potentials_shared(self):
+        sigma = 3.0 * unit.angstrom
+        epsilon = 0.1 * unit.Unit("kilocalorie / mole")
+
+        first = intern_potential(
+            Potential(parameters={"sigma": sigma, "epsilon": epsilon})
+        )
+        second = intern_potential(
+            Potential(parameters={"sigma": sigma, "epsilon": epsilon})
+        )
+
+        assert first is second
+        assert deepcopy(first) is first
+
+        # Different units change the flattened representation, so are not shared
+        assert (
+            intern_potential(
+                Potential(
+                    parameters={"sigma": sigma.to(unit.nanometer), "epsilon": epsilon}
+                )
+            )
+            is not first
+        )
+
+    def test_interned_potentials_immutable(self):
+        potential = intern_potential(Potential(parameters={"k": 1.0 * unit.angstrom}))
+
+        with pytest.raises(TypeError, match="editable_copy"):
+            potential.parameters["k"] = 2.0 * unit.angstrom
+
+        with pytest.raises(TypeError, match="editable_copy"):
+            potential.map_key = 1
+
+    def test_editable_copy(self):
+        potential = intern_potential(Potential(parameters={"k": 1.0 * unit.angstrom}))
+
+        copied = potential.editable_copy()
+        copied.parameters["k"] = 2.0 * unit.angstrom
+        copied.map_key = 1
+
+        assert potential.parameters["k"] == 1.0 * unit.angstrom
+        assert potential.map_key is None
+        assert intern_potential(copied) is not potential
+
+    def test_shared_between_handlers(self, parsley):
+        handlers = [
+            SMIRNOFFvdWHandler._from_toolkit(
+                parsley["vdW"], _OFFBioTop.from_molecules([Molecule.from_smiles(smi)])
+            )
+            for smi in ["CCO", "CCCO"]
+        ]
+
+        for potential_key, potential in handlers[0].potentials.items():
+            if potential_key in handlers[1].potentials:
+                assert handlers[1].potentials[potential_key] is potential
+
+    def test_set_force_field_parameters_does_not_modify_shared(self, parsley):
+        top = _OFFBioTop.from_molecules([Molecule.from_smiles("CCO")])
+
+        handler = SMIRNOFFvdWHandler._from_toolkit(parsley["vdW"], top)
+        other = SMIRNOFFvdWHandler._from_toolkit(parsley["vdW"], top)
+
+        original = other.get_force_field_parameters()
+
+        handler.set_force_field_parameters(handler.get_force_field_parameters() * 2)
+
+        assert (other.get_force_field_parameters() == original).all()
+
+
+class TestReverseIndex(_BaseTest):
+    def test_topology_keys(self, parsley):
+        top = _OFFBioTop.from_molecules([Molecule.from_smiles("CCO")])
+        handler = SMIRNOFFvdWHandler._from_toolkit(parsley["vdW"], top)
+
+        counts = handler.get_potential_counts()
+        assert sum(counts.values()) == len(handler.slot_map)
+
+        for potential_key, count in counts.items():
+            topology_keys = handler.get_topology_keys(potential_key)
+            assert len(topology_keys) == count
+            assert all(handler.slot_map[key] == potential_key for key in topology_keys)
+
+        # The index is maintained as the slot map is modified in place
+        topology_key, potential_key = next(iter(handler.slot_map.items()))
+        del handler.slot_map[topology_key]
+
+        assert topology_key not in handler.get_topology_keys(potential_key)
+        assert sum(handler.get_potential_counts().values()) == len(handler.slot_map)
+
+    def test_split_potential(self, parsley):
+        top = _OFFBioTop.from_molecules([Molecule.from_smiles("CCC")])
+        handler = SMIRNOFFvdWHandler._from_toolkit(parsley["vdW"], top)
+
+        potential_key = PotentialKey(id="[#1:1]-[#6X4]", associated_handler="vdW")
+        topology_keys = handler.get_topology_keys(potential_key)
+        original = handler.get_system_parameters()
+
+        new_key = handler.split_potential(potential_key, topology_keys[:2])
+
+        assert new_key.id == "[#1:1]-[#6X4]_1"
+        assert handler.get_topology_keys(new_key) == topology_keys[:2]
+        assert handler.get_topology_keys(potential_key) == topology_keys[2:]
+        assert (handler.get_system_parameters() == original).all()
+
+        original_sigma = handler.potentials[potential_key].parameters["sigma"]
+        handler.potentials[new_key].parameters["sigma"] = 2.0 * unit.angstrom
+
+        for topology_key in topology_keys[:2]:
+            assert handler.potentials[handler.slot_map[topology_key]].parameters[
+                "sigma"
+            ] == (2.0 * unit.angstrom)
+
+        # The potential the copy was split from is not modified
+        assert handler.potentials[potential_key].parameters["sigma"] == original_sigma
+        for topology_key in topology_keys[2:]:
+            assert (
+                handler.potentials[handler.slot_map[topology_key]].parameters["sigma"]
+                == original_sigma
+            )
+
+        with pytest.raises(ValueError, match="not applied"):
+            handler.split_potential(potential_key, topology_keys[:1])
+
+
+class TestParamMatrix(_BaseTest):
+    @skip_if_missing("scipy")
+    def test_sparse_param_matrix(self, parsley, ethanol_top):
+        handler = SMIRNOFFAngleHandler._from_toolkit(parsley["Angles"], ethanol_top)
+
+        param_matrix = handler.get_param_matrix()
+        sparse_param_matrix = handler.get_sparse_param_matrix()
+
+        assert sparse_param_matrix.shape == param_matrix.shape
+        assert sparse_param_matrix.nnz == param_matrix.shape[0]
+        np.testing.assert_equal(sparse_param_matrix.toarray(), param_matrix)
+
+        p = np.asarray(handler.get_force_field_parameters())
+        q = np.asarray(handler.get_system_parameters())
+
+        np.testing.assert_allclose(sparse_param_matrix @ p.ravel(), q.ravel())
+
+    @pytest.fixture()
+    def wrapped_bond_handler(self):
+        bt = BondHandler.BondType(
+            smirks="[#6X4:1]~[#8X2:2]",
+            id="bbo1",
+            k_bondorder1="100.0 * kilocalories_per_mole/angstrom**2",
+            k_bondorder2="200.0 * kilocalories_per_mole/angstrom**2",
+            length_bondorder1="1.4 * angstrom",
+            length_bondorder2="1.3 * angstrom",
+        )
+
+        pot1 = Potential(
+            parameters={"k": bt.k_bondorder[1], "length": bt.length_bondorder[1]},
+            map_key=1,
+        )
+        pot2 = Potential(
+            parameters={"k": bt.k_bondorder[2], "length": bt.length_bondorder[2]},
+            map_key=2,
+        )
+
+        handler = PotentialHandler(type="Bonds", expression="k/2*(r-length)**2")
+        for index, bond_order in enumerate([1.2, 1.5, 1.2]):
+            potential_key = PotentialKey(id=bt.smirks, bond_order=bond_order)
+            handler.slot_map[
+                TopologyKey(atom_indices=(index, index + 1))
+            ] = potential_key
+            handler.potentials[potential_key] = WrappedPotential(
+                data={pot1: 2.0 - bond_order, pot2: bond_order - 1.0}
+            )
+
+        return handler
+
+    def test_wrapped_potential_coefficients(self, wrapped_bond_handler):
+        param_matrix = np.asarray(wrapped_bond_handler.get_param_matrix())
+
+        # Keys differing only in bond order share the same two sets of parameters
+        assert param_matrix.shape == (6, 4)
+        np.testing.assert_allclose(
+            param_matrix[::2, ::2], [[0.8, 0.2], [0.5, 0.5], [0.8, 0.2]]
+        )
+        np.testing.assert_allclose(param_matrix.sum(axis=1), np.ones(6))
+
+    def test_wrapped_potential_parameters(self, wrapped_bond_handler):
+        p = np.asarray(wrapped_bond_handler.get_force_field_parameters())
+        q = np.asarray(wrapped_bond_handler.get_system_parameters())
+
+        np.testing.assert_allclose(p, [[100.0, 1.4], [200.0, 1.3]])
+        np.testing.assert_allclose(q, [[120.0, 1.38], [150.0, 1.35], [120.0, 1.38]])
+
+        for topology_key, potential_key in wrapped_bond_handler.slot_map.items():
+            parameters = wrapped_bond_handler.potentials[potential_key].parameters
+            np.testing.assert_allclose(
+                q[topology_key.atom_indices[0]],
+                [parameters["k"].m, parameters["length"].m],
+            )
+
+        wrapped_bond_handler.set_force_field_parameters(p * 2)
+
+        np.testing.assert_allclose(wrapped_bond_handler.get_system_parameters(), q * 2)
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import openmm
 import pytest
@@ -25,6 +27,7 @@ from pydantic import ValidationError
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.components.potentials import Potential
 from openff.interchange.components.smirnoff import (
     SMIRNOFFAngleHandler,
     SMIRNOFFBondHandler,
@@ -32,6 +35,7 @@ from openff.interchange.components.smirnoff import (
     SMIRNOFFElectrostaticsHandler,
     SMIRNOFFImproperTorsionHandler,
     SMIRNOFFPotentialHandler,
+    SMIRNOFFProperTorsionHandler,
     SMIRNOFFvdWHandler,
     SMIRNOFFVirtualSiteHandler,
     library_charge_from_molecule,
@@ -168,6 +172,114 @@ class TestSMIRNOFFHandlers(_BaseTest):
             TopologyKey(atom_indices=(0, 3, 1, 2), mult=0) in potential_handler.slot_map
         )
 
+    @pytest.mark.parametrize(
+        "handler_name,potential_handler_type",
+        [
+            ("Bonds", SMIRNOFFBondHandler),
+            ("Angles", SMIRNOFFAngleHandler),
+            ("ProperTorsions", SMIRNOFFProperTorsionHandler),
+            ("vdW", SMIRNOFFvdWHandler),
+        ],
+    )
+    def test_matches_stamped_onto_copies(
+        self, parsley, handler_name, potential_handler_type
+    ):
+        """Test that per-reference-molecule matches agree with matching the whole topology."""
+        ethanol = Molecule.from_smiles("CCO")
+        water = Molecule.from_mapped_smiles("[H:2][O:1][H:3]")
+        water_reordered = Molecule.from_mapped_smiles("[H:1][O:2][H:3]")
+
+        top = _OFFBioTop.from_molecules(
+            [water, ethanol, water_reordered, ethanol, water]
+        )
+
+        parameter_handler = parsley[handler_name]
+
+        potential_handler = potential_handler_type()
+        potential_handler.store_matches(parameter_handler, top)
+
+        expected = {
+            key: val.parameter_type.smirks
+            for key, val in parameter_handler.find_matches(top).items()
+        }
+        found = {
+            top_key.atom_indices: pot_key.id
+            for top_key, pot_key in potential_handler.slot_map.items()
+        }
+
+        assert found == expected
+
+    def test_improper_matches_stamped_onto_copies(self, parsley):
+        """Test that improper keys mapped onto reordered copies agree with matching the whole topology."""
+        formaldehyde = Molecule.from_mapped_smiles("[H:3][C:1](=[O:2])[H:4]")
+        formaldehyde_reordered = Molecule.from_mapped_smiles("[H:1][C:4](=[O:3])[H:2]")
+
+        top = _OFFBioTop.from_molecules([formaldehyde, formaldehyde_reordered])
+
+        parameter_handler = parsley["ImproperTorsions"]
+
+        potential_handler = SMIRNOFFImproperTorsionHandler()
+        potential_handler.store_matches(parameter_handler, top)
+
+        expected = set()
+        for key in parameter_handler.find_matches(top):
+            non_central_indices = [key[0], key[2], key[3]]
+            for (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
+                expected.add(
+                    (
+                        key[1],
+                        non_central_indices[i],
+                        non_central_indices[j],
+                        non_central_indices[k],
+                    )
+                )
+
+        assert {key.atom_indices for key in potential_handler.slot_map} == expected
+
+    @pytest.mark.parametrize(
+        "handler_name,potential_handler_type",
+        [
+            ("Bonds", SMIRNOFFBondHandler),
+            ("Angles", SMIRNOFFAngleHandler),
+            ("ProperTorsions", SMIRNOFFProperTorsionHandler),
+            ("ImproperTorsions", SMIRNOFFImproperTorsionHandler),
+            ("vdW", SMIRNOFFvdWHandler),
+        ],
+    )
+    def test_store_potentials_smirks_index(
+        self, parsley, monkeypatch, handler_name, potential_handler_type
+    ):
+        """Test that potentials are looked up from an index rather than by get_parameter."""
+        top = _OFFBioTop.from_molecules(
+            [Molecule.from_smiles("c1ccccc1C(=O)N"), Molecule.from_smiles("CCO")]
+        )
+
+        parameter_handler = parsley[handler_name]
+
+        potential_handler = potential_handler_type()
+        potential_handler.store_matches(parameter_handler, top)
+
+        def _get_parameter(*args, **kwargs):
+            raise AssertionError("Parameters should be looked up by SMIRKS index")
+
+        monkeypatch.setattr(parameter_handler, "get_parameter", _get_parameter)
+
+        potential_handler.store_potentials(parameter_handler)
+
+        assert set(potential_handler.potentials) == set(
+            potential_handler.slot_map.values()
+        )
+
+        for potential_key, potential in potential_handler.potentials.items():
+            parameter = parsley[handler_name].parameters[potential_key.id]
+            for name, value in potential.parameters.items():
+                if name in ["periodicity", "idivf"]:
+                    continue
+                expected = getattr(parameter, name)
+                if potential_key.mult is not None:
+                    expected = expected[potential_key.mult]
+                assert value == expected
+
     def test_electrostatics_am1_handler(self):
         molecule = Molecule.from_smiles("C")
         molecule.assign_partial_charges(partial_charge_method="am1bcc")
@@ -216,6 +328,41 @@ class TestSMIRNOFFHandlers(_BaseTest):
             [-0.1, 0.025, 0.025, 0.025, 0.025],
         )
 
+    def test_charge_array_cached(self):
+        top = _OFFBioTop.from_molecules(Molecule.from_smiles("C"))
+
+        library_charge_handler = LibraryChargeHandler(version=0.3)
+        library_charge_handler.add_parameter(
+            {
+                "smirks": "[#6X4:1]-[#1:2]",
+                "charge1": -0.1 * openmm_unit.elementary_charge,
+                "charge2": 0.025 * openmm_unit.elementary_charge,
+            }
+        )
+
+        electrostatics_handler = SMIRNOFFElectrostaticsHandler._from_toolkit(
+            [ElectrostaticsHandler(version=0.3), library_charge_handler], top
+        )
+
+        charges = electrostatics_handler.get_charge_array()
+
+        np.testing.assert_allclose(charges, [-0.1, 0.025, 0.025, 0.025, 0.025])
+        assert electrostatics_handler.get_charge_array() is charges
+
+        with pytest.raises(ValueError, match="read-only"):
+            charges[0] = 0.0
+
+        # Modifying the potentials invalidates the cached charges
+        potential_key = electrostatics_handler.slot_map[TopologyKey(atom_indices=(0,))]
+        electrostatics_handler.potentials[potential_key] = Potential(
+            parameters={"charge": -0.2 * unit.elementary_charge}
+        )
+
+        np.testing.assert_allclose(
+            electrostatics_handler.get_charge_array(),
+            [-0.2, 0.025, 0.025, 0.025, 0.025],
+        )
+
     def test_electrostatics_charge_increments(self):
         molecule = Molecule.from_mapped_smiles("[Cl:1][H:2]")
         top = _OFFBioTop.from_molecules(molecule)
@@ -251,6 +398,38 @@ class TestSMIRNOFFHandlers(_BaseTest):
             reference_charges,
         )
 
+    def test_electrostatics_process_pool(self, parsley):
+        """Test that assigning charges in a process pool matches assigning them serially."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        top = _OFFBioTop.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("O"),
+                Molecule.from_smiles("C"),
+                Molecule.from_smiles("CCO"),
+            ]
+        )
+
+        parameter_handlers = [
+            parsley["Electrostatics"],
+            parsley["LibraryCharges"],
+            parsley["ToolkitAM1BCC"],
+        ]
+
+        serial = SMIRNOFFElectrostaticsHandler._from_toolkit(parameter_handlers, top)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = SMIRNOFFElectrostaticsHandler._from_toolkit(
+                parameter_handlers, top, executor=executor
+            )
+
+        assert [*serial.slot_map.items()] == [*parallel.slot_map.items()]
+        np.testing.assert_allclose(
+            [charge.m_as(unit.e) for charge in serial.charges.values()],
+            [charge.m_as(unit.e) for charge in parallel.charges.values()],
+        )
+
     # TODO: Remove xfail after openff-toolkit 0.10.0
     @pytest.mark.xfail()
     def test_charges_with_virtual_site(self, parsley):
@@ -312,6 +491,13 @@ class TestSMIRNOFFHandlers(_BaseTest):
             charges[:5], [v.m for v in out["Electrostatics"].charges.values()]
         )
 
+        np.testing.assert_allclose(
+            charges, out["Electrostatics"].get_charge_array(include_virtual_sites=True)
+        )
+        np.testing.assert_allclose(
+            charges[:5], out["Electrostatics"].get_charge_array()
+        )
+
 
 class TestInterchangeFromSMIRNOFF(_BaseTest):
     """General tests for Interchange.from_smirnoff. Some are ported from the toolkit."""
@@ -391,6 +577,88 @@ class TestConstraints:
 
         assert len(constraints.slot_map) == n_constraints
 
+    def test_constraints_reuse_bonds(self, monkeypatch):
+        force_field = ForceField("openff-1.0.0.offxml")
+
+        topology = Molecule.from_smiles("CCO").to_topology()
+
+        bonds = SMIRNOFFBondHandler._from_toolkit(
+            parameter_handler=force_field["Bonds"], topology=topology
+        )
+
+        reference = SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=[force_field["Bonds"], force_field["Constraints"]],
+            topology=topology,
+        )
+
+        def _raise(*args, **kwargs):
+            raise AssertionError("Bond parameters should not be matched again")
+
+        monkeypatch.setattr(SMIRNOFFBondHandler, "_from_toolkit", _raise)
+
+        constraints = SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=[force_field["Bonds"], force_field["Constraints"]],
+            topology=topology,
+            bonds=bonds,
+        )
+
+        assert constraints.slot_map == reference.slot_map
+        assert constraints.constraints == reference.constraints
+
+    def test_constraints_on_reordered_copies(self):
+        """Test that constraints re-using bonds are found on copies with a different atom order"""
+        force_field = ForceField("openff-1.0.0.offxml")
+
+        topology = _OFFBioTop.from_molecules(
+            [
+                Molecule.from_mapped_smiles("[C:1]([H:3])([H:4])([H:5])[O:2][H:6]"),
+                Molecule.from_mapped_smiles("[C:6]([H:1])([H:2])([H:3])[O:5][H:4]"),
+            ]
+        )
+
+        out = Interchange.from_smirnoff(force_field, topology)
+
+        assert len(out["Constraints"].slot_map) == 8
+        assert set(out["Constraints"].slot_map).issubset(out["Bonds"].slot_map)
+
+        system = out.to_openmm()
+
+        assert system.getNumConstraints() == 8
+
+        for force in system.getForces():
+            if isinstance(force, openmm.HarmonicBondForce):
+                assert force.getNumBonds() == 2
+
+    @pytest.mark.slow()
+    def test_constraints_reuse_bonds_benchmark(self):
+        """Test that re-using a bond handler is cheaper than matching bonds again"""
+        import time
+
+        force_field = ForceField("openff-1.0.0.offxml")
+
+        topology = _OFFBioTop.from_molecules(
+            [Molecule.from_smiles(smi) for smi in ["CCO", "c1ccccc1", "CC(=O)NC"]] * 10
+        )
+        parameter_handlers = [force_field["Bonds"], force_field["Constraints"]]
+
+        bonds = SMIRNOFFBondHandler._from_toolkit(
+            parameter_handler=force_field["Bonds"], topology=topology
+        )
+
+        start = time.perf_counter()
+        SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=parameter_handlers, topology=topology
+        )
+        rematched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=parameter_handlers, topology=topology, bonds=bonds
+        )
+        reused = time.perf_counter() - start
+
+        assert reused < rematched
+
 
 # TODO: Remove xfail after openff-toolkit 0.10.0
 @pytest.mark.xfail()
@@ -711,6 +979,34 @@ class TestSMIRNOFFVirtualSites:
         assert len(virtual_site_handler.slot_map) == 1
         assert len(virtual_site_handler.potentials) == 1
 
+    def test_pickle_virtual_sites(self):
+        from openff.toolkit.tests.test_forcefield import create_water
+
+        top = create_water().to_topology()
+
+        tip4p = ForceField(get_test_file_path("tip4p.offxml"))
+
+        vdw = SMIRNOFFvdWHandler._from_toolkit(
+            parameter_handler=tip4p["vdW"], topology=top
+        )
+        vdw._from_toolkit_virtual_sites(
+            parameter_handler=tip4p["VirtualSites"], topology=top
+        )
+
+        virtual_site_handler = SMIRNOFFVirtualSiteHandler._from_toolkit(
+            parameter_handler=tip4p["VirtualSites"], topology=top
+        )
+
+        out = Interchange()
+        out.add_handler("vdW", vdw)
+        out.add_handler("VirtualSites", virtual_site_handler)
+
+        unpickled = pickle.loads(pickle.dumps(out))
+
+        for handler_name in ["vdW", "VirtualSites"]:
+            assert unpickled[handler_name].slot_map == out[handler_name].slot_map
+            assert unpickled[handler_name].potentials == out[handler_name].potentials
+
     def test_store_tip5p_virtual_site(self):
         from openff.toolkit.tests.test_forcefield import create_water
 
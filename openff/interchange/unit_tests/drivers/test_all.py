@@ -1,14 +1,23 @@
 """
 Test the behavior of the drivers.all module
 """
+import logging
+import math
+import subprocess
+import sys
 from distutils.spawn import find_executable
 
-from openff.interchange.drivers.all import get_all_energies
+import pytest
+
+from openff.interchange.drivers import all as all_drivers
+from openff.interchange.drivers.all import get_all_energies, get_all_energies_batch
+from openff.interchange.exceptions import GMXRunError
 from openff.interchange.testing import _BaseTest
 
 
 class TestDriversAll(_BaseTest):
-    def test_skipping_drivers(self, ethanol_top, parsley):
+    @pytest.fixture()
+    def methane(self, parsley):
         from openff.toolkit.topology import Molecule
 
         from openff.interchange.components.interchange import Interchange
@@ -22,6 +31,11 @@ class TestDriversAll(_BaseTest):
         out.positions = molecule.conformers[0]
         out.box = [4, 4, 4]
 
+        return out
+
+    def test_skipping_drivers(self, methane):
+        out = methane
+
         summary = get_all_energies(out)
 
         assert ("GROMACS" in summary) == (find_executable("gmx") is not None)
@@ -36,3 +50,44 @@ class TestDriversAll(_BaseTest):
         )
 
         assert len(summary) == number_expected_drivers
+
+    def test_failing_drivers(self, methane, monkeypatch, caplog):
+        def failing_driver(interchange, timeout=None):
+            raise GMXRunError("Failed")
+
+        def malformed_driver(interchange, timeout=None):
+            # i.e. an error parsing the output of an engine
+            raise ValueError("could not convert string to float")
+
+        def slow_driver(interchange, timeout=None):
+            subprocess.run(
+                f"{sys.executable} -c 'import time; time.sleep(10)'",
+                shell=True,
+                timeout=timeout,
+            )
+
+        # Any existing file is found as an executable
+        monkeypatch.setattr(
+            all_drivers,
+            "_EXTERNAL_ENGINES",
+            [
+                ("Failing", sys.executable, failing_driver),
+                ("Slow", sys.executable, slow_driver),
+                ("Malformed", sys.executable, malformed_driver),
+            ],
+        )
+
+        with caplog.at_level(logging.WARNING, logger=all_drivers.__name__):
+            summaries = get_all_energies_batch([methane, methane], timeout=0.1)
+
+        assert len(summaries) == 2
+        assert len(caplog.records) == 6
+
+        for summary in summaries:
+            assert [*summary] == ["OpenMM", "Failing", "Slow", "Malformed"]
+            assert not math.isnan(summary["OpenMM"]["Bond"].m)
+            for engine_name in ["Failing", "Slow", "Malformed"]:
+                assert all(
+                    math.isnan(energy.m)
+                    for energy in summary[engine_name].energies.values()
+                )
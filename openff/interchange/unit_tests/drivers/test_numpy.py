@@ -0,0 +1,155 @@
+"""
+Test the behavior of the drivers.numpy module
+"""
+import itertools
+
+import networkx as nx
+import numpy as np
+import pytest
+from openff.toolkit.topology import Molecule
+from openff.units import unit
+from openff.utilities.testing import skip_if_missing
+
+from openff.interchange.components.interchange import Interchange
+from openff.interchange.drivers.numpy import (
+    _get_reduced_box,
+    _iterate_neighbor_pairs,
+    get_numpy_energies,
+)
+from openff.interchange.exceptions import (
+    UnimplementedCutoffMethodError,
+    UnsupportedCutoffMethodError,
+)
+from openff.interchange.testing import _BaseTest
+
+kj_mol = unit.kilojoule / unit.mol
+
+
+class TestNumPyEnergies(_BaseTest):
+    @pytest.fixture()
+    def ethanol(self, parsley_unconstrained):
+        molecule = Molecule.from_smiles("CCO")
+        molecule.generate_conformers(n_conformers=1)
+
+        out = Interchange.from_smirnoff(parsley_unconstrained, molecule.to_topology())
+        out.positions = molecule.conformers[0]
+
+        return out
+
+    @skip_if_missing("openmm")
+    def test_valence_and_vdw_match_openmm(self, ethanol):
+        from openff.interchange.drivers.openmm import get_openmm_energies
+
+        numpy_energies = get_numpy_energies(ethanol)
+        openmm_energies = get_openmm_energies(ethanol)
+
+        for energy_type in ["Bond", "Angle", "Torsion", "vdW"]:
+            assert numpy_energies[energy_type].m_as(kj_mol) == pytest.approx(
+                openmm_energies[energy_type].m_as(kj_mol), abs=1e-3
+            )
+
+    @pytest.mark.parametrize(
+        ("method", "box"),
+        [("pme", None), ("cutoff", [4, 4, 4]), ("reaction-field", [4, 4, 4])],
+    )
+    def test_electrostatics(self, ethanol, method, box):
+        ethanol["Electrostatics"].method = method
+        ethanol.box = box
+
+        graph = nx.Graph(
+            [
+                (bond.atom1.index, bond.atom2.index)
+                for bond in ethanol.topology.mdtop.bonds
+            ]
+        )
+        distances = dict(nx.all_pairs_shortest_path_length(graph))
+        n_atoms = ethanol.topology.mdtop.n_atoms
+
+        charges = ethanol["Electrostatics"].get_charge_array()
+        positions = ethanol.positions.m_as(unit.nanometer)
+
+        # All pairs are well within the cutoff, and far from their periodic images
+        k_rf, c_rf = 0.0, 0.0
+        if method == "reaction-field":
+            cutoff = ethanol["Electrostatics"].cutoff.m_as(unit.nanometer)
+            k_rf = 77.3 / (157.6 * cutoff ** 3)
+            c_rf = 1 / cutoff + k_rf * cutoff ** 2
+
+        expected = 0.0
+        for i in range(n_atoms):
+            for j in range(i + 1, n_atoms):
+                r = np.linalg.norm(positions[i] - positions[j])
+                qq = 138.935456 * charges[i] * charges[j]
+                if distances[i][j] == 3:
+                    expected += ethanol["Electrostatics"].scale_14 * qq / r
+                elif distances[i][j] > 3:
+                    expected += qq * (1 / r + k_rf * r ** 2 - c_rf)
+
+        assert get_numpy_energies(ethanol)["Electrostatics"].m_as(
+            kj_mol
+        ) == pytest.approx(expected)
+
+    @skip_if_missing("openmm")
+    def test_periodic_vdw_matches_openmm(self, ethanol):
+        from openff.interchange.drivers.openmm import get_openmm_energies
+
+        ethanol.box = [4, 4, 4]
+        openmm_energies = get_openmm_energies(ethanol)
+
+        ethanol["Electrostatics"].method = "reaction-field"
+        numpy_energies = get_numpy_energies(ethanol)
+
+        assert numpy_energies["vdW"].m_as(kj_mol) == pytest.approx(
+            openmm_energies["vdW"].m_as(kj_mol), abs=1e-3
+        )
+
+    def test_periodic_pme_not_implemented(self, ethanol):
+        ethanol.box = [4, 4, 4]
+
+        with pytest.raises(UnimplementedCutoffMethodError, match="pme"):
+            get_numpy_energies(ethanol)
+
+    def test_cutoff_larger_than_box(self, ethanol):
+        ethanol["Electrostatics"].method = "reaction-field"
+        ethanol.box = [1.5, 1.5, 1.5]
+
+        with pytest.raises(UnsupportedCutoffMethodError, match="half"):
+            get_numpy_energies(ethanol)
+
+
+@pytest.mark.parametrize(
+    "box",
+    [
+        np.diag([3.0, 3.2, 3.5]),
+        np.array([[3.0, 0.0, 0.0], [1.0, 3.0, 0.0], [-0.8, 1.2, 3.1]]),
+        # Not in reduced form
+        np.array([[3.0, 0.0, 0.0], [4.0, 3.0, 0.0], [2.2, 4.3, 3.1]]),
+        # Not lower triangular
+        np.array([[2.4, 1.8, 0.0], [-1.8, 2.4, 0.0], [0.0, 0.0, 3.0]]),
+    ],
+)
+def test_periodic_neighbor_pairs(box):
+    positions = np.random.default_rng(0).uniform(-2, 6, (300, 3))
+    cutoff = 0.9
+
+    reduced_box, reduced_positions = _get_reduced_box(box, positions)
+    found = {
+        (min(i, j), max(i, j)): r
+        for chunk in _iterate_neighbor_pairs(reduced_positions, cutoff, reduced_box)
+        for i, j, r in zip(*(array.tolist() for array in chunk))
+    }
+
+    # Compare to searching over neighboring images of every pair
+    expected = dict()
+    shifts = np.array([*itertools.product(range(-2, 3), repeat=3)]) @ box
+    for i in range(len(positions)):
+        fractional = (positions[i + 1 :] - positions[i]) @ np.linalg.inv(box)
+        delta = (fractional - np.round(fractional)) @ box
+        r = np.linalg.norm(delta[:, None] + shifts, axis=-1).min(axis=1)
+        for j in np.flatnonzero(r < cutoff):
+            expected[(i, i + 1 + j)] = r[j]
+
+    assert found.keys() == expected.keys()
+    np.testing.assert_allclose(
+        [found[pair] for pair in expected], [*expected.values()], rtol=1e-10
+    )
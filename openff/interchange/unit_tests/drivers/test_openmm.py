@@ -0,0 +1,151 @@
+"""
+Test the behavior of the drivers.openmm module
+"""
+from copy import deepcopy
+from functools import partial
+
+import numpy as np
+import pytest
+from openff.toolkit.topology import Molecule
+from openff.units import unit
+from openmm import unit as openmm_unit
+
+from openff.interchange.components.interchange import Interchange
+from openff.interchange.drivers import openmm as openmm_driver
+from openff.interchange.drivers.openmm import (
+    clear_context_pool,
+    get_openmm_conformer_energies,
+    get_openmm_energies,
+    get_openmm_parameter_sweep,
+)
+from openff.interchange.testing import _BaseTest
+from openff.interchange.testing.utils import (
+    _compare_conformer_energies,
+    _get_conformer_positions,
+)
+
+
+class TestParameterSweep(_BaseTest):
+    @pytest.fixture()
+    def ethanol(self, parsley_unconstrained):
+        molecule = Molecule.from_smiles("CCO")
+        molecule.generate_conformers(n_conformers=1)
+
+        out = Interchange.from_smirnoff(parsley_unconstrained, molecule.to_topology())
+        out.positions = molecule.conformers[0]
+        out.box = [4, 4, 4]
+
+        return out
+
+    def test_parameter_sweep(self, ethanol):
+        handler_names = ["Bonds", "Angles", "ProperTorsions"]
+        original = {
+            name: np.asarray(ethanol[name].get_force_field_parameters())
+            for name in handler_names
+        }
+
+        # Only scale force constants, which are the first parameter of each handler
+        scales = [1.0, 1.1, 0.9]
+        modified = {
+            name: [p * np.array([scale] + [1.0] * (p.shape[1] - 1)) for scale in scales]
+            for name, p in original.items()
+        }
+        parameters = {
+            name: np.stack([p.ravel() for p in samples])
+            for name, samples in modified.items()
+        }
+
+        energies = get_openmm_parameter_sweep(ethanol, parameters)
+
+        assert energies.shape == (3, 5)
+
+        # The Interchange is not modified
+        for name in handler_names:
+            np.testing.assert_equal(
+                ethanol[name].get_force_field_parameters(), original[name]
+            )
+
+        for sample in range(len(scales)):
+            reference_interchange = deepcopy(ethanol)
+            for name in handler_names:
+                reference_interchange[name].set_force_field_parameters(
+                    modified[name][sample]
+                )
+
+            reference = get_openmm_energies(reference_interchange).energies
+
+            np.testing.assert_allclose(
+                energies[sample],
+                [
+                    energy.m_as(unit.kilojoule / unit.mol)
+                    for energy in reference.values()
+                ],
+                rtol=1e-6,
+            )
+
+    def test_mismatched_samples(self, ethanol):
+        p = np.asarray(ethanol["Bonds"].get_force_field_parameters()).ravel()
+        q = np.asarray(ethanol["Angles"].get_force_field_parameters()).ravel()
+
+        with pytest.raises(ValueError, match="same number of samples"):
+            get_openmm_parameter_sweep(
+                ethanol, {"Bonds": np.stack([p, p]), "Angles": np.stack([q])}
+            )
+
+    def test_unsupported_handler(self, ethanol):
+        p = np.asarray(ethanol["vdW"].get_force_field_parameters()).ravel()
+
+        with pytest.raises(NotImplementedError, match="vdW"):
+            get_openmm_parameter_sweep(ethanol, {"vdW": np.stack([p])})
+
+
+class TestConformerEnergies(_BaseTest):
+    @pytest.fixture()
+    def ethanol(self, parsley_unconstrained):
+        molecule = Molecule.from_smiles("CCO")
+        molecule.generate_conformers(
+            n_conformers=5, rms_cutoff=0.1 * openmm_unit.angstrom
+        )
+
+        out = Interchange.from_smirnoff(parsley_unconstrained, molecule.to_topology())
+        out.box = [4, 4, 4]
+
+        positions = _get_conformer_positions(molecule)
+
+        return out, positions
+
+    @pytest.mark.parametrize("pool_context", [False, True])
+    def test_conformer_energies(self, ethanol, pool_context):
+        interchange, positions = ethanol
+
+        _compare_conformer_energies(
+            interchange,
+            positions,
+            partial(get_openmm_conformer_energies, pool_context=pool_context),
+            get_openmm_energies,
+            rtol=1e-6,
+        )
+
+        clear_context_pool()
+
+    def test_context_pool(self, ethanol):
+        interchange, positions = ethanol
+
+        first = get_openmm_conformer_energies(interchange, positions, pool_context=True)
+        assert len(openmm_driver._CONTEXT_POOL) == 1
+
+        # A copy has the same contents, so re-uses the pooled context
+        second = get_openmm_conformer_energies(
+            deepcopy(interchange), positions * unit.nanometer, pool_context=True
+        )
+        assert len(openmm_driver._CONTEXT_POOL) == 1
+        np.testing.assert_equal(first, second)
+
+        clear_context_pool()
+        assert len(openmm_driver._CONTEXT_POOL) == 0
+
+    def test_bad_positions_shape(self, ethanol):
+        interchange, positions = ethanol
+
+        with pytest.raises(ValueError, match="n_conformers"):
+            get_openmm_conformer_energies(interchange, positions[0])
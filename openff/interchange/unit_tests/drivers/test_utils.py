@@ -0,0 +1,78 @@
+"""
+Test the behavior of the drivers.utils module
+"""
+import subprocess
+import sys
+import time
+
+import pytest
+
+from openff.interchange.drivers import gromacs
+from openff.interchange.drivers.utils import _get_deadline, _run_command
+from openff.interchange.testing import _BaseTest
+
+
+class TestRunCommand(_BaseTest):
+    def test_run_command(self, tmpdir):
+        result = _run_command(
+            [sys.executable, "-c", "import os; print(os.getcwd())"],
+            working_directory=tmpdir,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == str(tmpdir)
+
+    def test_arguments_not_interpreted_by_shell(self):
+        result = _run_command(
+            [sys.executable, "-c", "import sys; print(sys.argv[1])", "$HOME; ls"]
+        )
+
+        assert result.stdout.strip() == "$HOME; ls"
+
+    def test_timeout_stops_child_processes(self, tmpdir):
+        """Test that processes started by a command are stopped when it times out"""
+        # The child process would create the file after the command times out
+        child = "import time; time.sleep(1); open('child_finished', 'w').close()"
+        parent = (
+            "import subprocess, sys, time; "
+            f"subprocess.Popen([sys.executable, '-c', {child!r}]); time.sleep(10)"
+        )
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_command(
+                [sys.executable, "-c", parent],
+                working_directory=tmpdir,
+                deadline=_get_deadline(0.5),
+            )
+
+        time.sleep(1.5)
+        assert not tmpdir.join("child_finished").exists()
+
+    def test_shared_deadline(self):
+        """Test that commands sharing a deadline time out once it passes between them"""
+        deadline = _get_deadline(1.0)
+
+        _run_command(
+            [sys.executable, "-c", "import time; time.sleep(0.6)"], deadline=deadline
+        )
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_command(
+                [sys.executable, "-c", "import time; time.sleep(0.6)"],
+                deadline=deadline,
+            )
+
+    def test_gmx_commands_share_deadline(self, monkeypatch):
+        deadlines = list()
+
+        def _record_deadline(command, working_directory=None, deadline=None):
+            deadlines.append(deadline)
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        monkeypatch.setattr(gromacs, "_run_command", _record_deadline)
+
+        gromacs._run_gmx("out.top", "out.gro", "out.mdp", timeout=10)
+
+        assert len(deadlines) == 2
+        assert deadlines[0] == deadlines[1]
+        assert deadlines[0] <= time.monotonic() + 10
@@ -1,3 +1,9 @@
+import pickle
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
 from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
 
 
@@ -17,11 +23,10 @@ def test_potentialkey_hash_uniqueness():
 def test_topologykey_hash_uniqueness():
     """Test that TopologyKey hashes differ when optional attributes are set."""
 
-    smirks = "[#1:1]-[#8X2:2]"
-    ref = TopologyKey(id=smirks)
-    with_atom_indices = TopologyKey(id=smirks, atom_indices=(2, 0))
-    with_mult = TopologyKey(id=smirks, mult=2)
-    with_bond_order = TopologyKey(id=smirks, bond_order=5 / 4)
+    ref = TopologyKey()
+    with_atom_indices = TopologyKey(atom_indices=(2, 0))
+    with_mult = TopologyKey(mult=2)
+    with_bond_order = TopologyKey(bond_order=5 / 4)
 
     keys = [ref, with_atom_indices, with_mult, with_bond_order]
     assert len({hash(k) for k in keys}) == len(keys)
@@ -40,3 +45,39 @@ def test_virtualsitekey_hash_uniqueness():
 
     keys = [ref, with_type, with_match]
     assert len({hash(k) for k in keys}) == len(keys)
+
+
+def test_keys_immutable():
+    key = TopologyKey(atom_indices=(0, 1), mult=0)
+
+    with pytest.raises(TypeError):
+        key.mult = 1
+
+
+def test_key_equality():
+    assert TopologyKey(atom_indices=[0, 1]) == TopologyKey(atom_indices=(0, 1))
+    assert TopologyKey(atom_indices=(0, 1)) != TopologyKey(atom_indices=(1, 0))
+    assert TopologyKey(atom_indices=(0, 1)) != VirtualSiteKey(
+        atom_indices=(0, 1), type="BondCharge", match="once"
+    )
+
+    key = PotentialKey(id="[#1:1]", mult=1, associated_handler="vdW")
+    assert pickle.loads(pickle.dumps(key)) == key
+    assert deepcopy(key) == key
+
+
+def test_virtualsitekey_pickle():
+    key = VirtualSiteKey(atom_indices=(0, 1, 2), type="DivalentLonePair", match="once")
+
+    assert pickle.loads(pickle.dumps(key)) == key
+
+
+def test_key_serialization():
+    key = PotentialKey(id="[#1:1]-[#8X2:2]", mult=1, bond_order=5 / 4)
+
+    assert PotentialKey.parse_raw(key.json()) == key
+
+    with pytest.raises(ValidationError):
+        VirtualSiteKey.parse_obj(
+            {"atom_indices": (0, 1), "type": "BondCharge", "match": "foo"}
+        )